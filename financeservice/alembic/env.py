@@ -0,0 +1,55 @@
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+
+from app.foundation.infra.database.base import Base
+from app.foundation.infra.database.database import DATABASE_URL, engine
+
+# 메타데이터에 테이블을 등록하기 위해 엔티티를 임포트
+from app.domain.model.entity import (  # noqa: F401
+    account_entity,
+    company_entity,
+    financial_entity,
+    metric_entity,
+    report_entity,
+    statement_entity
+)
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """DB에 접속하지 않고 SQL 스크립트를 출력합니다."""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"}
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """애플리케이션과 같은 비동기 엔진으로 마이그레이션을 실행합니다."""
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,110 @@
+"""초기 스키마와 주요 조회 경로 인덱스
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+기존에 create_all로 만들어진 DB에도 적용할 수 있도록 IF NOT EXISTS로 작성합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("companies", "statement", "reports", "financials", "metrics")
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS companies (
+            corp_code VARCHAR(20) PRIMARY KEY,
+            corp_name VARCHAR(100) NOT NULL,
+            stock_code VARCHAR(20),
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS statement (
+            sj_div VARCHAR(10) PRIMARY KEY,
+            sj_nm VARCHAR(100) NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS reports (
+            rcept_no VARCHAR(20) PRIMARY KEY,
+            reprt_code VARCHAR(20) NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS financials (
+            id SERIAL PRIMARY KEY,
+            corp_code VARCHAR(20) NOT NULL REFERENCES companies (corp_code),
+            bsns_year VARCHAR(4) NOT NULL,
+            sj_div VARCHAR(10) NOT NULL REFERENCES statement (sj_div),
+            account_nm VARCHAR(100) NOT NULL,
+            thstrm_nm VARCHAR(20),
+            thstrm_amount NUMERIC,
+            frmtrm_nm VARCHAR(20),
+            frmtrm_amount NUMERIC,
+            bfefrmtrm_nm VARCHAR(20),
+            bfefrmtrm_amount NUMERIC,
+            ord INTEGER,
+            currency VARCHAR(10),
+            rcept_no VARCHAR(20) REFERENCES reports (rcept_no),
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS metrics (
+            id SERIAL PRIMARY KEY,
+            corp_code VARCHAR(20) NOT NULL REFERENCES companies (corp_code),
+            bsns_year VARCHAR(4) NOT NULL,
+            metric_name VARCHAR(50) NOT NULL,
+            metric_value NUMERIC,
+            metric_unit VARCHAR(10),
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """)
+    # create_all로 만들어진 테이블은 updated_at 기본값이 없음
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN updated_at SET DEFAULT now()")
+
+    # 회사명 조회 (corp_name = :name, corp_name = ANY(:names))
+    op.execute("CREATE INDEX IF NOT EXISTS ix_companies_corp_name ON companies (corp_name)")
+
+    # 재무제표 upsert의 ON CONFLICT 대상이자 (corp_code, bsns_year[, sj_div]) 조회용 인덱스.
+    # 비율 계산에 쓰는 금액과 정렬 순서를 포함하여 index-only scan이 가능하도록 함
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_financials_corp_year_sj_account
+        ON financials (corp_code, bsns_year, sj_div, account_nm)
+        INCLUDE (thstrm_amount, frmtrm_amount, bfefrmtrm_amount, ord)
+    """)
+    # 공시 접수번호 기반 무효화 (corp_code, rcept_no)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_financials_corp_rcept_no ON financials (corp_code, rcept_no)")
+
+    # 재무지표 upsert의 ON CONFLICT 대상이자 지표 스냅샷 조회용 인덱스
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_metrics_corp_year_name
+        ON metrics (corp_code, bsns_year, metric_name)
+        INCLUDE (metric_value)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_metrics_corp_year_name")
+    op.execute("DROP INDEX IF EXISTS ix_financials_corp_rcept_no")
+    op.execute("DROP INDEX IF EXISTS uq_financials_corp_year_sj_account")
+    op.execute("DROP INDEX IF EXISTS ix_companies_corp_name")
+    for table in reversed(TABLES):
+        op.execute(f"DROP TABLE IF EXISTS {table}")
@@ -0,0 +1,131 @@
+"""financials, metrics 테이블을 사업연도(bsns_year)별 LIST 파티션으로 전환
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+파티션 테이블의 기본 키와 고유 인덱스에는 파티션 키가 포함되어야 하므로 기본 키를 (id, bsns_year)로 바꿉니다.
+기존 데이터에 있는 연도의 파티션을 만든 뒤 데이터를 옮기며, 이후 새 연도 파티션은
+애플리케이션이 저장 전에 만듭니다 (app/foundation/infra/database/partitions.py).
+"""
+from typing import Dict, Sequence, Union
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS: Dict[str, str] = {
+    "financials": """
+        corp_code VARCHAR(20) NOT NULL REFERENCES companies (corp_code),
+        bsns_year VARCHAR(4) NOT NULL,
+        sj_div VARCHAR(10) NOT NULL REFERENCES statement (sj_div),
+        account_nm VARCHAR(100) NOT NULL,
+        thstrm_nm VARCHAR(20),
+        thstrm_amount NUMERIC,
+        frmtrm_nm VARCHAR(20),
+        frmtrm_amount NUMERIC,
+        bfefrmtrm_nm VARCHAR(20),
+        bfefrmtrm_amount NUMERIC,
+        ord INTEGER,
+        currency VARCHAR(10),
+        rcept_no VARCHAR(20) REFERENCES reports (rcept_no),
+        created_at TIMESTAMP NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP NOT NULL DEFAULT now()
+    """,
+    "metrics": """
+        corp_code VARCHAR(20) NOT NULL REFERENCES companies (corp_code),
+        bsns_year VARCHAR(4) NOT NULL,
+        metric_name VARCHAR(50) NOT NULL,
+        metric_value NUMERIC,
+        metric_unit VARCHAR(10),
+        created_at TIMESTAMP NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP NOT NULL DEFAULT now()
+    """
+}
+
+COLUMN_NAMES: Dict[str, str] = {
+    "financials": (
+        "id, corp_code, bsns_year, sj_div, account_nm, thstrm_nm, thstrm_amount, frmtrm_nm, frmtrm_amount, "
+        "bfefrmtrm_nm, bfefrmtrm_amount, ord, currency, rcept_no, created_at, updated_at"
+    ),
+    "metrics": "id, corp_code, bsns_year, metric_name, metric_value, metric_unit, created_at, updated_at"
+}
+
+# 부모 테이블에 만든 인덱스는 각 파티션에 자동으로 생성됨
+INDEXES: Dict[str, Dict[str, str]] = {
+    "financials": {
+        "uq_financials_corp_year_sj_account": """
+            CREATE UNIQUE INDEX uq_financials_corp_year_sj_account
+            ON financials (corp_code, bsns_year, sj_div, account_nm)
+            INCLUDE (thstrm_amount, frmtrm_amount, bfefrmtrm_amount, ord)
+        """,
+        "ix_financials_corp_rcept_no": "CREATE INDEX ix_financials_corp_rcept_no ON financials (corp_code, rcept_no)"
+    },
+    "metrics": {
+        "uq_metrics_corp_year_name": """
+            CREATE UNIQUE INDEX uq_metrics_corp_year_name
+            ON metrics (corp_code, bsns_year, metric_name)
+            INCLUDE (metric_value)
+        """
+    }
+}
+
+
+def _swap_table(table: str, partitioned: bool) -> None:
+    """기존 테이블을 옮겨 두고 같은 이름의 새 테이블(파티션 여부 지정)로 데이터를 복사합니다."""
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    # 기본 키/인덱스 이름은 스키마 전체에서 고유해야 하므로 먼저 제거
+    op.execute(f"ALTER TABLE {old} DROP CONSTRAINT IF EXISTS {table}_pkey")
+    for index_name in INDEXES[table]:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    # id 시퀀스는 기존 테이블과 함께 삭제되지 않도록 소유 관계를 끊고 새 테이블로 옮김
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+
+    if partitioned:
+        op.execute(f"""
+            CREATE TABLE {table} (
+                id INTEGER NOT NULL DEFAULT nextval('{table}_id_seq'),
+                {COLUMNS[table]},
+                PRIMARY KEY (id, bsns_year)
+            ) PARTITION BY LIST (bsns_year)
+        """)
+        op.execute(f"""
+            DO $$
+            DECLARE
+                year text;
+            BEGIN
+                FOR year IN SELECT DISTINCT bsns_year FROM {old} LOOP
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF {table} FOR VALUES IN (%L)',
+                        '{table}_' || year, year
+                    );
+                END LOOP;
+            END $$
+        """)
+    else:
+        op.execute(f"""
+            CREATE TABLE {table} (
+                id INTEGER NOT NULL DEFAULT nextval('{table}_id_seq') PRIMARY KEY,
+                {COLUMNS[table]}
+            )
+        """)
+
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.execute(f"INSERT INTO {table} ({COLUMN_NAMES[table]}) SELECT {COLUMN_NAMES[table]} FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    for index_sql in INDEXES[table].values():
+        op.execute(index_sql)
+
+
+def upgrade() -> None:
+    for table in ("financials", "metrics"):
+        _swap_table(table, partitioned=True)
+
+
+def downgrade() -> None:
+    for table in ("financials", "metrics"):
+        _swap_table(table, partitioned=False)
@@ -0,0 +1,91 @@
+"""재무제표 저장 형식 압축: 금액 BIGINT, 계정명 사전(accounts) 인코딩
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+financials 행마다 반복되던 계정명을 accounts 테이블의 정수 키로 바꾸고,
+원 단위 정수인 금액을 NUMERIC 대신 BIGINT로 저장합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AMOUNT_COLUMNS = ("thstrm_amount", "frmtrm_amount", "bfefrmtrm_amount")
+
+# 재무비율 계산에 쓰는 계정을 DART 표준 계정 ID와 함께 먼저 등록하여 작은 키를 부여
+SEED_ACCOUNTS = (
+    ("자산총계", "ifrs-full_Assets"),
+    ("부채총계", "ifrs-full_Liabilities"),
+    ("유동자산", "ifrs-full_CurrentAssets"),
+    ("유동부채", "ifrs-full_CurrentLiabilities"),
+    ("자본총계", "ifrs-full_Equity"),
+    ("매출액", "ifrs-full_Revenue"),
+    ("영업이익", "dart_OperatingIncomeLoss"),
+    ("당기순이익", "ifrs-full_ProfitLoss")
+)
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE accounts (
+            account_key SERIAL PRIMARY KEY,
+            account_nm VARCHAR(100) NOT NULL,
+            account_id VARCHAR(100),
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            CONSTRAINT uq_accounts_account_nm UNIQUE (account_nm)
+        )
+    """)
+    values = ", ".join(f"('{account_nm}', '{account_id}')" for account_nm, account_id in SEED_ACCOUNTS)
+    op.execute(f"INSERT INTO accounts (account_nm, account_id) VALUES {values}")
+    op.execute("""
+        INSERT INTO accounts (account_nm)
+        SELECT DISTINCT account_nm FROM financials
+        ON CONFLICT (account_nm) DO NOTHING
+    """)
+
+    # 고유 인덱스가 계정명과 금액을 포함하므로 먼저 제거하고 새 형식으로 다시 만듦
+    op.execute("DROP INDEX IF EXISTS uq_financials_corp_year_sj_account")
+    op.execute("ALTER TABLE financials ADD COLUMN account_key INTEGER REFERENCES accounts (account_key)")
+    op.execute("""
+        UPDATE financials f
+        SET account_key = a.account_key
+        FROM accounts a
+        WHERE a.account_nm = f.account_nm
+    """)
+    op.execute("ALTER TABLE financials ALTER COLUMN account_key SET NOT NULL")
+    op.execute("ALTER TABLE financials DROP COLUMN account_nm")
+    for column in AMOUNT_COLUMNS:
+        op.execute(f"ALTER TABLE financials ALTER COLUMN {column} TYPE BIGINT USING round({column})::bigint")
+
+    op.execute("""
+        CREATE UNIQUE INDEX uq_financials_corp_year_sj_account
+        ON financials (corp_code, bsns_year, sj_div, account_key)
+        INCLUDE (thstrm_amount, frmtrm_amount, bfefrmtrm_amount, ord)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_financials_corp_year_sj_account")
+    op.execute("ALTER TABLE financials ADD COLUMN account_nm VARCHAR(100)")
+    op.execute("""
+        UPDATE financials f
+        SET account_nm = a.account_nm
+        FROM accounts a
+        WHERE a.account_key = f.account_key
+    """)
+    op.execute("ALTER TABLE financials ALTER COLUMN account_nm SET NOT NULL")
+    op.execute("ALTER TABLE financials DROP COLUMN account_key")
+    for column in AMOUNT_COLUMNS:
+        op.execute(f"ALTER TABLE financials ALTER COLUMN {column} TYPE NUMERIC")
+    op.execute("""
+        CREATE UNIQUE INDEX uq_financials_corp_year_sj_account
+        ON financials (corp_code, bsns_year, sj_div, account_nm)
+        INCLUDE (thstrm_amount, frmtrm_amount, bfefrmtrm_amount, ord)
+    """)
+    op.execute("DROP TABLE accounts")
@@ -1,20 +1,46 @@
-from fastapi import APIRouter, Depends
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.logger import logger
 
 from app.domain.controller.fin_controller import FinController
-from app.foundation.infra.database.database import get_db_session
+from app.foundation.core.container import Container, get_container
+from app.domain.service.disclosure_poller import disclosure_poller
+from app.domain.service.financials_freshness import financials_freshness
+from app.domain.service.prefetch_scheduler import prefetch_scheduler
+from app.domain.service.write_behind_queue import write_behind_queue
+from app.foundation.infra.database.database import get_db_session, get_read_session, pool_stats
+from app.foundation.infra.database.ingestion_lock import ingestion_single_flight
+from app.foundation.infra.cache.response_cache import response_cache
+from app.foundation.infra.dart.corp_code_index import corp_code_index
+from app.foundation.infra.dart.http_client import dart_http_client
+from app.foundation.infra.dart.rate_limiter import dart_scheduler
+from app.foundation.infra.jobs.job_queue import job_queue
 from app.domain.model.schema.schema import (
+    BatchFinancialMetricsResponse,
+    BatchFinancialRequest,
+    BulkIngestRequest,
     CompanyNameRequest,
-    FinancialMetricsResponse
+    FinancialMetricsResponse,
+    JobAcceptedResponse,
+    JobStatusResponse
 )
 
 router = APIRouter()
 
-@router.post("/financial", summary="회사명으로 재무제표 조회 (최근 3개년)", response_model=FinancialMetricsResponse)
+@router.post(
+    "/financial",
+    summary="회사명으로 재무제표 조회 (최근 3개년)",
+    response_model=FinancialMetricsResponse,
+    responses={202: {"model": JobAcceptedResponse, "description": "데이터가 없어 적재 작업이 등록됨"}}
+)
 async def get_financial_by_name(
     payload: CompanyNameRequest,
-    db: AsyncSession = Depends(get_db_session)
+    wait: bool = Query(False, description="true이면 데이터가 없어도 적재가 끝날 때까지 기다려 결과를 반환"),
+    db: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container)
 ):
     """
     회사명으로 재무제표를 조회합니다.
@@ -22,7 +48,115 @@ async def get_financial_by_name(
     - 재무지표: 영업이익률, 순이익률, ROE, ROA
     - 성장성: 매출액 성장률, 순이익 성장률
     - 안정성: 부채비율, 유동비율
+    - DB에 데이터가 없는 회사는 202와 작업 ID를 반환하며, /jobs/{job_id}에서 결과를 조회합니다.
     """
     logger.info(f"🕞🕞🕞🕞🕞🕞get_financial_by_name 호출 - 회사명: {payload.company_name}")
-    controller = FinController(db)
-    return await controller.get_financial(company_name=payload.company_name)
\ No newline at end of file
+    controller = FinController(db, container)
+    return await controller.get_financial(company_name=payload.company_name, wait=wait)
+
+@router.get("/jobs/{job_id}", summary="재무제표 적재 작업 상태 및 결과 조회", response_model=JobStatusResponse)
+async def get_job_status(
+    job_id: str,
+    db: AsyncSession = Depends(get_read_session),
+    container: Container = Depends(get_container)
+):
+    """
+    적재 작업의 상태(queued/running/succeeded/failed), 진행 단계, 결과를 반환합니다.
+    """
+    controller = FinController(db, container)
+    return controller.get_job(job_id)
+
+@router.get("/jobs/{job_id}/events", summary="재무제표 적재 작업 진행 단계 스트림 (SSE)")
+async def stream_job_events(job_id: str):
+    """
+    적재 작업의 진행 단계를 server-sent events로 전송합니다.
+    - 지난 단계를 먼저 보내고, 작업이 끝나면 done 이벤트 후 스트림을 종료합니다.
+    """
+    if job_queue.get(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"작업 '{job_id}'을 찾을 수 없습니다.")
+
+    async def event_stream():
+        async for event in job_queue.events(job_id):
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/financial/batch", summary="여러 회사의 재무지표 일괄 조회 (최근 3개년)", response_model=BatchFinancialMetricsResponse)
+async def get_financial_batch(
+    payload: BatchFinancialRequest,
+    db: AsyncSession = Depends(get_read_session),
+    container: Container = Depends(get_container)
+):
+    """
+    회사명 또는 기업 고유번호 목록으로 재무지표를 일괄 조회합니다.
+    - DB에 적재된 회사는 한 번의 쿼리로 조회하고, 나머지만 DART에서 조회합니다.
+    - 회사별 결과에 status/error가 포함되어 일부 실패가 전체 요청을 실패시키지 않습니다.
+    - 요청 세션은 조회만 하므로 읽기 전용 세션(복제본)을 사용하고, DART 조회 후 저장은 항목별 독립 세션에서 수행합니다.
+    """
+    logger.info(f"get_financial_batch 호출 - 회사명 {len(payload.company_names)}건, 고유번호 {len(payload.corp_codes)}건")
+    controller = FinController(db, container)
+    return await controller.get_financial_batch(
+        company_names=payload.company_names,
+        corp_codes=payload.corp_codes
+    )
+
+@router.post(
+    "/ingest/bulk",
+    summary="다중회사 재무제표 일괄 적재",
+    responses={202: {"model": JobAcceptedResponse, "description": "전체 상장사 적재 작업이 등록됨"}}
+)
+async def bulk_ingest_financials(
+    payload: BulkIngestRequest,
+    db: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container)
+):
+    """
+    DART 다중회사 주요계정 API로 여러 회사의 재무제표를 한 번에 적재합니다.
+    - 호출당 최대 100개사를 묶어 요청합니다.
+    - listed_universe=true이면 전체 상장사를 대상으로 하며, 작업 큐에서 실행하고 202와 작업 ID를 반환합니다.
+    - 회사별 저장 실패는 결과의 failed에 기록되고 나머지 회사는 계속 저장됩니다.
+    """
+    logger.info(f"bulk_ingest_financials 호출 - {len(payload.corp_codes)}개사, 전체 상장사: {payload.listed_universe}")
+    controller = FinController(db, container)
+    return await controller.bulk_ingest(
+        corp_codes=payload.corp_codes,
+        listed_universe=payload.listed_universe,
+        year=payload.year
+    )
+
+@router.get("/stats", summary="재무 서비스 내부 리소스 사용 현황")
+async def get_service_stats():
+    """
+    운영 지표를 반환합니다.
+    - dart_http_pool: DART API 커넥션 풀 사용 현황
+    - corp_code_index: 기업 고유번호 인덱스 크기
+    - dart_scheduler: DART 호출 대기열 깊이, 대기 시간, 잔여 일일 예산
+    - response_cache: 응답 캐시 적중률(L1/L2), 요청 병합 및 조기 갱신 횟수
+    - disclosure_poller: 공시 목록 커서, 감지된 정기보고서 수, 갱신 대기열 상태
+    - prefetch: 접근 빈도 상위 회사와 사전 적재 횟수
+    - jobs: 적재 작업 대기열 깊이와 처리 현황
+    - write_behind: 지연 저장 대기열 깊이, 재시도 및 스필 파일 기록 횟수
+    - ingestion: 회사별 적재 단일 실행 현황 (결과 공유, 작업자 간 잠금 대기 횟수)
+    - freshness: 저장된 재무제표 신선도 판정 횟수, 백그라운드/대기 갱신 및 갱신 실패 횟수
+    - db_pool: 엔진(주 DB/복제본)별 연결 풀 크기, 사용 중인 연결 수, 최대 동시 사용 수, 사용률
+    """
+    return {
+        "dart_http_pool": dart_http_client.stats(),
+        "dart_scheduler": dart_scheduler.stats(),
+        "corp_code_index": corp_code_index.stats(),
+        "response_cache": response_cache.stats(),
+        "disclosure_poller": disclosure_poller.stats(),
+        "prefetch": prefetch_scheduler.stats(),
+        "jobs": job_queue.stats(),
+        "write_behind": write_behind_queue.stats(),
+        "ingestion": ingestion_single_flight.stats(),
+        "freshness": financials_freshness.stats(),
+        "db_pool": pool_stats()
+    }
@@ -1,10 +1,18 @@
 from fastapi import HTTPException, Query
-from app.domain.service.fin_service import FinService
+from fastapi.responses import JSONResponse
+from app.foundation.core.container import Container
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
-from typing import Optional
+from typing import Any, Awaitable, Callable, List, Optional, Union
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.dart.rate_limiter import DartQuotaExceededError, DartRateLimitError
+from app.foundation.infra.database.ingestion_lock import IngestionLockTimeoutError
+from app.foundation.infra.jobs.job_queue import JobQueueFullError, job_queue
 from app.domain.model.schema.schema import (
+    BatchFinancialMetricsResponse,
     FinancialMetricsResponse,
+    JobAcceptedResponse,
+    JobStatusResponse,
     FinancialMetrics,
     GrowthData,
     DebtLiquidityData
@@ -18,21 +26,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class FinController:
-    def __init__(self, db_session: AsyncSession):
-        logger.info("FinController가 초기화되었습니다.")
+    def __init__(self, db_session: AsyncSession, container: Container):
         self.db_session = db_session
-        self.service = FinService(db_session)
+        self.service = container.fin_service(db_session)
 
     async def get_financial(
         self, 
         company_name: str = Query(..., description="회사명"),
-        year: Optional[int] = Query(None, description="조회할 연도. 지정하지 않으면 직전 연도의 데이터를 조회")
-    ) -> FinancialMetricsResponse:
+        year: Optional[int] = Query(None, description="조회할 연도. 지정하지 않으면 직전 연도의 데이터를 조회"),
+        wait: bool = False
+    ) -> Union[FinancialMetricsResponse, JSONResponse]:
         """회사명으로 재무제표를 조회합니다.
         
+        DB와 캐시에 데이터가 없는 회사는 wait=False이면 적재 작업을 등록하고 202 응답을 반환합니다.
+        
         Args:
             company_name: 회사명
             year: 조회할 연도. None이면 직전 연도의 데이터를 조회
+            wait: True이면 데이터가 없어도 적재가 끝날 때까지 기다려 결과를 반환
         """
         logger.info(f"재무제표 조회 요청 - 회사: {company_name}, 연도: {year}")
         try:
@@ -41,9 +52,19 @@ class FinController:
             if year and isinstance(year, int):
                 actual_year = year
             
+            # 데이터가 없는 회사는 비동기 적재 작업으로 처리
+            if not wait:
+                company_info = await self.service.get_company_info(company_name)
+                if await self.service.is_cold(company_info.corp_code):
+                    return self._accept_job(company_info.corp_code, company_name)
+            
             # 재무 지표 조회 - 직접 metrics 조회
             return await self.service.get_financial_metrics(company_name)
             
+        except HTTPException:
+            raise
+        except (DartRateLimitError, DartQuotaExceededError, IngestionLockTimeoutError) as e:
+            raise self._throttled(e)
         except ValueError as e:
             error_message = str(e)
             logger.error(f"회사명 관련 오류: {error_message}")
@@ -53,6 +74,102 @@ class FinController:
             logger.error(f"기타 오류: {error_message}")
             raise HTTPException(status_code=500, detail=error_message)
 
+    @staticmethod
+    def _throttled(e: Exception) -> HTTPException:
+        """DART 요청 제한은 429, 일일 호출 한도 초과와 적재 잠금 대기 시간 초과는 503으로 Retry-After와 함께 응답합니다."""
+        status_code = 429 if isinstance(e, DartRateLimitError) else 503
+        logger.warning(f"일시적인 제한으로 요청을 처리하지 못했습니다 ({status_code}): {str(e)}")
+        return HTTPException(status_code=status_code, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+    def _accept_job(self, corp_code: str, company_name: str) -> JSONResponse:
+        """재무 지표 적재 작업을 등록하고 202 응답을 만듭니다. 같은 회사의 작업이 진행 중이면 그 작업을 반환합니다."""
+        return self._submit_job(
+            key=corp_code,
+            run=lambda: self.service.run_financial_metrics_job(company_name),
+            description=f"{company_name} 재무 지표 적재"
+        )
+
+    def _submit_job(self, key: str, run: Callable[[], Awaitable[Any]], description: str) -> JSONResponse:
+        """작업을 등록하고 작업 상태 URL을 담은 202 응답을 만듭니다. 같은 키의 작업이 진행 중이면 그 작업을 반환합니다."""
+        try:
+            job = job_queue.submit(key=key, run=run, description=description)
+        except JobQueueFullError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        logger.info(f"적재 작업 접수 - {description}, 작업: {job.id}")
+        accepted = JobAcceptedResponse(
+            job_id=job.id,
+            status=job.status,
+            status_url=f"/e/fin/jobs/{job.id}",
+            events_url=f"/e/fin/jobs/{job.id}/events"
+        )
+        return JSONResponse(
+            status_code=202,
+            content=accepted.model_dump(),
+            headers={"Location": accepted.status_url}
+        )
+
+    def get_job(self, job_id: str) -> JobStatusResponse:
+        """적재 작업의 상태와 결과를 조회합니다."""
+        job = job_queue.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"작업 '{job_id}'을 찾을 수 없습니다.")
+        return JobStatusResponse(**job.to_dict())
+
+    async def get_financial_batch(
+        self,
+        company_names: List[str],
+        corp_codes: List[str]
+    ) -> BatchFinancialMetricsResponse:
+        """여러 회사의 재무지표를 일괄 조회합니다.
+        
+        Args:
+            company_names: 회사명 목록
+            corp_codes: 기업 고유번호 목록
+        """
+        total = len(company_names) + len(corp_codes)
+        logger.info(f"재무제표 일괄 조회 요청 - {total}건")
+        if total == 0:
+            raise HTTPException(status_code=400, detail="회사명 또는 기업 고유번호를 하나 이상 입력해야 합니다.")
+        if total > settings.FIN_BATCH_MAX_ITEMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 조회할 수 있는 회사는 최대 {settings.FIN_BATCH_MAX_ITEMS}개입니다."
+            )
+        try:
+            results = await self.service.get_financial_metrics_batch(company_names, corp_codes)
+            return BatchFinancialMetricsResponse(results=results)
+        except (DartRateLimitError, DartQuotaExceededError, IngestionLockTimeoutError) as e:
+            raise self._throttled(e)
+        except Exception as e:
+            error_message = str(e)
+            logger.error(f"일괄 조회 오류: {error_message}")
+            raise HTTPException(status_code=500, detail=error_message)
+
+    async def bulk_ingest(
+        self,
+        corp_codes: List[str],
+        listed_universe: bool = False,
+        year: Optional[int] = None
+    ):
+        """여러 회사의 재무제표를 다중회사 API로 일괄 적재합니다."""
+        logger.info(f"재무제표 일괄 적재 요청 - {len(corp_codes)}개사, 전체 상장사: {listed_universe}")
+        if not corp_codes and not listed_universe:
+            raise HTTPException(status_code=400, detail="기업 고유번호를 하나 이상 입력하거나 listed_universe를 지정해야 합니다.")
+        if listed_universe:
+            # 전체 상장사 적재는 요청 안에서 끝나지 않으므로 작업 큐에서 실행하고 202를 반환
+            return self._submit_job(
+                key=f"bulk:listed:{year or 'latest'}",
+                run=lambda: self.service.run_bulk_ingest_job(corp_codes, listed_universe, year),
+                description=f"전체 상장사 재무제표 일괄 적재 (연도: {year or '직전 연도'})"
+            )
+        try:
+            result = await self.service.bulk_ingest_financial_data(corp_codes, listed_universe, year)
+        except (DartRateLimitError, DartQuotaExceededError, IngestionLockTimeoutError) as e:
+            raise self._throttled(e)
+        if result["status"] == "error":
+            raise HTTPException(status_code=500, detail=result["message"])
+        return result
+
     async def get_financial_ratios(
         self, 
         company_name: str = Query(..., description="회사명"),
@@ -67,6 +184,8 @@ class FinController:
         logger.info(f"재무비율 조회 요청 - 회사: {company_name}, 연도: {year}")
         try:
             return await self.service.get_financial_ratios(company_name, year)
+        except (DartRateLimitError, DartQuotaExceededError, IngestionLockTimeoutError) as e:
+            raise self._throttled(e)
         except ValueError as e:
             error_message = str(e)
             logger.error(f"회사명 관련 오류: {error_message}")
@@ -0,0 +1,11 @@
+from sqlalchemy import TIMESTAMP, Column, Integer, String, func
+from app.foundation.infra.database.base import Base
+
+class AccountEntity(Base):
+    __tablename__ = "accounts"
+
+    account_key = Column(Integer, primary_key=True, autoincrement=True, doc="계정 키 (financials.account_key)")
+    account_nm = Column(String(100), nullable=False, unique=True, doc="계정명 (예: 자산총계, 매출액 등)")
+    account_id = Column(String(100), nullable=True, doc="DART 표준 계정 ID (예: ifrs-full_Revenue)")
+    
+    created_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="생성 날짜")
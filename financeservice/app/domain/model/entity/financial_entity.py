@@ -1,29 +1,41 @@
-from sqlalchemy import TIMESTAMP, Column, Integer, String, Numeric, ForeignKey, func
+from sqlalchemy import TIMESTAMP, BigInteger, Column, Index, Integer, String, ForeignKey, func
 from sqlalchemy.orm import relationship
 from app.foundation.infra.database.base import Base
 
 class FinancialEntity(Base):
     __tablename__ = "financials"
+    __table_args__ = (
+        Index(
+            "uq_financials_corp_year_sj_account",
+            "corp_code", "bsns_year", "sj_div", "account_key",
+            unique=True,
+            postgresql_include=["thstrm_amount", "frmtrm_amount", "bfefrmtrm_amount", "ord"]
+        ),
+        Index("ix_financials_corp_rcept_no", "corp_code", "rcept_no"),
+        # 사업연도별 LIST 파티션 (연도 파티션은 시작 시 partitions.precreate_year_partitions에서 미리 생성)
+        {"postgresql_partition_by": "LIST (bsns_year)"},
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, doc="자동 증가하는 고유 식별자")
     corp_code = Column(String(20), ForeignKey("companies.corp_code"), nullable=False, doc="기업 코드")
-    bsns_year = Column(String(4), nullable=False, doc="사업연도")
+    bsns_year = Column(String(4), primary_key=True, doc="사업연도 (파티션 키)")
     sj_div = Column(String(10), ForeignKey("statement.sj_div"), nullable=False, doc="재무제표 구분")
-    account_nm = Column(String(100), nullable=False, doc="계정명 (예: 자산총계, 매출액 등)")
+    account_key = Column(Integer, ForeignKey("accounts.account_key"), nullable=False, doc="계정 키 (accounts 사전)")
     thstrm_nm = Column(String(20), nullable=True, doc="당기명")
-    thstrm_amount = Column(Numeric, nullable=True, doc="당기금액")
+    thstrm_amount = Column(BigInteger, nullable=True, doc="당기금액 (원)")
     frmtrm_nm = Column(String(20), nullable=True, doc="전기명")
-    frmtrm_amount = Column(Numeric, nullable=True, doc="전기금액")
+    frmtrm_amount = Column(BigInteger, nullable=True, doc="전기금액 (원)")
     bfefrmtrm_nm = Column(String(20), nullable=True, doc="전전기명")
-    bfefrmtrm_amount = Column(Numeric, nullable=True, doc="전전기금액")
+    bfefrmtrm_amount = Column(BigInteger, nullable=True, doc="전전기금액 (원)")
     ord = Column(Integer, nullable=True, doc="정렬 순서")
     currency = Column(String(10), nullable=True, doc="통화 단위")
     rcept_no = Column(String(20), ForeignKey("reports.rcept_no"), nullable=True, doc="접수번호")
     
     created_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="생성 날짜")
-    updated_at = Column(TIMESTAMP, nullable=False, doc="수정 날짜")
+    updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="수정 날짜")
 
     # Relationships
     company = relationship("CompanyEntity")
     statement = relationship("StatementEntity")
-    report = relationship("ReportEntity") 
\ No newline at end of file
+    report = relationship("ReportEntity")
+    account = relationship("AccountEntity") 
\ No newline at end of file
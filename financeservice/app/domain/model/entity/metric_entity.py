@@ -1,28 +1,29 @@
-from sqlalchemy import TIMESTAMP, Column, Integer, String, Numeric, ForeignKey, func
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import TIMESTAMP, Column, Index, Integer, String, Numeric, ForeignKey, func
 from sqlalchemy.orm import relationship
-
-Base = declarative_base()
+from app.foundation.infra.database.base import Base
 
 class MetricEntity(Base):
     __tablename__ = "metrics"
+    __table_args__ = (
+        Index(
+            "uq_metrics_corp_year_name",
+            "corp_code", "bsns_year", "metric_name",
+            unique=True,
+            postgresql_include=["metric_value"]
+        ),
+        # 사업연도별 LIST 파티션 (연도 파티션은 시작 시 partitions.precreate_year_partitions에서 미리 생성)
+        {"postgresql_partition_by": "LIST (bsns_year)"},
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, doc="자동 증가하는 고유 식별자")
     corp_code = Column(String(20), ForeignKey("companies.corp_code"), nullable=False, doc="기업 코드")
-    bsns_year = Column(String(4), nullable=False, doc="사업연도")
-    debt_ratio = Column(Numeric, nullable=True, doc="부채비율")
-    current_ratio = Column(Numeric, nullable=True, doc="유동비율")
-    operating_profit_ratio = Column(Numeric, nullable=True, doc="영업이익률")
-    net_profit_ratio = Column(Numeric, nullable=True, doc="순이익률")
-    roe = Column(Numeric, nullable=True, doc="자기자본이익률")
-    roa = Column(Numeric, nullable=True, doc="총자산이익률")
-    debt_dependency = Column(Numeric, nullable=True, doc="부채의존도")
-    sales_growth = Column(Numeric, nullable=True, doc="매출성장률")
-    operating_profit_growth = Column(Numeric, nullable=True, doc="영업이익성장률")
-    eps_growth = Column(Numeric, nullable=True, doc="주당순이익성장률")
+    bsns_year = Column(String(4), primary_key=True, doc="사업연도 (파티션 키)")
+    metric_name = Column(String(50), nullable=False, doc="지표명 (예: debt_ratio, roe 등)")
+    metric_value = Column(Numeric, nullable=True, doc="지표값 (계산할 수 없는 경우 NULL)")
+    metric_unit = Column(String(10), nullable=True, doc="지표 단위")
     
     created_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="생성 날짜")
-    updated_at = Column(TIMESTAMP, nullable=False, doc="수정 날짜")
+    updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="수정 날짜")
 
     # Relationship
-    company = relationship("CompanyEntity") 
\ No newline at end of file
+    company = relationship("CompanyEntity")
@@ -8,4 +8,4 @@ class ReportEntity(Base):
     reprt_code = Column(String(20), nullable=False, doc="보고서 코드")
     
     created_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="생성 날짜")
-    updated_at = Column(TIMESTAMP, nullable=False, doc="수정 날짜") 
\ No newline at end of file
+    updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="수정 날짜") 
\ No newline at end of file
@@ -8,4 +8,4 @@ class StatementEntity(Base):
     sj_nm = Column(String(100), nullable=False, doc="재무제표 구분명")
     
     created_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="생성 날짜")
-    updated_at = Column(TIMESTAMP, nullable=False, doc="수정 날짜") 
\ No newline at end of file
+    updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="수정 날짜") 
\ No newline at end of file
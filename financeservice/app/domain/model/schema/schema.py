@@ -1,5 +1,5 @@
 from pydantic import Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 from app.foundation.infra.database.base_schema import BaseSchema
 
@@ -30,10 +30,10 @@ class CompanyNameRequest(BaseSchema):
 
 class FinancialMetrics(BaseSchema):
     """재무 지표 데이터"""
-    operatingMargin: List[float] = Field(..., description="영업이익률")
-    netMargin: List[float] = Field(..., description="순이익률")
-    roe: List[float] = Field(..., description="자기자본이익률")
-    roa: List[float] = Field(..., description="총자산이익률")
+    operatingMargin: List[Optional[float]] = Field(..., description="영업이익률 (정의되지 않으면 null)")
+    netMargin: List[Optional[float]] = Field(..., description="순이익률 (정의되지 않으면 null)")
+    roe: List[Optional[float]] = Field(..., description="자기자본이익률 (정의되지 않으면 null)")
+    roa: List[Optional[float]] = Field(..., description="총자산이익률 (정의되지 않으면 null)")
     years: List[str] = Field(..., description="연도 목록 (최근 3개년)")
 
     model_config = {
@@ -42,8 +42,8 @@ class FinancialMetrics(BaseSchema):
 
 class GrowthData(BaseSchema):
     """성장성 데이터"""
-    revenueGrowth: List[float] = Field(..., description="매출액 성장률")
-    netIncomeGrowth: List[float] = Field(..., description="순이익 성장률")
+    revenueGrowth: List[Optional[float]] = Field(..., description="매출액 성장률 (정의되지 않으면 null)")
+    netIncomeGrowth: List[Optional[float]] = Field(..., description="순이익 성장률 (정의되지 않으면 null)")
     years: List[str] = Field(..., description="연도 목록 (최근 3개년)")
 
     model_config = {
@@ -52,8 +52,8 @@ class GrowthData(BaseSchema):
 
 class DebtLiquidityData(BaseSchema):
     """부채 및 유동성 데이터"""
-    debtRatio: List[float] = Field(..., description="부채비율")
-    currentRatio: List[float] = Field(..., description="유동비율")
+    debtRatio: List[Optional[float]] = Field(..., description="부채비율 (정의되지 않으면 null)")
+    currentRatio: List[Optional[float]] = Field(..., description="유동비율 (정의되지 않으면 null)")
     years: List[str] = Field(..., description="연도 목록 (최근 3개년)")
 
     model_config = {
@@ -69,4 +69,73 @@ class FinancialMetricsResponse(BaseSchema):
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class BatchFinancialRequest(BaseSchema):
+    """여러 회사의 재무지표 일괄 조회 요청"""
+    company_names: List[str] = Field(default_factory=list, description="회사명 목록")
+    corp_codes: List[str] = Field(default_factory=list, description="기업 고유번호 목록")
+
+    model_config = {
+        "from_attributes": True
+    }
+
+class BatchFinancialItem(BaseSchema):
+    """일괄 조회 결과 (회사별)"""
+    query: str = Field(..., description="요청한 회사명 또는 기업 고유번호")
+    corp_code: Optional[str] = Field(None, description="기업 고유번호")
+    status: str = Field(..., description="처리 결과 (success/error)")
+    data: Optional[FinancialMetricsResponse] = Field(None, description="재무지표 데이터")
+    error: Optional[str] = Field(None, description="오류 메시지")
+
+    model_config = {
+        "from_attributes": True
+    }
+
+class BatchFinancialMetricsResponse(BaseSchema):
+    """재무지표 일괄 조회 응답"""
+    results: List[BatchFinancialItem] = Field(..., description="요청 순서대로 정렬된 회사별 결과")
+
+    model_config = {
+        "from_attributes": True
+    }
+
+class BulkIngestRequest(BaseSchema):
+    """다중회사 재무제표 일괄 적재 요청"""
+    corp_codes: List[str] = Field(default_factory=list, description="기업 고유번호 목록")
+    listed_universe: bool = Field(False, description="True이면 전체 상장사를 대상으로 적재")
+    year: Optional[int] = Field(None, description="사업연도. 지정하지 않으면 직전 연도")
+
+    model_config = {
+        "from_attributes": True
+    }
+
+class JobAcceptedResponse(BaseSchema):
+    """비동기 적재 작업 접수 응답 (202 Accepted)"""
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="작업 상태 (queued/running/succeeded/failed)")
+    status_url: str = Field(..., description="작업 상태/결과 조회 경로")
+    events_url: str = Field(..., description="진행 단계 SSE 스트림 경로")
+
+    model_config = {
+        "from_attributes": True
+    }
+
+class JobStatusResponse(BaseSchema):
+    """비동기 적재 작업 상태 및 결과"""
+    job_id: str = Field(..., description="작업 ID")
+    key: str = Field(..., description="중복 제거 키 (기업 고유번호)")
+    description: str = Field("", description="작업 설명")
+    status: str = Field(..., description="작업 상태 (queued/running/succeeded/failed)")
+    stage: Optional[str] = Field(None, description="현재 진행 단계")
+    stages: List[Dict[str, Any]] = Field(default_factory=list, description="진행 단계 기록")
+    result: Optional[Union[FinancialMetricsResponse, Dict[str, Any]]] = Field(
+        None, description="작업 결과 (완료 시). 재무 지표 적재는 재무 지표, 일괄 적재는 회사별 저장 결과"
+    )
+    error: Optional[str] = Field(None, description="오류 메시지 (실패 시)")
+    created_at: str = Field(..., description="작업 등록 시각")
+    updated_at: str = Field(..., description="마지막 상태 변경 시각")
+
+    model_config = {
+        "from_attributes": True
+    }
@@ -1,8 +1,12 @@
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
+import time
 from typing import Optional, List, Dict, Any
 
+from app.domain.repository import queries
+from app.foundation.infra.database.partitions import recent_years_floor
+
 logger = logging.getLogger(__name__)
 
 async def delete_financial_statements(
@@ -18,12 +22,7 @@ async def delete_financial_statements(
         bsns_year: 삭제할 사업연도
     """
     try:
-        delete_query = text("""
-            DELETE FROM financials 
-            WHERE corp_code = :corp_code 
-            AND bsns_year = :bsns_year
-        """)
-        await db_session.execute(delete_query, {
+        await db_session.execute(queries.DELETE_FINANCIALS_FOR_YEAR, {
             "corp_code": corp_code,
             "bsns_year": bsns_year
         })
@@ -105,79 +104,80 @@ async def get_financial_statements_by_corp_code(db_session: AsyncSession, corp_c
     return [dict(row) for row in result]
 
 async def save_financial_statements(db_session: AsyncSession, statements: List[Dict[str, Any]]) -> None:
-    """재무제표 데이터를 저장합니다."""
+    """재무제표 데이터를 저장합니다.
+    
+    테이블마다 배열 파라미터(unnest)를 이용한 다중 행 upsert를 한 번씩만 실행합니다.
+    """
+    if not statements:
+        return
+    started = time.perf_counter()
     try:
-        # 1. statement 테이블에 재무제표 유형 저장
-        for stmt in statements:
-            insert_statement_query = text("""
-                INSERT INTO statement (sj_div, sj_nm)
-                VALUES (:sj_div, :sj_nm)
-                ON CONFLICT (sj_div) DO NOTHING
-            """)
-            await db_session.execute(insert_statement_query, {
-                "sj_div": stmt["sj_div"],
-                "sj_nm": stmt["sj_nm"]
-            })
+        # 1. statement 테이블에 재무제표 유형 저장 (유형별 1행)
+        statement_types = {stmt["sj_div"]: stmt["sj_nm"] for stmt in statements}
+        await db_session.execute(queries.UPSERT_STATEMENT_TYPES, {
+            "sj_divs": list(statement_types.keys()),
+            "sj_nms": list(statement_types.values())
+        })
 
         # 2. companies 테이블에 회사 정보 저장
-        if statements:
-            insert_company_query = text("""
-                INSERT INTO companies (corp_code, corp_name, stock_code)
-                VALUES (:corp_code, :corp_name, :stock_code)
-                ON CONFLICT (corp_code) DO UPDATE SET
-                    corp_name = EXCLUDED.corp_name,
-                    stock_code = EXCLUDED.stock_code
-            """)
-            await db_session.execute(insert_company_query, {
-                "corp_code": statements[0]["corp_code"],
-                "corp_name": statements[0]["corp_name"],
-                "stock_code": statements[0].get("stock_code", "")
-            })
-
-        # 3. reports 테이블에 보고서 정보 저장
-        if statements:
-            insert_report_query = text("""
-                INSERT INTO reports (rcept_no, reprt_code)
-                VALUES (:rcept_no, :reprt_code)
-                ON CONFLICT (rcept_no) DO NOTHING
-            """)
-            await db_session.execute(insert_report_query, {
-                "rcept_no": statements[0]["rcept_no"],
-                "reprt_code": "11011"  # 사업보고서 코드
-            })
-
-        # 4. financials 테이블에 재무제표 데이터 저장
-        for stmt in statements:
-            insert_financial_query = text("""
-                INSERT INTO financials (
-                    corp_code, bsns_year, sj_div, account_nm,
-                    thstrm_nm, thstrm_amount,
-                    frmtrm_nm, frmtrm_amount,
-                    bfefrmtrm_nm, bfefrmtrm_amount,
-                    ord, currency, rcept_no
-                ) VALUES (
-                    :corp_code, :bsns_year, :sj_div, :account_nm,
-                    :thstrm_nm, :thstrm_amount,
-                    :frmtrm_nm, :frmtrm_amount,
-                    :bfefrmtrm_nm, :bfefrmtrm_amount,
-                    :ord, :currency, :rcept_no
-                )
-                ON CONFLICT (corp_code, bsns_year, sj_div, account_nm) DO UPDATE SET
-                    thstrm_nm = EXCLUDED.thstrm_nm,
-                    thstrm_amount = EXCLUDED.thstrm_amount,
-                    frmtrm_nm = EXCLUDED.frmtrm_nm,
-                    frmtrm_amount = EXCLUDED.frmtrm_amount,
-                    bfefrmtrm_nm = EXCLUDED.bfefrmtrm_nm,
-                    bfefrmtrm_amount = EXCLUDED.bfefrmtrm_amount,
-                    ord = EXCLUDED.ord,
-                    currency = EXCLUDED.currency,
-                    rcept_no = EXCLUDED.rcept_no,
-                    updated_at = CURRENT_TIMESTAMP
-            """)
-            await db_session.execute(insert_financial_query, stmt)
+        await db_session.execute(queries.UPSERT_COMPANY, {
+            "corp_code": statements[0]["corp_code"],
+            "corp_name": statements[0]["corp_name"],
+            "stock_code": statements[0].get("stock_code", "")
+        })
+
+        # 3. reports 테이블에 보고서 정보 저장 (접수번호별 1행)
+        reports = {stmt["rcept_no"]: stmt.get("reprt_code") or "11011" for stmt in statements}
+        await db_session.execute(queries.INSERT_REPORTS, {
+            "rcept_nos": list(reports.keys()),
+            "reprt_codes": list(reports.values())
+        })
+
+        # 4. accounts 사전에 처음 보는 계정명 등록 (이미 있는 계정은 시퀀스를 소모하지 않도록 제외)
+        accounts = {stmt["account_nm"]: stmt.get("account_id") for stmt in statements}
+        await db_session.execute(queries.INSERT_NEW_ACCOUNTS, {
+            "account_nms": list(accounts.keys()),
+            "account_ids": list(accounts.values())
+        })
+
+        # 5. financials 테이블에 재무제표 데이터 저장 (사업연도 파티션은 시작 시 미리 생성됨)
+        # 같은 키가 한 문장에 두 번 나오면 ON CONFLICT가 실패하므로 마지막 값만 남김
+        rows = {
+            (stmt["corp_code"], stmt["bsns_year"], stmt["sj_div"], stmt["account_nm"]): stmt
+            for stmt in statements
+        }
+        columns = {
+            "corp_codes": [], "bsns_years": [], "sj_divs": [], "account_nms": [],
+            "thstrm_nms": [], "thstrm_amounts": [],
+            "frmtrm_nms": [], "frmtrm_amounts": [],
+            "bfefrmtrm_nms": [], "bfefrmtrm_amounts": [],
+            "ords": [], "currencies": [], "rcept_nos": []
+        }
+        for stmt in rows.values():
+            columns["corp_codes"].append(stmt["corp_code"])
+            columns["bsns_years"].append(stmt["bsns_year"])
+            columns["sj_divs"].append(stmt["sj_div"])
+            columns["account_nms"].append(stmt["account_nm"])
+            columns["thstrm_nms"].append(stmt.get("thstrm_nm"))
+            columns["thstrm_amounts"].append(stmt.get("thstrm_amount"))
+            columns["frmtrm_nms"].append(stmt.get("frmtrm_nm"))
+            columns["frmtrm_amounts"].append(stmt.get("frmtrm_amount"))
+            columns["bfefrmtrm_nms"].append(stmt.get("bfefrmtrm_nm"))
+            columns["bfefrmtrm_amounts"].append(stmt.get("bfefrmtrm_amount"))
+            columns["ords"].append(stmt.get("ord"))
+            columns["currencies"].append(stmt.get("currency"))
+            columns["rcept_nos"].append(stmt.get("rcept_no"))
+
+        await db_session.execute(queries.UPSERT_FINANCIALS, columns)
 
         await db_session.commit()
 
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"재무제표 {len(rows)}건 저장 완료 - {elapsed * 1000:.1f}ms "
+            f"({len(rows) / elapsed if elapsed > 0 else 0:.0f} rows/s)"
+        )
+
     except Exception as e:
         await db_session.rollback()
         raise
@@ -244,4 +244,70 @@ async def get_financial_statements(db_session: AsyncSession, corp_code: str, bsn
     """)
     result = await db_session.execute(query, {"corp_code": corp_code, "bsns_year": bsns_year})
     rows = result.fetchall()
-    return [dict(zip(result.keys(), row)) for row in rows]
\ No newline at end of file
+    return [dict(zip(result.keys(), row)) for row in rows]
+
+async def get_companies_by_names(db_session: AsyncSession, company_names: List[str]) -> List[Dict[str, Any]]:
+    """여러 회사명으로 회사 정보를 한 번에 조회합니다."""
+    if not company_names:
+        return []
+    result = await db_session.execute(queries.SELECT_COMPANIES_BY_NAMES, {"company_names": list(company_names)})
+    return [dict(zip(result.keys(), row)) for row in result.fetchall()]
+
+async def get_companies_by_corp_codes(db_session: AsyncSession, corp_codes: List[str]) -> List[Dict[str, Any]]:
+    """여러 기업 고유번호로 회사 정보를 한 번에 조회합니다."""
+    if not corp_codes:
+        return []
+    result = await db_session.execute(queries.SELECT_COMPANIES_BY_CORP_CODES, {"corp_codes": list(corp_codes)})
+    return [dict(zip(result.keys(), row)) for row in result.fetchall()]
+
+async def get_recent_financials_by_corp_codes(
+    db_session: AsyncSession,
+    corp_codes: List[str],
+    year_count: int = 3
+) -> Dict[str, List[Dict[str, Any]]]:
+    """여러 회사의 최근 N개 사업연도 재무제표를 한 번의 쿼리로 조회합니다.
+    
+    Returns:
+        기업 고유번호별 재무제표 행 목록 (연도 내림차순, 재무제표 구분, 정렬 순서)
+    """
+    if not corp_codes:
+        return {}
+    result = await db_session.execute(
+        queries.SELECT_RECENT_FINANCIALS_BY_CORP_CODES,
+        {"corp_codes": list(corp_codes), "year_count": year_count, "min_year": recent_years_floor()}
+    )
+    keys = list(result.keys())
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for row in result.fetchall():
+        row_dict = dict(zip(keys, row))
+        grouped.setdefault(row_dict["corp_code"], []).append(row_dict)
+    return grouped
+
+async def get_unseen_rcept_nos(
+    db_session: AsyncSession,
+    corp_code: str,
+    rcept_nos: List[str]
+) -> List[str]:
+    """이미 적재된 회사에 대해 아직 반영되지 않은 접수번호만 반환합니다.
+    
+    회사 데이터가 하나도 없으면(최초 적재) 빈 목록을 반환합니다.
+    """
+    if not rcept_nos:
+        return []
+    result = await db_session.execute(
+        queries.SELECT_UNSEEN_RCEPT_NOS,
+        {"corp_code": corp_code, "rcept_nos": list(set(rcept_nos))}
+    )
+    return [row[0] for row in result.fetchall()]
+
+async def delete_metrics(db_session: AsyncSession, corp_code: str, bsns_years: List[str]) -> int:
+    """회사의 지정된 사업연도 재무지표(지표 스냅샷 포함)를 삭제합니다."""
+    if not bsns_years:
+        return 0
+    result = await db_session.execute(queries.DELETE_METRICS, {"corp_code": corp_code, "bsns_years": list(bsns_years)})
+    return result.rowcount
+
+async def has_financial_data(db_session: AsyncSession, corp_code: str) -> bool:
+    """회사의 재무제표가 한 건이라도 적재되어 있는지 확인합니다."""
+    result = await db_session.execute(queries.EXISTS_FINANCIALS, {"corp_code": corp_code})
+    return result.fetchone() is not None
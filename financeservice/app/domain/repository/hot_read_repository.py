@@ -0,0 +1,116 @@
+import logging
+from typing import List, Optional
+
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.foundation.infra.database.partitions import recent_years_floor
+from app.foundation.infra.database.unit_of_work import count_statement
+
+logger = logging.getLogger(__name__)
+
+# 요청마다 실행되는 조회는 SQLAlchemy 결과 처리 없이 asyncpg로 직접 실행합니다.
+# asyncpg는 연결별 statement cache로 같은 SQL을 한 번만 prepare하고 바이너리 프로토콜로 결과를 받으며,
+# 행은 이름/인덱스로 접근할 수 있는 asyncpg.Record(튜플 형태)로 반환합니다.
+
+_COMPANY_BY_NAME = """
+    SELECT corp_code, corp_name, stock_code
+    FROM companies
+    WHERE corp_name = $1
+    LIMIT 1
+"""
+
+_FINANCIALS_SELECT = """
+    SELECT f.bsns_year, f.sj_div, s.sj_nm, a.account_nm,
+           f.thstrm_amount, f.frmtrm_amount, f.bfefrmtrm_amount
+    FROM financials f
+    JOIN statement s ON f.sj_div = s.sj_div
+    JOIN accounts a ON a.account_key = f.account_key
+    WHERE f.corp_code = $1
+"""
+
+_FINANCIALS_BY_YEAR = _FINANCIALS_SELECT + """
+    AND f.bsns_year = $2
+    ORDER BY f.bsns_year DESC, f.sj_div, f.ord
+"""
+
+_FINANCIALS_ALL_YEARS = _FINANCIALS_SELECT + """
+    ORDER BY f.bsns_year DESC, f.sj_div, f.ord
+"""
+
+# 연도 하한을 스칼라 서브쿼리로 두어 실행 시점 파티션 프루닝이 적용되도록 함 (서브쿼리는 $3 이후 파티션만 읽음)
+_FINANCIALS_RECENT_YEARS = _FINANCIALS_SELECT + """
+    AND f.bsns_year >= (
+        SELECT MIN(recent_years.bsns_year)
+        FROM (
+            SELECT DISTINCT f2.bsns_year
+            FROM financials f2
+            WHERE f2.corp_code = $1
+            AND f2.bsns_year >= $3
+            ORDER BY f2.bsns_year DESC
+            LIMIT $2
+        ) recent_years
+    )
+    ORDER BY f.bsns_year DESC, f.sj_div, f.ord
+"""
+
+# 회사·연도별 마지막 갱신 시각. 경과 시간은 저장 시각(CURRENT_TIMESTAMP)과 같은 기준으로 DB에서 계산
+_FINANCIALS_REFRESHED_AT = """
+    SELECT MAX(updated_at) AS refreshed_at,
+           EXTRACT(EPOCH FROM (LOCALTIMESTAMP - MAX(updated_at)))::float8 AS age_seconds
+    FROM financials
+    WHERE corp_code = $1
+    AND bsns_year = $2
+"""
+
+
+async def driver_connection(db_session: AsyncSession) -> asyncpg.Connection:
+    """세션이 사용 중인 풀 연결의 asyncpg 연결을 반환합니다 (세션 트랜잭션을 그대로 공유).
+
+    이 연결로 실행한 문장은 세션 이벤트를 거치지 않으므로 실행할 때마다 count_statement로 기록합니다.
+    """
+    connection = await db_session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
+
+
+async def fetch_company_by_name(db_session: AsyncSession, company_name: str) -> Optional[asyncpg.Record]:
+    """회사명으로 (corp_code, corp_name, stock_code)를 조회합니다."""
+    conn = await driver_connection(db_session)
+    count_statement(db_session)
+    return await conn.fetchrow(_COMPANY_BY_NAME, company_name)
+
+
+async def fetch_financials(
+    db_session: AsyncSession,
+    corp_code: str,
+    year: Optional[int] = None,
+    recent_years: Optional[int] = None
+) -> List[asyncpg.Record]:
+    """기업 고유번호로 재무제표 행(bsns_year, sj_div, sj_nm, account_nm, 기간별 금액)을 조회합니다.
+
+    회사명은 중복될 수 있으므로 조회는 항상 기업 고유번호 기준입니다.
+
+    Args:
+        corp_code: 기업 고유번호
+        year: 특정 사업연도만 조회
+        recent_years: year가 없을 때 최근 N개 사업연도만 조회 (None이면 전체 연도).
+            FIN_RECENT_YEARS_WINDOW 안의 연도에서만 고름
+    """
+    conn = await driver_connection(db_session)
+    count_statement(db_session)
+    if year is not None:
+        return await conn.fetch(_FINANCIALS_BY_YEAR, corp_code, str(year))
+    if recent_years is not None:
+        return await conn.fetch(_FINANCIALS_RECENT_YEARS, corp_code, recent_years, recent_years_floor())
+    return await conn.fetch(_FINANCIALS_ALL_YEARS, corp_code)
+
+
+async def fetch_financials_refreshed_at(db_session: AsyncSession, corp_code: str, bsns_year: str) -> Optional[asyncpg.Record]:
+    """회사·연도 재무제표의 마지막 갱신 시각(refreshed_at)과 경과 시간(age_seconds, 초)을 조회합니다."""
+    conn = await driver_connection(db_session)
+    count_statement(db_session)
+    row = await conn.fetchrow(_FINANCIALS_REFRESHED_AT, corp_code, bsns_year)
+    if row is None or row["refreshed_at"] is None:
+        return None
+    return row
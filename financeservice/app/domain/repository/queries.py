@@ -0,0 +1,257 @@
+"""재무 저장소에서 사용하는 SQL 문 모음.
+
+흩어져 있던 SQL을 한곳에 모아 모듈을 불러올 때 한 번만 만듭니다. 값은 모두 바인드 파라미터로 전달하며
+SQL 문자열을 조합하지 않습니다. SQLAlchemy 컴파일 캐시는 SQL 문자열을 키로 쓰므로 호출마다 text()를 만들어도
+적중하며, 미리 만들어 줄어드는 비용은 호출마다의 text() 생성(문장당 수~수십 us)뿐입니다
+(benchmarks/bench_query_registry.py).
+"""
+from sqlalchemy import text
+
+# ----------------------------------------------------------------------
+# 재무제표 저장 (fin_repository.save_financial_statements)
+# ----------------------------------------------------------------------
+
+UPSERT_STATEMENT_TYPES = text("""
+    INSERT INTO statement (sj_div, sj_nm, updated_at)
+    SELECT t.sj_div, t.sj_nm, CURRENT_TIMESTAMP
+    FROM unnest(CAST(:sj_divs AS varchar[]), CAST(:sj_nms AS varchar[])) AS t(sj_div, sj_nm)
+    ON CONFLICT (sj_div) DO NOTHING
+""")
+
+UPSERT_COMPANY = text("""
+    INSERT INTO companies (corp_code, corp_name, stock_code, updated_at)
+    VALUES (:corp_code, :corp_name, :stock_code, CURRENT_TIMESTAMP)
+    ON CONFLICT (corp_code) DO UPDATE SET
+        corp_name = EXCLUDED.corp_name,
+        stock_code = EXCLUDED.stock_code,
+        updated_at = CURRENT_TIMESTAMP
+""")
+
+INSERT_REPORTS = text("""
+    INSERT INTO reports (rcept_no, reprt_code, updated_at)
+    SELECT r.rcept_no, r.reprt_code, CURRENT_TIMESTAMP
+    FROM unnest(CAST(:rcept_nos AS varchar[]), CAST(:reprt_codes AS varchar[])) AS r(rcept_no, reprt_code)
+    ON CONFLICT (rcept_no) DO NOTHING
+""")
+
+# 이미 있는 계정은 시퀀스를 소모하지 않도록 제외
+INSERT_NEW_ACCOUNTS = text("""
+    INSERT INTO accounts (account_nm, account_id)
+    SELECT a.account_nm, a.account_id
+    FROM unnest(CAST(:account_nms AS varchar[]), CAST(:account_ids AS varchar[])) AS a(account_nm, account_id)
+    WHERE NOT EXISTS (SELECT 1 FROM accounts existing WHERE existing.account_nm = a.account_nm)
+    ON CONFLICT (account_nm) DO NOTHING
+""")
+
+UPSERT_FINANCIALS = text("""
+    INSERT INTO financials (
+        corp_code, bsns_year, sj_div, account_key,
+        thstrm_nm, thstrm_amount,
+        frmtrm_nm, frmtrm_amount,
+        bfefrmtrm_nm, bfefrmtrm_amount,
+        ord, currency, rcept_no, updated_at
+    )
+    SELECT
+        f.corp_code, f.bsns_year, f.sj_div, a.account_key,
+        f.thstrm_nm, f.thstrm_amount,
+        f.frmtrm_nm, f.frmtrm_amount,
+        f.bfefrmtrm_nm, f.bfefrmtrm_amount,
+        f.ord, f.currency, f.rcept_no, CURRENT_TIMESTAMP
+    FROM unnest(
+        CAST(:corp_codes AS varchar[]), CAST(:bsns_years AS varchar[]),
+        CAST(:sj_divs AS varchar[]), CAST(:account_nms AS varchar[]),
+        CAST(:thstrm_nms AS varchar[]), CAST(:thstrm_amounts AS bigint[]),
+        CAST(:frmtrm_nms AS varchar[]), CAST(:frmtrm_amounts AS bigint[]),
+        CAST(:bfefrmtrm_nms AS varchar[]), CAST(:bfefrmtrm_amounts AS bigint[]),
+        CAST(:ords AS integer[]), CAST(:currencies AS varchar[]), CAST(:rcept_nos AS varchar[])
+    ) AS f(
+        corp_code, bsns_year, sj_div, account_nm,
+        thstrm_nm, thstrm_amount,
+        frmtrm_nm, frmtrm_amount,
+        bfefrmtrm_nm, bfefrmtrm_amount,
+        ord, currency, rcept_no
+    )
+    JOIN accounts a ON a.account_nm = f.account_nm
+    ON CONFLICT (corp_code, bsns_year, sj_div, account_key) DO UPDATE SET
+        thstrm_nm = EXCLUDED.thstrm_nm,
+        thstrm_amount = EXCLUDED.thstrm_amount,
+        frmtrm_nm = EXCLUDED.frmtrm_nm,
+        frmtrm_amount = EXCLUDED.frmtrm_amount,
+        bfefrmtrm_nm = EXCLUDED.bfefrmtrm_nm,
+        bfefrmtrm_amount = EXCLUDED.bfefrmtrm_amount,
+        ord = EXCLUDED.ord,
+        currency = EXCLUDED.currency,
+        rcept_no = EXCLUDED.rcept_no,
+        updated_at = CURRENT_TIMESTAMP
+""")
+
+DELETE_FINANCIALS_FOR_YEAR = text("""
+    DELETE FROM financials
+    WHERE corp_code = :corp_code
+    AND bsns_year = :bsns_year
+""")
+
+# ----------------------------------------------------------------------
+# 회사/재무제표 조회
+# ----------------------------------------------------------------------
+
+SELECT_COMPANIES_BY_NAMES = text("""
+    SELECT corp_code, corp_name, stock_code
+    FROM companies
+    WHERE corp_name = ANY(:company_names)
+""")
+
+SELECT_COMPANIES_BY_CORP_CODES = text("""
+    SELECT corp_code, corp_name, stock_code
+    FROM companies
+    WHERE corp_code = ANY(:corp_codes)
+""")
+
+# 최근 연도 선택은 :min_year 이후 파티션만 읽고, 본 조회는 가장 이른 대상 연도를 스칼라 서브쿼리 하한으로
+# 두어 실행 시점 파티션 프루닝이 적용되도록 함
+SELECT_RECENT_FINANCIALS_BY_CORP_CODES = text("""
+    WITH recent AS (
+        SELECT corp_code, bsns_year
+        FROM (
+            SELECT corp_code, bsns_year,
+                   DENSE_RANK() OVER (PARTITION BY corp_code ORDER BY bsns_year DESC) AS year_rank
+            FROM (
+                SELECT DISTINCT corp_code, bsns_year
+                FROM financials
+                WHERE corp_code = ANY(:corp_codes)
+                AND bsns_year >= :min_year
+            ) years
+        ) ranked
+        WHERE year_rank <= :year_count
+    )
+    SELECT f.corp_code, f.bsns_year, f.sj_div, s.sj_nm, a.account_nm,
+           f.thstrm_amount, f.frmtrm_amount, f.bfefrmtrm_amount, f.updated_at
+    FROM financials f
+    JOIN statement s ON f.sj_div = s.sj_div
+    JOIN accounts a ON a.account_key = f.account_key
+    JOIN recent ON recent.corp_code = f.corp_code
+               AND recent.bsns_year = f.bsns_year
+    WHERE f.corp_code = ANY(:corp_codes)
+    AND f.bsns_year >= (SELECT MIN(bsns_year) FROM recent)
+    ORDER BY f.corp_code, f.bsns_year DESC, f.sj_div, f.ord
+""")
+
+SELECT_UNSEEN_RCEPT_NOS = text("""
+    SELECT r.rcept_no
+    FROM unnest(CAST(:rcept_nos AS varchar[])) AS r(rcept_no)
+    WHERE EXISTS (SELECT 1 FROM financials WHERE corp_code = :corp_code)
+    AND NOT EXISTS (
+        SELECT 1 FROM financials f
+        WHERE f.corp_code = :corp_code
+        AND f.rcept_no = r.rcept_no
+    )
+""")
+
+EXISTS_FINANCIALS = text("""
+    SELECT 1 FROM financials
+    WHERE corp_code = :corp_code
+    LIMIT 1
+""")
+
+# ----------------------------------------------------------------------
+# 재무비율/재무지표 (RatioService)
+# ----------------------------------------------------------------------
+
+SELECT_RATIO_INPUT_BY_YEAR = text("""
+    SELECT
+        a.account_nm,
+        f.thstrm_amount,
+        f.frmtrm_amount,
+        f.bfefrmtrm_amount,
+        f.bsns_year
+    FROM financials f
+    JOIN accounts a ON a.account_key = f.account_key
+    WHERE f.corp_code = :corp_code
+    AND f.sj_div IN ('BS', 'IS')  -- 재무상태표와 손익계산서만 조회
+    AND a.account_nm = ANY(:account_nms)  -- 비율 계산에 쓰는 계정만 조회
+    AND f.bsns_year = :bsns_year
+    ORDER BY f.sj_div, f.ord
+""")
+
+# 최근 3개년도 (:min_year 이후에서 고른 연도 하한으로 실행 시점 파티션 프루닝)
+SELECT_RATIO_INPUT_RECENT_YEARS = text("""
+    SELECT
+        a.account_nm,
+        f.thstrm_amount,
+        f.frmtrm_amount,
+        f.bfefrmtrm_amount,
+        f.bsns_year
+    FROM financials f
+    JOIN accounts a ON a.account_key = f.account_key
+    WHERE f.corp_code = :corp_code
+    AND f.sj_div IN ('BS', 'IS')  -- 재무상태표와 손익계산서만 조회
+    AND a.account_nm = ANY(:account_nms)  -- 비율 계산에 쓰는 계정만 조회
+    AND f.bsns_year >= (
+        SELECT MIN(recent_years.bsns_year)
+        FROM (
+            SELECT DISTINCT bsns_year
+            FROM financials
+            WHERE corp_code = :corp_code
+            AND bsns_year >= :min_year
+            ORDER BY bsns_year DESC
+            LIMIT 3
+        ) recent_years
+    )
+    ORDER BY f.bsns_year DESC, f.sj_div, f.ord
+""")
+
+UPSERT_YEAR_METRICS = text("""
+    INSERT INTO metrics (
+        corp_code, bsns_year, metric_name, metric_value, metric_unit, updated_at
+    )
+    SELECT :corp_code, :bsns_year, m.metric_name, m.metric_value, '%', CURRENT_TIMESTAMP
+    FROM unnest(CAST(:metric_names AS varchar[]), CAST(:metric_values AS float8[])) AS m(metric_name, metric_value)
+    ON CONFLICT (corp_code, bsns_year, metric_name) DO UPDATE SET
+        metric_value = EXCLUDED.metric_value,
+        updated_at = CURRENT_TIMESTAMP
+""")
+
+# 스냅샷 기준 연도 - 2 이후의 파티션만 읽도록 연도 하한을 스칼라 서브쿼리로 전달
+# (기준 연도는 :min_year 이후 파티션에서만 찾음)
+SELECT_STORED_METRICS = text("""
+    WITH anchor AS (
+        SELECT CAST(CAST(MAX(bsns_year) AS integer) - 2 AS varchar) AS min_year
+        FROM metrics
+        WHERE corp_code = :corp_code
+        AND metric_name = 'revenue_growth'
+        AND bsns_year >= :min_year
+    )
+    SELECT m.bsns_year, m.metric_name, m.metric_value, m.updated_at,
+           (SELECT MAX(f.updated_at) FROM financials f
+            WHERE f.corp_code = :corp_code
+            AND f.bsns_year >= (SELECT min_year FROM anchor)) AS source_updated_at
+    FROM metrics m
+    WHERE m.corp_code = :corp_code
+    AND m.bsns_year >= (SELECT min_year FROM anchor)
+""")
+
+UPSERT_METRICS_SNAPSHOT = text("""
+    INSERT INTO metrics (
+        corp_code, bsns_year, metric_name, metric_value, metric_unit, updated_at
+    )
+    SELECT :corp_code, m.bsns_year, m.metric_name, m.metric_value, '%', CURRENT_TIMESTAMP
+    FROM unnest(
+        CAST(:bsns_years AS varchar[]), CAST(:metric_names AS varchar[]), CAST(:metric_values AS float8[])
+    ) AS m(bsns_year, metric_name, metric_value)
+    ON CONFLICT (corp_code, bsns_year, metric_name) DO UPDATE SET
+        metric_value = EXCLUDED.metric_value,
+        updated_at = CURRENT_TIMESTAMP
+""")
+
+EXISTS_METRICS_FOR_YEAR = text("""
+    SELECT 1 FROM metrics
+    WHERE corp_code = :corp_code
+    AND bsns_year = :bsns_year
+    LIMIT 1
+""")
+
+DELETE_METRICS = text("""
+    DELETE FROM metrics
+    WHERE corp_code = :corp_code
+    AND bsns_year = ANY(:bsns_years)
+""")
@@ -1,23 +1,69 @@
-from typing import Dict, Any
+from typing import Any, Mapping, Optional
 import logging
 from datetime import datetime
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.repository.fin_repository import get_companies_by_corp_codes
+from app.domain.repository.hot_read_repository import fetch_company_by_name
 from app.domain.service.dart_api_service import DartApiService
 from app.domain.model.schema.company_schema import CompanySchema
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.cache.response_cache import response_cache
+from app.foundation.infra.dart.corp_code_index import corp_code_index
+from app.foundation.infra.database.unit_of_work import memoized
 
 logger = logging.getLogger(__name__)
 
 class CompanyInfoService:
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, dart_api: DartApiService):
         self.db_session = db_session
-        self.dart_api = DartApiService()
+        self.dart_api = dart_api
 
     async def get_company_info(self, company_name: str) -> CompanySchema:
-        """회사 정보를 조회합니다."""
+        """회사 정보를 조회합니다. 결과는 응답 캐시에 보관됩니다."""
+        return await response_cache.get_or_load(
+            f"company:{company_name}",
+            lambda: self._load_company_info(company_name),
+            CompanySchema,
+            settings.COMPANY_CACHE_TTL
+        )
+
+    async def get_company_info_by_corp_code(self, corp_code: str) -> CompanySchema:
+        """기업 고유번호로 회사 정보를 조회합니다 (인덱스 → DB).
+
+        회사명은 중복될 수 있으므로 기업 고유번호로 요청된 회사는 이름을 거치지 않고 조회합니다.
+        """
+        record = corp_code_index.get_by_corp_code(corp_code)
+        if record is None:
+            rows = await get_companies_by_corp_codes(self.db_session, [corp_code])
+            if not rows:
+                raise ValueError(f"기업 고유번호 '{corp_code}'을 찾을 수 없습니다.")
+            record = (rows[0]["corp_code"], rows[0]["corp_name"], rows[0]["stock_code"])
+        now = datetime.now().isoformat()
+        return CompanySchema(
+            corp_code=record[0],
+            corp_name=record[1],
+            stock_code=record[2],
+            created_at=now,
+            updated_at=now
+        )
+
+    async def _load_company_info(self, company_name: str) -> CompanySchema:
+        """인덱스 → DB → DART 순서로 회사 정보를 조회합니다."""
         try:
-            # DB에서 먼저 조회
+            # 인메모리 기업 고유번호 인덱스에서 먼저 조회
+            record = corp_code_index.get_by_name(company_name)
+            if record:
+                now = datetime.now().isoformat()
+                return CompanySchema(
+                    corp_code=record[0],
+                    corp_name=record[1],
+                    stock_code=record[2],
+                    created_at=now,
+                    updated_at=now
+                )
+
+            # DB에서 조회
             db_company = await self._get_company_from_db(company_name)
             if db_company:
                 # 딕셔너리 키를 CompanySchema 필드와 일치시킴
@@ -49,21 +95,13 @@ class CompanyInfoService:
             logger.error(f"회사 정보 조회 실패: {str(e)}")
             raise
 
-    async def _get_company_from_db(self, company_name: str) -> Dict[str, Any]:
-        """DB에서 회사 정보를 조회합니다."""
-        query = text("""
-            SELECT corp_code, corp_name, stock_code 
-            FROM companies 
-            WHERE corp_name = :company_name 
-            LIMIT 1
-        """)
-        result = await self.db_session.execute(query, {"company_name": company_name})
-        row = result.fetchone()
-        
-        if row:
-            return {
-                "corp_code": row[0],
-                "corp_name": row[1],
-                "stock_code": row[2]
-            }
-        return None 
\ No newline at end of file
+    async def _get_company_from_db(self, company_name: str) -> Optional[Mapping[str, Any]]:
+        """DB에서 회사 정보를 조회합니다. 같은 요청(세션) 안에서는 한 번만 조회합니다."""
+        return await memoized(
+            self.db_session,
+            ("company", company_name),
+            lambda: self._query_company(company_name)
+        )
+
+    async def _query_company(self, company_name: str) -> Optional[Mapping[str, Any]]:
+        return await fetch_company_by_name(self.db_session, company_name)
\ No newline at end of file
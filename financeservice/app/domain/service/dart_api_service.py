@@ -1,11 +1,6 @@
-import os
+import asyncio
 import logging
-import aiohttp
-import zipfile
-import xml.etree.ElementTree as ET
-from io import BytesIO
 from typing import List, Optional, Dict, Any
-from dotenv import load_dotenv
 from datetime import datetime
 
 from app.domain.model.schema.schema import DartApiResponse
@@ -13,6 +8,10 @@ from app.domain.model.schema.company_schema import CompanySchema
 from app.domain.model.schema.report_schema import ReportSchema
 from app.domain.model.schema.financial_schema import FinancialSchema
 from app.domain.model.schema.statement_schema import StatementSchema
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.dart.corp_code_index import corp_code_index
+from app.foundation.infra.dart.http_client import dart_http_client
+from app.foundation.infra.dart.rate_limiter import DartQuotaExceededError, DartRateLimitError
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -25,46 +24,75 @@ if not logger.handlers:
     logger.addHandler(handler)
 
 class DartApiService:
-    def __init__(self):
-        load_dotenv()
-        self.api_key = os.getenv("DART_API_KEY")
+    """DART OpenAPI 호출 서비스. 상태가 없으므로 애플리케이션 전체에서 하나의 인스턴스를 공유합니다."""
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key or settings.DART_API_KEY
         if not self.api_key:
             logger.error("DART API 키가 필요합니다.")
             raise ValueError("DART API 키가 필요합니다.")
         logger.info("DartApiService가 초기화되었습니다.")
 
-    async def fetch_company_info(self, company_name: str) -> CompanySchema:
-        """DART API에서 회사 정보를 조회합니다."""
-        logger.info(f"회사 정보 조회 시작: {company_name}")
-        url = "https://opendart.fss.or.kr/api/corpCode.xml"
+    async def download_corp_code_archive(self) -> bytes:
+        """DART API에서 기업 고유번호 압축 파일(corpCode.xml)을 내려받습니다."""
         params = {"crtfc_key": self.api_key}
+        return await dart_http_client.get_bytes(
+            "corpCode.xml", params, timeout=settings.DART_HTTP_DOWNLOAD_TIMEOUT
+        )
+
+    async def fetch_disclosure_list(
+        self,
+        bgn_de: str,
+        end_de: str,
+        page_no: int = 1,
+        page_count: int = 100
+    ) -> Dict[str, Any]:
+        """DART 공시검색 API(list.json)로 기간 내 정기공시 목록 한 페이지를 조회합니다.
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status != 200:
-                    logger.error(f"API 요청 실패: {response.status}")
-                    raise Exception(f"API 요청 실패: {response.status}")
-                
-                content = await response.read()
-                with zipfile.ZipFile(BytesIO(content)) as zip_file:
-                    with zip_file.open('CORPCODE.xml') as xml_file:
-                        tree = ET.parse(xml_file)
-                        root = tree.getroot()
-                        
-                        for company in root.findall('.//list'):
-                            if company.findtext('corp_name') == company_name:
-                                logger.info(f"회사 정보를 찾았습니다: {company_name}")
-                                now = datetime.now().isoformat()
-                                return CompanySchema(
-                                    corp_code=company.findtext('corp_code'),
-                                    corp_name=company_name,
-                                    stock_code=company.findtext('stock_code') or "",
-                                    created_at=now,
-                                    updated_at=now
-                                )
-                        
-                        logger.error(f"회사명 '{company_name}'을 찾을 수 없습니다.")
-                        raise ValueError(f"회사명 '{company_name}'을 찾을 수 없습니다.")
+        Args:
+            bgn_de: 검색 시작 접수일자 (YYYYMMDD)
+            end_de: 검색 종료 접수일자 (YYYYMMDD)
+            page_no: 페이지 번호
+            page_count: 페이지당 건수 (최대 100)
+            
+        Returns:
+            DART 응답 (status, total_page, list 등). 조회된 데이터가 없으면 status가 "013"
+        """
+        params = {
+            "crtfc_key": self.api_key,
+            "bgn_de": bgn_de,
+            "end_de": end_de,
+            "pblntf_ty": "A",
+            "sort": "date",
+            "sort_mth": "asc",
+            "page_no": str(page_no),
+            "page_count": str(page_count)
+        }
+        return await dart_http_client.get_json("list.json", params)
+
+    async def fetch_company_info(self, company_name: str) -> CompanySchema:
+        """기업 고유번호 인덱스에서 회사 정보를 조회합니다."""
+        logger.info(f"회사 정보 조회 시작: {company_name}")
+        if corp_code_index.is_known_missing(company_name):
+            raise ValueError(f"회사명 '{company_name}'을 찾을 수 없습니다.")
+
+        await corp_code_index.ensure_loaded(self.download_corp_code_archive)
+        record = corp_code_index.get_by_name(company_name)
+        if record is None:
+            corp_code_index.remember_missing(company_name)
+            logger.error(f"회사명 '{company_name}'을 찾을 수 없습니다.")
+            raise ValueError(f"회사명 '{company_name}'을 찾을 수 없습니다.")
+
+        logger.info(f"회사 정보를 찾았습니다: {company_name}")
+        corp_code, corp_name, stock_code = record
+        now = datetime.now().isoformat()
+        return CompanySchema(
+            corp_code=corp_code,
+            corp_name=corp_name,
+            stock_code=stock_code,
+            created_at=now,
+            updated_at=now
+        )
 
     def _prepare_financial_data(self, raw_data: Dict[str, Any]) -> FinancialSchema:
         """API 응답 데이터에서 재무제표 스키마 객체를 생성합니다."""
@@ -93,88 +121,154 @@ class DartApiService:
     async def fetch_financial_statements(self, corp_code: str, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """DART API에서 재무제표 데이터를 조회합니다.
         
+        후보 연도를 최신 연도부터 하나씩 조회하며, 데이터가 있는 첫 연도를 반환합니다. 단일회사 API는
+        연결(CFS)과 별도(OFS) 재무제표를 한 응답에 함께 돌려주므로(각 행의 fs_div) 연도마다 한 번만
+        요청하고, 연결/별도 선택은 호출한 쪽에서 select_preferred_fs_div로 합니다.
+        
         Args:
             corp_code: 회사 코드
             year: 조회할 연도. None이면 직전 연도의 데이터를 조회
         """
         logger.info(f"재무제표 조회 시작 - corp_code: {corp_code}, year: {year}")
-        statements = []
         current_year = datetime.now().year
         
         # 연도 설정
         if year is None or not isinstance(year, int):
-            target_year = current_year - 1
-            logger.info(f"연도가 지정되지 않아 {target_year}년도 데이터를 조회합니다.")
+            candidate_years = [current_year - 1 - offset for offset in range(3)]
+            logger.info(f"연도가 지정되지 않아 {candidate_years[0]}년도부터 {candidate_years[-1]}년도까지 조회합니다.")
         else:
-            target_year = year
-            logger.info(f"{target_year}년도 데이터를 조회합니다.")
+            candidate_years = [year]
+            logger.info(f"{year}년도 데이터를 조회합니다.")
         
         # 사업보고서만 조회
-        report_codes = [("11011", "사업보고서")]
-        
-        for reprt_code, reprt_name in report_codes:
-            url = "https://opendart.fss.or.kr/api/fnlttSinglAcnt.json"
-            params = {
-                "crtfc_key": self.api_key,
-                "corp_code": corp_code,
-                "bsns_year": str(target_year),
-                "reprt_code": reprt_code,
-                "fs_div": "CFS"
-            }
-            
-            logger.info(f"{target_year}년도 {reprt_name} 조회를 시작합니다.")
-            
-            async with aiohttp.ClientSession() as session:
-                # 재무상태표와 손익계산서 조회
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"{reprt_name} API 요청 실패: {response.status}")
-                        continue
-                        
-                    data = await response.json()
-                    api_response = DartApiResponse(**data)
-                    
-                    if api_response.status != "000":
-                        logger.error(f"{target_year}년도 {reprt_name} API 응답 실패: {api_response.message}")
-                        if year is None and target_year > current_year - 3:
-                            # 직전 연도 데이터도 없으면 그 이전 연도 시도
-                            logger.info(f"직전 연도({target_year}) 데이터가 없어 이전 연도({target_year-1}) 조회를 시도합니다.")
-                            return await self.fetch_financial_statements(corp_code, target_year - 1)
-                        continue
-                    
-                    for item in api_response.list:
-                        if item.get("sj_div") in ["BS", "IS"]:
-                            item["thstrm_nm"] = f"{int(item['bsns_year'])}년"
-                            item["frmtrm_nm"] = f"{int(item['bsns_year'])-1}년"
-                            item["bfefrmtrm_nm"] = f"{int(item['bsns_year'])-2}년"
-                            statements.append(item)
-                
-                # 현금흐름표 조회
-                cf_url = "https://opendart.fss.or.kr/api/fnlttCashFlow.json"
-                async with session.get(cf_url, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"{reprt_name} 현금흐름표 API 요청 실패: {response.status}")
-                        continue
-                        
-                    data = await response.json()
-                    api_response = DartApiResponse(**data)
-                    
-                    if api_response.status != "000":
-                        logger.error(f"{target_year}년도 {reprt_name} 현금흐름표 API 응답 실패: {api_response.message}")
-                        continue
-                    
-                    for item in api_response.list:
-                        item["sj_div"] = "CF"
-                        item["sj_nm"] = "현금흐름표"
-                        item["thstrm_nm"] = f"{int(item['bsns_year'])}년"
-                        item["frmtrm_nm"] = f"{int(item['bsns_year'])-1}년"
-                        item["bfefrmtrm_nm"] = f"{int(item['bsns_year'])-2}년"
-                        statements.append(item)
-                
-                # 데이터를 찾았다면 더 이상 시도하지 않음
-                if statements:
-                    logger.info(f"{target_year}년도 {reprt_name}에서 재무제표 데이터를 찾았습니다.")
-                    break
+        reprt_code, reprt_name = "11011", "사업보고서"
+        
+        statements: List[Dict[str, Any]] = []
+        for target_year in candidate_years:
+            statements = await self._fetch_statement_set(corp_code, target_year, reprt_code, reprt_name)
+            if statements:
+                logger.info(f"{target_year}년도 {reprt_name}에서 재무제표 데이터를 찾았습니다.")
+                break
         
         logger.info(f"조회된 재무제표 수: {len(statements)}")
-        return statements 
\ No newline at end of file
+        return statements
+
+    async def fetch_multi_financial_statements(self, corp_codes: List[str], year: int) -> List[Dict[str, Any]]:
+        """DART 다중회사 주요계정 API(fnlttMultiAcnt)로 여러 회사의 재무제표를 한 번에 조회합니다.
+        
+        기업 고유번호를 허용되는 최대 크기 단위로 나누어 요청하며, 재무상태표와 손익계산서 항목만 반환합니다.
+        
+        Args:
+            corp_codes: 기업 고유번호 목록
+            year: 조회할 사업연도
+        """
+        chunk_size = settings.DART_MULTI_ACCOUNT_CHUNK
+        chunks = [corp_codes[i:i + chunk_size] for i in range(0, len(corp_codes), chunk_size)]
+        logger.info(f"다중회사 재무제표 조회 시작 - {len(corp_codes)}개사, {len(chunks)}회 호출, 연도: {year}")
+        
+        results = await asyncio.gather(
+            *(self._fetch_multi_account_chunk(chunk, year) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        statements: List[Dict[str, Any]] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, (DartRateLimitError, DartQuotaExceededError)):
+                raise result
+            if isinstance(result, Exception):
+                logger.error(f"다중회사 재무제표 조회 실패 ({chunk[0]} 외 {len(chunk) - 1}개사): {str(result)}")
+                continue
+            statements.extend(result)
+        
+        logger.info(f"조회된 다중회사 재무제표 수: {len(statements)}")
+        return statements
+
+    async def _fetch_multi_account_chunk(self, corp_codes: List[str], year: int) -> List[Dict[str, Any]]:
+        params = {
+            "crtfc_key": self.api_key,
+            "corp_code": ",".join(corp_codes),
+            "bsns_year": str(year),
+            "reprt_code": "11011"
+        }
+        data = await dart_http_client.get_json("fnlttMultiAcnt.json", params)
+        api_response = DartApiResponse(**data)
+        if api_response.status != "000":
+            logger.info(f"{year}년도 다중회사 재무제표 API 응답 실패: {api_response.message}")
+            return []
+        
+        statements = []
+        for item in api_response.list or []:
+            if item.get("sj_div") in ["BS", "IS"]:
+                self._set_term_names(item)
+                statements.append(item)
+        return statements
+
+    async def _fetch_statement_set(
+        self,
+        corp_code: str,
+        target_year: int,
+        reprt_code: str,
+        reprt_name: str
+    ) -> List[Dict[str, Any]]:
+        """한 연도의 재무상태표·손익계산서와 현금흐름표를 동시에 조회합니다 (연결/별도 행이 섞여 있음)."""
+        params = {
+            "crtfc_key": self.api_key,
+            "corp_code": corp_code,
+            "bsns_year": str(target_year),
+            "reprt_code": reprt_code
+        }
+        
+        account_data, cash_flow_data = await asyncio.gather(
+            dart_http_client.get_json("fnlttSinglAcnt.json", params),
+            dart_http_client.get_json("fnlttCashFlow.json", params),
+            return_exceptions=True
+        )
+        
+        # 요청 제한/한도 초과는 "데이터 없음"이 아니므로 호출자에게 전달
+        for result in (account_data, cash_flow_data):
+            if isinstance(result, (DartRateLimitError, DartQuotaExceededError)):
+                raise result
+        
+        # 재무상태표와 손익계산서. 요청 실패나 013(조회된 데이터 없음) 외의 오류 응답은 "데이터 없음"과
+        # 구분되도록 예외로 전달 (데이터 없음만 빈 결과로 캐시될 수 있음)
+        if isinstance(account_data, Exception):
+            logger.error(f"{target_year}년도 {reprt_name} API 요청 실패: {str(account_data)}")
+            raise account_data
+        
+        api_response = DartApiResponse(**account_data)
+        if api_response.status == "013":
+            logger.info(f"{target_year}년도 {reprt_name} 데이터 없음: {api_response.message}")
+            return []
+        if api_response.status != "000":
+            logger.error(f"{target_year}년도 {reprt_name} API 응답 실패: {api_response.status} {api_response.message}")
+            raise Exception(f"DART API 응답 실패 ({api_response.status}): {api_response.message}")
+        
+        statements = []
+        for item in api_response.list or []:
+            if item.get("sj_div") in ["BS", "IS"]:
+                self._set_term_names(item)
+                statements.append(item)
+        
+        # 현금흐름표
+        if isinstance(cash_flow_data, Exception):
+            logger.error(f"{target_year}년도 {reprt_name} 현금흐름표 API 요청 실패: {str(cash_flow_data)}")
+            return statements
+        
+        api_response = DartApiResponse(**cash_flow_data)
+        if api_response.status != "000":
+            logger.info(f"{target_year}년도 {reprt_name} 현금흐름표 API 응답 실패: {api_response.message}")
+            return statements
+        
+        for item in api_response.list or []:
+            item["sj_div"] = "CF"
+            item["sj_nm"] = "현금흐름표"
+            self._set_term_names(item)
+            statements.append(item)
+        
+        return statements
+
+    @staticmethod
+    def _set_term_names(item: Dict[str, Any]) -> None:
+        item["thstrm_nm"] = f"{int(item['bsns_year'])}년"
+        item["frmtrm_nm"] = f"{int(item['bsns_year'])-1}년"
+        item["bfefrmtrm_nm"] = f"{int(item['bsns_year'])-2}년"
@@ -0,0 +1,265 @@
+import asyncio
+import json
+import logging
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repository.fin_repository import get_companies_by_corp_codes
+from app.domain.service.financial_statement_service import FinancialStatementService
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.dart.rate_limiter import KST, DartPriority, dart_priority
+from app.foundation.infra.database.database import async_session
+
+logger = logging.getLogger(__name__)
+
+# (bgn_de, end_de, page_no) -> list.json 응답
+FetchPage = Callable[[str, str, int], Awaitable[Dict[str, Any]]]
+
+# 예: "사업보고서 (2023.12)", "[기재정정]분기보고서 (2024.03)"
+_REPORT_NAME = re.compile(r"(사업|반기|분기)보고서\s*\((\d{4})\.(\d{2})\)")
+
+ANNUAL_REPORT_CODE = "11011"
+MAX_REFRESH_ATTEMPTS = 3
+
+
+def parse_periodic_report(report_nm: str) -> Optional[Tuple[str, str, bool]]:
+    """공시 보고서명에서 (reprt_code, bsns_year, 정정 여부)를 추출합니다. 정기보고서가 아니면 None."""
+    match = _REPORT_NAME.search(report_nm or "")
+    if match is None:
+        return None
+    kind, year, month = match.groups()
+    if kind == "사업":
+        reprt_code = ANNUAL_REPORT_CODE
+    elif kind == "반기":
+        reprt_code = "11012"
+    else:
+        # 12월 결산법인 기준: 1분기(03) / 3분기(09)
+        reprt_code = "11013" if month == "03" else "11014"
+    return reprt_code, year, "정정" in report_nm[:match.start()]
+
+
+class DisclosurePoller:
+    """DART 공시 목록(list.json)을 저장된 커서부터 증분 조회하여,
+    이미 적재된 회사의 신규/정정 사업보고서만 재조회 대기열에 넣는 백그라운드 작업.
+
+    커서는 마지막으로 처리한 접수일자와 그 날짜에 처리한 접수번호 목록이며,
+    재시작 후에도 이어서 조회할 수 있도록 파일에 저장합니다.
+    """
+
+    def __init__(self, cursor_path: str, interval: int, workers: int, lookback_days: int):
+        self.cursor_path = cursor_path
+        self.interval = interval
+        self.workers = workers
+        self.lookback_days = lookback_days
+        self._cursor: Dict[str, Any] = {"date": None, "seen": []}
+        self._queue: "asyncio.Queue[Tuple[str, str, int]]" = asyncio.Queue()
+        self._pending: Set[Tuple[str, str]] = set()
+        self._retry: List[Tuple[str, str, int]] = []
+        self._tasks: List[asyncio.Task] = []
+        self._service_factory: Optional[Callable[[AsyncSession], FinancialStatementService]] = None
+        self._stats = {
+            "polls": 0,
+            "filings_seen": 0,
+            "annual_reports": 0,
+            "interim_reports": 0,
+            "corrections": 0,
+            "enqueued": 0,
+            "refreshed": 0,
+            "retried": 0,
+            "failed": 0
+        }
+        self._last_poll_at: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # 커서
+    # ------------------------------------------------------------------
+    def load_cursor(self) -> None:
+        try:
+            with open(self.cursor_path, "r", encoding="utf-8") as f:
+                self._cursor = json.load(f)
+            logger.info(f"공시 목록 커서 복원: {self._cursor['date']} ({len(self._cursor['seen'])}건 처리됨)")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"공시 목록 커서 파일을 읽을 수 없습니다: {str(e)}")
+
+    def _save_cursor(self) -> None:
+        directory = os.path.dirname(self.cursor_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.cursor_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._cursor, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cursor_path)
+
+    # ------------------------------------------------------------------
+    # 폴링
+    # ------------------------------------------------------------------
+    async def poll_once(self, fetch_page: FetchPage) -> int:
+        """커서 이후의 공시를 조회하여 갱신 대상을 대기열에 넣고, 추가된 작업 수를 반환합니다."""
+        today = datetime.now(KST)
+        bgn_de = self._cursor["date"] or (today - timedelta(days=self.lookback_days)).strftime("%Y%m%d")
+        end_de = today.strftime("%Y%m%d")
+        seen = set(self._cursor["seen"])
+
+        filings: List[Dict[str, Any]] = []
+        page_no, total_page = 1, 1
+        while page_no <= total_page:
+            data = await fetch_page(bgn_de, end_de, page_no)
+            status = data.get("status")
+            if status == "013":  # 조회된 데이터 없음
+                break
+            if status != "000":
+                raise Exception(f"공시 목록 조회 실패: {data.get('message')}")
+            total_page = int(data.get("total_page") or 1)
+            filings.extend(item for item in data.get("list") or [] if item.get("rcept_no") not in seen)
+            page_no += 1
+
+        self._stats["polls"] += 1
+        self._stats["filings_seen"] += len(filings)
+        self._last_poll_at = today.isoformat()
+
+        # 갱신 대상 선별: 정기보고서만, 같은 회사·연도는 한 번만
+        targets: Dict[Tuple[str, str], str] = {}
+        for item in filings:
+            parsed = parse_periodic_report(item.get("report_nm", ""))
+            if parsed is None or not item.get("corp_code"):
+                continue
+            reprt_code, bsns_year, corrected = parsed
+            if corrected:
+                self._stats["corrections"] += 1
+            if reprt_code != ANNUAL_REPORT_CODE:
+                # 재무제표는 사업보고서 기준으로만 저장하므로 분기/반기 보고서는 반영 대상이 없음
+                self._stats["interim_reports"] += 1
+                continue
+            self._stats["annual_reports"] += 1
+            targets[(item["corp_code"], bsns_year)] = item["rcept_no"]
+
+        enqueued = 0
+        if targets:
+            tracked = await self._tracked_corp_codes({corp_code for corp_code, _ in targets})
+            for corp_code, bsns_year in targets:
+                if corp_code in tracked and self._enqueue(corp_code, bsns_year, 0):
+                    enqueued += 1
+
+        # 커서 전진: 가장 최근 접수일자와 그 날짜에 처리한 접수번호
+        if filings:
+            latest = max(item["rcept_dt"] for item in filings)
+            latest_seen = {item["rcept_no"] for item in filings if item["rcept_dt"] == latest}
+            if latest == self._cursor["date"]:
+                latest_seen |= seen
+            self._cursor = {"date": latest, "seen": sorted(latest_seen)}
+            self._save_cursor()
+
+        logger.info(f"공시 목록 폴링 완료 - 신규 공시 {len(filings)}건, 갱신 대기열 추가 {enqueued}건")
+        return enqueued
+
+    async def _tracked_corp_codes(self, corp_codes: Set[str]) -> Set[str]:
+        """이미 적재된(서비스가 관리하는) 회사만 선별합니다."""
+        async with async_session() as session:
+            rows = await get_companies_by_corp_codes(session, list(corp_codes))
+        return {row["corp_code"] for row in rows}
+
+    def _enqueue(self, corp_code: str, bsns_year: str, attempt: int) -> bool:
+        if attempt == 0 and (corp_code, bsns_year) in self._pending:
+            return False
+        self._pending.add((corp_code, bsns_year))
+        self._queue.put_nowait((corp_code, bsns_year, attempt))
+        self._stats["enqueued"] += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # 백그라운드 작업
+    # ------------------------------------------------------------------
+    def start(
+        self,
+        fetch_page: FetchPage,
+        service_factory: Callable[[AsyncSession], FinancialStatementService]
+    ) -> None:
+        """커서를 복원하고 폴링 작업과 갱신 작업자를 시작합니다.
+
+        Args:
+            fetch_page: 공시 목록 한 페이지를 조회하는 함수
+            service_factory: DB 세션으로 FinancialStatementService를 조립하는 함수 (애플리케이션 컨테이너)
+        """
+        if self._tasks:
+            return
+        self._service_factory = service_factory
+        self.load_cursor()
+        self._tasks.append(asyncio.create_task(self._poll_loop(fetch_page)))
+        for _ in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _poll_loop(self, fetch_page: FetchPage) -> None:
+        with dart_priority(DartPriority.BACKGROUND):
+            while True:
+                # 직전 주기에 실패한 작업을 다시 넣음
+                retry, self._retry = self._retry, []
+                for corp_code, bsns_year, attempt in retry:
+                    self._enqueue(corp_code, bsns_year, attempt)
+                try:
+                    await self.poll_once(fetch_page)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"공시 목록 폴링 실패: {str(e)}")
+                await asyncio.sleep(self.interval)
+
+    async def _worker(self) -> None:
+        with dart_priority(DartPriority.BACKGROUND):
+            while True:
+                corp_code, bsns_year, attempt = await self._queue.get()
+                try:
+                    async with async_session() as session:
+                        result = await self._service_factory(session).refresh_financial_data(
+                            corp_code, int(bsns_year)
+                        )
+                    success = result["status"] == "success"
+                    if not success:
+                        logger.warning(f"공시 반영 실패 - {corp_code}, {bsns_year}: {result['message']}")
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"공시 반영 중 오류 - {corp_code}, {bsns_year}: {str(e)}")
+                    success = False
+                finally:
+                    self._queue.task_done()
+
+                if success:
+                    self._stats["refreshed"] += 1
+                    self._pending.discard((corp_code, bsns_year))
+                elif attempt + 1 < MAX_REFRESH_ATTEMPTS:
+                    # 공시 직후에는 재무제표 API에 아직 반영되지 않았을 수 있으므로 다음 주기에 재시도
+                    self._stats["retried"] += 1
+                    self._retry.append((corp_code, bsns_year, attempt + 1))
+                else:
+                    self._stats["failed"] += 1
+                    self._pending.discard((corp_code, bsns_year))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "cursor_date": self._cursor["date"],
+            "last_poll_at": self._last_poll_at,
+            "queue_depth": self._queue.qsize(),
+            "pending": len(self._pending),
+            "running": bool(self._tasks)
+        }
+
+
+disclosure_poller = DisclosurePoller(
+    cursor_path=settings.DISCLOSURE_CURSOR_PATH,
+    interval=settings.DISCLOSURE_POLL_INTERVAL,
+    workers=settings.DISCLOSURE_POLL_WORKERS,
+    lookback_days=settings.DISCLOSURE_POLL_LOOKBACK_DAYS
+)
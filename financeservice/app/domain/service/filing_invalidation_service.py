@@ -0,0 +1,56 @@
+import logging
+from typing import Any, Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repository.fin_repository import delete_metrics, get_unseen_rcept_nos
+from app.foundation.infra.cache.response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+# 한 보고서의 금액은 전전기까지 포함하고, 지표 스냅샷은 기준연도부터 3개년을 저장하므로
+# 사업연도 Y의 공시가 바뀌면 Y-2 ~ Y+2 연도의 지표가 영향을 받습니다.
+AFFECTED_YEAR_SPAN = 2
+
+
+def metrics_cache_key(corp_code: str) -> str:
+    """재무 지표 응답 캐시 키"""
+    return f"metrics:{corp_code}"
+
+
+class FilingInvalidationService:
+    """DART 접수번호(rcept_no)를 기준으로 새 공시/정정 공시를 감지하고,
+    해당 회사의 응답 캐시와 사전 계산된 지표만 무효화합니다."""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def find_new_filing_years(self, corp_code: str, statement_data: List[Dict[str, Any]]) -> List[str]:
+        """저장하려는 재무제표 중 아직 반영되지 않은 접수번호가 있는 사업연도를 반환합니다.
+
+        저장 전에 호출해야 하며, 최초 적재인 회사는 빈 목록을 반환합니다.
+        """
+        unseen = set(await get_unseen_rcept_nos(
+            self.db_session,
+            corp_code,
+            [stmt["rcept_no"] for stmt in statement_data if stmt.get("rcept_no")]
+        ))
+        if not unseen:
+            return []
+        years = sorted({str(stmt["bsns_year"]) for stmt in statement_data if stmt.get("rcept_no") in unseen})
+        logger.info(f"새 공시 감지 - 회사: {corp_code}, 사업연도: {years}, 접수번호: {sorted(unseen)}")
+        return years
+
+    async def invalidate(self, corp_code: str, bsns_years: List[str]) -> None:
+        """새 공시가 반영된 회사의 지표와 캐시된 응답을 무효화합니다."""
+        if not bsns_years:
+            return
+        affected_years = sorted({
+            str(int(year) + offset)
+            for year in bsns_years
+            for offset in range(-AFFECTED_YEAR_SPAN, AFFECTED_YEAR_SPAN + 1)
+        })
+        deleted = await delete_metrics(self.db_session, corp_code, affected_years)
+        await self.db_session.commit()
+        await response_cache.invalidate(metrics_cache_key(corp_code))
+        logger.info(f"공시 기반 무효화 완료 - 회사: {corp_code}, 삭제된 지표 {deleted}건, 대상 연도: {affected_years}")
@@ -1,23 +1,42 @@
-import os
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from dotenv import load_dotenv
 
 from app.domain.service.company_info_service import CompanyInfoService
-from app.domain.service.financial_statement_service import FinancialStatementService
+from app.domain.service.dart_api_service import DartApiService
+from app.domain.service.financial_data_processor import FinancialDataProcessor
+from app.domain.service.financial_statement_service import NO_DATA, FinancialStatementService
+from app.domain.service.financials_freshness import FRESH, SOFT_STALE, financials_freshness
 from app.domain.service.ratio_service import RatioService
+from app.domain.service.filing_invalidation_service import metrics_cache_key
+from app.domain.service.write_behind_queue import write_behind_queue
 from app.domain.model.schema.schema import (
     FinancialMetricsResponse,
     FinancialMetrics,
     GrowthData,
-    DebtLiquidityData
+    DebtLiquidityData,
+    BatchFinancialItem
 )
 from app.domain.model.schema.company_schema import CompanySchema
 from app.domain.model.schema.financial_schema import FinancialSchema
 from app.domain.model.schema.metric_schema import MetricSchema
 from app.domain.model.schema.report_schema import ReportSchema
 from app.domain.model.schema.statement_schema import StatementSchema
+from app.domain.repository.fin_repository import (
+    get_companies_by_names,
+    get_companies_by_corp_codes,
+    get_recent_financials_by_corp_codes,
+    has_financial_data
+)
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.cache.heavy_hitters import company_access_tracker
+from app.foundation.infra.cache.response_cache import response_cache
+from app.foundation.infra.dart.corp_code_index import corp_code_index
+from app.foundation.infra.dart.rate_limiter import DartPriority, dart_priority
+from app.foundation.infra.database.database import async_session
+from app.foundation.infra.jobs.job_queue import report_stage
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -29,6 +48,11 @@ if not logger.handlers:
     handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     logger.addHandler(handler)
 
+
+class FinancialDataNotFoundError(Exception):
+    """DART에 회사의 재무제표가 없는 경우 (조회 실패와 구분)"""
+
+
 class FinService:
     """
     재무 정보 서비스 파사드 클래스.
@@ -38,18 +62,33 @@ class FinService:
     - FinancialStatementService: 재무제표 관련 기능
     - RatioService: 재무비율 계산 기능
     """
-    def __init__(self, db_session: AsyncSession):
-        """서비스 초기화"""
-        logger.info("FinService가 초기화되었습니다.")
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        dart_api: DartApiService,
+        data_processor: FinancialDataProcessor
+    ):
+        """서비스 초기화
+        
+        DART API 서비스와 데이터 처리기는 애플리케이션 범위 컨테이너에서 주입받아 공유하고,
+        DB 세션에 묶인 하위 서비스만 요청마다 조립합니다.
+        """
         self.db_session = db_session
-        self.company_info_service = CompanyInfoService(db_session)
-        self.financial_statement_service = FinancialStatementService(db_session)
+        self.dart_api = dart_api
+        self.data_processor = data_processor
+        self.company_info_service = CompanyInfoService(db_session, dart_api)
         self.ratio_service = RatioService(db_session)
-        load_dotenv()
-        self.api_key = os.getenv("DART_API_KEY")
-        if not self.api_key:
-            logger.error("DART API 키가 필요합니다.")
-            raise ValueError("DART API 키가 필요합니다.")
+        self.financial_statement_service = FinancialStatementService(
+            db_session,
+            dart_api,
+            data_processor,
+            company_info_service=self.company_info_service,
+            ratio_service=self.ratio_service
+        )
+
+    def with_session(self, db_session: AsyncSession) -> "FinService":
+        """같은 애플리케이션 범위 의존성을 공유하는, 다른 DB 세션용 서비스를 만듭니다."""
+        return FinService(db_session, self.dart_api, self.data_processor)
 
     async def get_company_info(self, company_name: str) -> CompanySchema:
         """회사 정보를 조회합니다."""
@@ -73,40 +112,367 @@ class FinService:
             logger.error(f"재무제표 조회 중 오류 발생: {str(e)}")
             raise
 
-    async def fetch_and_save_financial_data(self, company_name: str, year: Optional[int] = None) -> Dict[str, Any]:
+    async def fetch_and_save_financial_data(
+        self,
+        company_name: str,
+        year: Optional[int] = None,
+        company_info: Optional[CompanySchema] = None
+    ) -> Dict[str, Any]:
         """회사명으로 재무제표 데이터를 조회하고 저장합니다.
         
         Args:
             company_name: 회사명
             year: 조회할 연도. None이면 최신 연도의 데이터를 조회
+            company_info: 이미 확인한 회사 정보
         """
         logger.info(f"재무제표 데이터 조회 및 저장 시작 - 회사: {company_name}, 연도: {year}")
-        return await self.financial_statement_service.fetch_and_save_financial_data(company_name, year)
+        return await self.financial_statement_service.fetch_and_save_financial_data(company_name, year, company_info)
+
+    async def bulk_ingest_financial_data(
+        self,
+        corp_codes: List[str],
+        listed_universe: bool = False,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """여러 회사의 재무제표를 배치 우선순위로 일괄 적재합니다.
+        
+        Args:
+            corp_codes: 기업 고유번호 목록
+            listed_universe: True이면 기업 고유번호 인덱스의 전체 상장사를 대상으로 함
+            year: 조회할 연도. None이면 직전 연도의 데이터를 조회
+        """
+        with dart_priority(DartPriority.BATCH):
+            if listed_universe:
+                await corp_code_index.ensure_loaded(self.dart_api.download_corp_code_archive)
+                corp_codes = corp_code_index.listed_corp_codes()
+            logger.info(f"재무제표 일괄 적재 시작 - {len(corp_codes)}개사, 연도: {year}")
+            return await self.financial_statement_service.bulk_ingest_financial_data(corp_codes, year)
+
+    async def run_bulk_ingest_job(
+        self,
+        corp_codes: List[str],
+        listed_universe: bool = False,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """작업 큐에서 실행되는 일괄 적재 작업. 요청과 분리된 독립 세션을 사용합니다.
+        
+        회사별 저장 실패는 결과의 failed에 기록되며, 전체 조회가 실패한 경우에만 작업이 실패합니다.
+        """
+        async with async_session() as session:
+            result = await self.with_session(session).bulk_ingest_financial_data(corp_codes, listed_universe, year)
+            await session.commit()
+        if result["status"] != "success":
+            raise RuntimeError(result["message"])
+        return result["data"]
 
     async def get_financial_metrics(self, company_name: str) -> FinancialMetricsResponse:
+        """회사의 재무 지표를 반환합니다.
+        
+        응답 캐시(L1/L2)에 있으면 그대로 반환하고, 없으면 계산한 결과를 캐시에 저장합니다.
+        동시에 들어온 같은 회사의 요청은 한 번의 계산을 공유합니다.
+        캐시 키는 기업 고유번호 기준이므로 새 공시가 반영되면 정확히 해당 회사만 무효화됩니다.
+        """
+        company_info = await self.get_company_info(company_name)
+        return await self._get_financial_metrics(company_info, company_name)
+
+    async def get_financial_metrics_by_corp_code(self, corp_code: str) -> FinancialMetricsResponse:
+        """기업 고유번호로 회사의 재무 지표를 반환합니다.
+        
+        회사명은 중복될 수 있으므로 회사명을 거치지 않고 요청된 기업 고유번호의 회사를 조회합니다.
+        """
+        company_info = await self.company_info_service.get_company_info_by_corp_code(corp_code)
+        return await self._get_financial_metrics(company_info, company_info.corp_name)
+
+    async def _get_financial_metrics(self, company_info: CompanySchema, company_name: str) -> FinancialMetricsResponse:
+        # 사전 적재 대상 선정을 위한 접근 빈도 기록 (확인된 회사만, 기업 고유번호 기준)
+        company_access_tracker.record(company_info.corp_code)
+        key = metrics_cache_key(company_info.corp_code)
+        try:
+            metrics = await response_cache.get_or_load(
+                key,
+                lambda: self._load_financial_metrics(company_info, company_name),
+                FinancialMetricsResponse,
+                settings.FIN_METRICS_CACHE_TTL
+            )
+        except FinancialDataNotFoundError:
+            metrics = await self._cache_not_found(key, company_name)
+        if metrics.companyName != company_name:
+            metrics = metrics.model_copy(update={"companyName": company_name})
+        return metrics
+
+    async def run_financial_metrics_job(self, company_name: str) -> Dict[str, Any]:
+        """작업 큐에서 실행되는 재무 지표 적재 작업. 요청과 분리된 독립 세션을 사용합니다.
+        
+        DART 조회에 실패했거나 재무제표가 없으면 빈 결과로 성공 처리하지 않고 작업을 실패시킵니다.
+        """
+        async with async_session() as session:
+            metrics = await self.with_session(session).get_financial_metrics(company_name)
+            await session.commit()
+        if not metrics.financialMetrics.years:
+            raise FinancialDataNotFoundError(f"{company_name}의 재무제표 데이터를 찾을 수 없습니다.")
+        return metrics.model_dump()
+
+    async def is_cold(self, corp_code: str) -> bool:
+        """응답 캐시와 DB 어디에도 데이터가 없어 DART 조회가 필요한 회사인지 확인합니다."""
+        if await response_cache.expires_in(metrics_cache_key(corp_code), FinancialMetricsResponse) is not None:
+            return False
+        if write_behind_queue.is_pending(corp_code):
+            return False
+        return not await has_financial_data(self.db_session, corp_code)
+
+    async def refresh_financial_metrics(self, corp_code: str, lead_time: float = 0) -> bool:
+        """캐시된 재무 지표가 없거나 lead_time 초 안에 만료되면 미리 다시 계산하여 캐시에 저장합니다.
+        
+        Args:
+            corp_code: 기업 고유번호
+            lead_time: 남은 유효 시간이 이보다 짧으면 다시 적재
+        
+        Returns:
+            다시 적재했으면 True, 캐시가 충분히 유효하여 건너뛰었으면 False
+        """
+        company_info = await self.company_info_service.get_company_info_by_corp_code(corp_code)
+        company_name = company_info.corp_name
+        key = metrics_cache_key(company_info.corp_code)
+        remaining = await response_cache.expires_in(key, FinancialMetricsResponse)
+        if remaining is not None and remaining > lead_time:
+            return False
+        try:
+            await response_cache.refresh(
+                key,
+                lambda: self._load_financial_metrics(company_info, company_name),
+                FinancialMetricsResponse,
+                settings.FIN_METRICS_CACHE_TTL
+            )
+        except FinancialDataNotFoundError:
+            await self._cache_not_found(key, company_name)
+        return True
+
+    async def _cache_not_found(self, key: str, company_name: str) -> FinancialMetricsResponse:
+        """재무제표가 없는 회사의 빈 응답을 짧은 TTL로 캐시합니다.
+        
+        조회 실패는 캐시하지 않고, DART에 데이터가 없다고 확인된 경우만 반복 조회를 막기 위해 캐시합니다.
+        """
+        metrics = self._empty_metrics_response(company_name)
+        await response_cache.set(key, metrics, settings.FIN_METRICS_NEGATIVE_TTL)
+        return metrics
+
+    async def _revalidate_stored_metrics(
+        self,
+        company_info: CompanySchema,
+        company_name: str,
+        stored_metrics: FinancialMetricsResponse,
+        source_updated_at: Optional[datetime]
+    ) -> bool:
+        """저장된 지표 스냅샷의 원천 재무제표(최신 연도)에 재무제표와 같은 신선도 정책을 적용합니다.
+        
+        Returns:
+            갱신을 기다려 성공했으면 True (스냅샷 대신 갱신된 재무제표로 다시 계산)
+        """
+        if not settings.FIN_FRESHNESS_ENABLED or source_updated_at is None:
+            return False
+        return await self.financial_statement_service.revalidate(
+            company_info.corp_code,
+            company_name,
+            stored_metrics.financialMetrics.years[0],
+            source_updated_at,
+            (datetime.now() - source_updated_at).total_seconds(),
+            latest_requested=True
+        )
+
+    async def _load_financial_metrics(self, company_info: CompanySchema, company_name: str) -> FinancialMetricsResponse:
         """회사의 재무 지표를 계산하고 반환합니다."""
-        logger.info(f"재무 지표 계산 시작 - 회사: {company_name}")
+        logger.info(f"재무 지표 계산 시작 - 회사: {company_name}({company_info.corp_code})")
         try:
-            # 회사 정보 먼저 조회
-            company_info = await self.get_company_info(company_name)
+            # 사전 계산된 지표가 최신이면 그대로 반환
+            report_stage("stored_metrics", "저장된 재무 지표 확인")
+            stored = await self.ratio_service.get_stored_metrics(company_info.corp_code, company_name)
+            if stored is not None:
+                stored_metrics, source_updated_at = stored
+                if not await self._revalidate_stored_metrics(company_info, company_name, stored_metrics, source_updated_at):
+                    logger.info(f"저장된 재무 지표를 반환합니다: {company_name}")
+                    return stored_metrics
+                logger.info(f"원천 재무제표를 갱신하여 재무 지표를 다시 계산합니다: {company_name}")
             
             # 최근 3개년도 데이터를 모두 조회하기 위해 year=None으로 설정
-            raw_data = await self.fetch_and_save_financial_data(company_name, None)
+            raw_data = await self.fetch_and_save_financial_data(company_name, None, company_info)
             
-            if raw_data["status"] != "success" or not raw_data.get("data"):
-                return self._empty_metrics_response(company_name)
+            if raw_data["status"] != "success":
+                if raw_data.get("reason") == NO_DATA:
+                    raise FinancialDataNotFoundError(raw_data["message"])
+                raise RuntimeError(f"재무제표 조회 실패: {raw_data.get('message')}")
+            if not raw_data.get("data"):
+                raise FinancialDataNotFoundError("재무제표 데이터를 찾을 수 없습니다.")
 
             # RatioService를 사용하여 재무 지표 계산
-            return await self.ratio_service.get_financial_metrics(
+            report_stage("metrics", "재무 지표 계산")
+            metrics = await self.ratio_service.get_financial_metrics(
                 company_info.corp_code,
                 company_name,
                 raw_data["data"]
             )
+            
+            # 다음 요청에서 재사용할 수 있도록 지표 스냅샷 저장 (실패해도 응답은 반환)
+            if settings.WRITE_BEHIND_ENABLED:
+                write_behind_queue.submit_metrics_snapshot(company_info.corp_code, metrics)
+                return metrics
+            try:
+                await self.ratio_service.save_metrics_snapshot(company_info.corp_code, metrics)
+            except Exception as e:
+                logger.warning(f"재무 지표 스냅샷 저장 실패: {str(e)}")
+                await self.db_session.rollback()
+            
+            return metrics
 
         except Exception as e:
             logger.error(f"재무 지표 계산 중 오류 발생: {str(e)}")
             raise
 
+    async def get_financial_metrics_batch(
+        self,
+        company_names: List[str],
+        corp_codes: List[str]
+    ) -> List[BatchFinancialItem]:
+        """여러 회사의 재무 지표를 일괄 조회합니다.
+        
+        DB에 데이터가 있는 회사는 한 번의 집합 쿼리로 처리하고, 나머지 회사만
+        제한된 동시성으로 DART에서 조회합니다. 저장된 재무제표에는 단건 조회와 같은 신선도 정책을 적용하여
+        soft TTL이 지난 회사는 백그라운드 갱신을 예약하고, hard TTL이 지난 회사는 단건 조회 경로로 처리합니다.
+        회사별 오류는 해당 항목에만 기록됩니다.
+        
+        Args:
+            company_names: 회사명 목록
+            corp_codes: 기업 고유번호 목록
+            
+        Returns:
+            요청 순서대로 정렬된 회사별 결과
+        """
+        logger.info(f"재무 지표 일괄 조회 시작 - 회사명 {len(company_names)}건, 고유번호 {len(corp_codes)}건")
+        queries = list(dict.fromkeys(
+            [(name, "name") for name in company_names] + [(code, "corp_code") for code in corp_codes]
+        ))
+        
+        # 1. 회사 식별 (인메모리 인덱스 → DB 일괄 조회)
+        resolved: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        names_for_db, codes_for_db = [], []
+        for value, kind in queries:
+            record = corp_code_index.get_by_name(value) if kind == "name" else corp_code_index.get_by_corp_code(value)
+            if record:
+                resolved[(value, kind)] = (record[0], record[1])
+            elif kind == "name":
+                names_for_db.append(value)
+            else:
+                codes_for_db.append(value)
+        
+        for row in await get_companies_by_names(self.db_session, names_for_db):
+            resolved[(row["corp_name"], "name")] = (row["corp_code"], row["corp_name"])
+        for row in await get_companies_by_corp_codes(self.db_session, codes_for_db):
+            resolved[(row["corp_code"], "corp_code")] = (row["corp_code"], row["corp_name"])
+        
+        # 2. DB에 있는 회사는 한 번의 집합 쿼리로 조회
+        rows_by_corp_code = await get_recent_financials_by_corp_codes(
+            self.db_session,
+            list({corp_code for corp_code, _ in resolved.values()})
+        )
+        
+        # 적재된 회사들의 재무 지표는 하나의 배열 연산으로 계산
+        stored = {
+            corp_code: corp_name
+            for corp_code, corp_name in resolved.values()
+            if rows_by_corp_code.get(corp_code) and self._serve_stored_in_batch(corp_code, rows_by_corp_code[corp_code])
+        }
+        computed: Dict[str, Any] = {}
+        if stored:
+            try:
+                computed = self.ratio_service.build_metrics_responses(
+                    stored,
+                    [row for corp_code in stored for row in rows_by_corp_code[corp_code]]
+                )
+            except Exception as e:
+                # 일괄 계산이 실패하면 회사별로 다시 계산하여 오류를 해당 항목에만 남김
+                logger.warning(f"일괄 재무 지표 계산 실패, 회사별로 재시도합니다: {str(e)}")
+        
+        results: Dict[Tuple[str, str], BatchFinancialItem] = {}
+        misses = []
+        for key in queries:
+            value, kind = key
+            target = resolved.get(key)
+            if target and target[0] in stored:
+                corp_code, corp_name = target
+                try:
+                    data = computed.get(corp_code)
+                    if data is None:
+                        data = await self.ratio_service.get_financial_metrics(
+                            corp_code, corp_name, rows_by_corp_code[corp_code]
+                        )
+                    results[key] = BatchFinancialItem(query=value, corp_code=corp_code, status="success", data=data)
+                except Exception as e:
+                    results[key] = BatchFinancialItem(query=value, corp_code=corp_code, status="error", error=str(e))
+            elif target is None and kind == "corp_code":
+                results[key] = BatchFinancialItem(
+                    query=value, status="error", error=f"기업 고유번호 '{value}'을 찾을 수 없습니다."
+                )
+            else:
+                misses.append((key, target))
+        
+        # 3. 나머지는 DART에서 제한된 동시성으로 조회 (항목별 독립 세션)
+        semaphore = asyncio.Semaphore(settings.FIN_BATCH_DART_CONCURRENCY)
+        
+        async def load_miss(key: Tuple[str, str], target: Optional[Tuple[str, str]]) -> None:
+            value = key[0]
+            company_name = target[1] if target else value
+            async with semaphore:
+                try:
+                    with dart_priority(DartPriority.BATCH):
+                        async with async_session() as session:
+                            service = self.with_session(session)
+                            if key[1] == "corp_code":
+                                # 기업 고유번호로 요청된 회사는 이름이 중복되어도 같은 회사를 조회하도록 고유번호로 적재
+                                data = await service.get_financial_metrics_by_corp_code(target[0])
+                            else:
+                                data = await service.get_financial_metrics(company_name)
+                            await session.commit()
+                    record = corp_code_index.get_by_name(company_name)
+                    corp_code = target[0] if target else (record[0] if record else None)
+                    results[key] = BatchFinancialItem(query=value, corp_code=corp_code, status="success", data=data)
+                except Exception as e:
+                    logger.error(f"일괄 조회 항목 실패 - {value}: {str(e)}")
+                    results[key] = BatchFinancialItem(
+                        query=value, corp_code=target[0] if target else None, status="error", error=str(e)
+                    )
+        
+        if misses:
+            logger.info(f"DB 미적재 회사 {len(misses)}건을 DART에서 조회합니다.")
+            await asyncio.gather(*(load_miss(key, target) for key, target in misses))
+        
+        return [results[key] for key in queries]
+
+    def _serve_stored_in_batch(self, corp_code: str, rows: List[Dict[str, Any]]) -> bool:
+        """일괄 조회에서 저장된 재무제표(최신 연도)로 바로 응답해도 되는지 신선도 정책으로 판단합니다.
+        
+        soft TTL이 지났으면 백그라운드 갱신을 예약하고 저장된 데이터로 응답하며, hard TTL이 지났으면
+        False를 반환하여 응답 캐시·지표 스냅샷·갱신 대기를 거치는 단건 조회 경로로 처리하게 합니다.
+        """
+        if not settings.FIN_FRESHNESS_ENABLED:
+            return True
+        latest_year = rows[0]["bsns_year"]
+        updated = [row["updated_at"] for row in rows if row["bsns_year"] == latest_year and row["updated_at"] is not None]
+        if not updated:
+            return True
+        refreshed_at = max(updated)
+        state, target_year = financials_freshness.assess(
+            latest_year,
+            refreshed_at,
+            (datetime.now() - refreshed_at).total_seconds(),
+            latest_requested=True,
+            corp_code=corp_code
+        )
+        if state == FRESH:
+            return True
+        if state == SOFT_STALE:
+            self.financial_statement_service.refresh_in_background(corp_code, target_year)
+            return True
+        return False
+
     async def get_financial_ratios(self, company_name: str, year: Optional[int] = None) -> Dict[str, Any]:
         """회사명으로 재무비율을 조회합니다.
         
@@ -191,4 +557,4 @@ class FinService:
             debtLiquidityData=DebtLiquidityData(
                 debtRatio=[], currentRatio=[], years=[]
             )
-        )
\ No newline at end of file
+        )
@@ -1,4 +1,5 @@
 from typing import List, Dict, Any, Optional
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 import logging
 from app.domain.model.schema.company_schema import CompanySchema
 from app.domain.model.schema.financial_schema import FinancialSchema
@@ -9,15 +10,15 @@ class FinancialDataProcessor:
     def __init__(self):
         pass
 
-    def convert_amount(self, amount_str: Optional[str]) -> float:
-        """금액 문자열을 숫자로 변환합니다."""
+    def convert_amount(self, amount_str: Optional[str]) -> int:
+        """금액 문자열을 원 단위 정수로 변환합니다 (financials 금액 컬럼은 BIGINT)."""
         if not amount_str:
-            return 0.0
+            return 0
         try:
-            return float(amount_str.replace(",", ""))
-        except (ValueError, AttributeError) as e:
+            return int(Decimal(amount_str.replace(",", "")).to_integral_value(rounding=ROUND_HALF_UP))
+        except (InvalidOperation, ValueError, AttributeError) as e:
             logger.warning(f"금액 변환 실패: {amount_str}, 에러: {str(e)}")
-            return 0.0
+            return 0
 
     def deduplicate_statements(self, statements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """중복되는 계정과목을 제거하고 가장 최신의 금액만 남깁니다."""
@@ -28,6 +29,21 @@ class FinancialDataProcessor:
                 latest_statements[key] = stmt
         return list(latest_statements.values())
 
+    def select_preferred_fs_div(self, statements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """연결(CFS)과 별도(OFS) 재무제표가 섞여 있으면 연결 재무제표만 남깁니다.
+
+        연결/별도 구분이 없는 행은 어느 쪽을 선택해도 남깁니다.
+        """
+        preferred = "CFS" if any(stmt.get("fs_div") == "CFS" for stmt in statements) else "OFS"
+        return [stmt for stmt in statements if stmt.get("fs_div") in (preferred, None, "")]
+
+    def group_by_corp_code(self, statements: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """다중회사 응답을 기업 고유번호별로 나눕니다."""
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for stmt in statements:
+            grouped.setdefault(stmt.get("corp_code", ""), []).append(stmt)
+        return grouped
+
     def prepare_statement_data(self, statement: Dict[str, Any], company_info: CompanySchema) -> Dict[str, Any]:
         """재무제표 데이터를 DB 저장 형식으로 변환합니다."""
         return {
@@ -40,6 +56,7 @@ class FinancialDataProcessor:
             "sj_div": statement.get("sj_div", ""),
             "sj_nm": statement.get("sj_nm", ""),
             "account_nm": statement.get("account_nm", ""),
+            "account_id": statement.get("account_id") or None,
             "thstrm_nm": statement.get("thstrm_nm", ""),
             "thstrm_amount": self.convert_amount(statement.get("thstrm_amount", "")),
             "frmtrm_nm": statement.get("frmtrm_nm", ""),
@@ -48,4 +65,29 @@ class FinancialDataProcessor:
             "bfefrmtrm_amount": self.convert_amount(statement.get("bfefrmtrm_amount", "")),
             "ord": int(statement.get("ord", 0)),
             "currency": statement.get("currency", "")
-        } 
\ No newline at end of file
+        }
+
+    def to_stored_rows(self, statement_data: List[Dict[str, Any]], year: Optional[int] = None) -> List[Dict[str, Any]]:
+        """저장 형식의 재무제표를 DB에 저장한 뒤 다시 조회한 것과 같은 행으로 변환합니다.
+
+        저장 시 upsert와 같이 (회사, 연도, 재무제표 구분, 계정)별로 마지막 행만 남기고,
+        조회 쿼리와 같은 순서(연도 내림차순, 재무제표 구분, 정렬 순서)로 정렬합니다.
+        """
+        rows = {
+            (stmt["corp_code"], stmt["bsns_year"], stmt["sj_div"], stmt["account_nm"]): stmt
+            for stmt in statement_data
+            if year is None or stmt["bsns_year"] == str(year)
+        }
+        ordered = sorted(rows.values(), key=lambda stmt: (-int(stmt["bsns_year"]), stmt["sj_div"], stmt["ord"]))
+        return [
+            {
+                "bsns_year": stmt["bsns_year"],
+                "sj_div": stmt["sj_div"],
+                "sj_nm": stmt["sj_nm"],
+                "account_nm": stmt["account_nm"],
+                "thstrm_amount": stmt["thstrm_amount"],
+                "frmtrm_amount": stmt["frmtrm_amount"],
+                "bfefrmtrm_amount": stmt["bfefrmtrm_amount"]
+            }
+            for stmt in ordered
+        ]
@@ -1,9 +1,10 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 import logging
-from sqlalchemy import text
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.model.schema.company_schema import CompanySchema
+from app.domain.model.schema.schema import FinancialMetricsResponse
 from app.domain.model.schema.financial_schema import FinancialSchema
 from app.domain.model.schema.report_schema import ReportSchema
 from app.domain.model.schema.statement_schema import StatementSchema
@@ -11,20 +12,45 @@ from app.domain.repository.fin_repository import (
     delete_financial_statements,
     save_financial_statements
 )
+from app.domain.repository import queries
+from app.domain.repository.hot_read_repository import fetch_financials, fetch_financials_refreshed_at
 from app.domain.service.dart_api_service import DartApiService
 from app.domain.service.financial_data_processor import FinancialDataProcessor
 from app.domain.service.ratio_service import RatioService
 from app.domain.service.company_info_service import CompanyInfoService
+from app.domain.service.filing_invalidation_service import FilingInvalidationService
+from app.domain.service.financials_freshness import FRESH, NO_DATA, SOFT_STALE, financials_freshness
+from app.domain.service.write_behind_queue import (
+    KIND_METRICS_SNAPSHOT,
+    KIND_RATIOS,
+    KIND_STATEMENTS,
+    write_behind_queue
+)
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.dart.corp_code_index import corp_code_index
+from app.foundation.infra.dart.rate_limiter import DartQuotaExceededError, DartRateLimitError
+from app.foundation.infra.database.database import async_session
+from app.foundation.infra.database.ingestion_lock import IngestionLockTimeoutError, ingestion_single_flight
+from app.foundation.infra.database.unit_of_work import invalidate_memo, memoized
+from app.foundation.infra.jobs.job_queue import report_stage
 
 logger = logging.getLogger(__name__)
 
 class FinancialStatementService:
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        dart_api: DartApiService,
+        data_processor: FinancialDataProcessor,
+        company_info_service: Optional[CompanyInfoService] = None,
+        ratio_service: Optional[RatioService] = None
+    ):
         self.db_session = db_session
-        self.dart_api = DartApiService()
-        self.data_processor = FinancialDataProcessor()
-        self.ratio_service = RatioService(db_session)
-        self.company_info_service = CompanyInfoService(db_session)
+        self.dart_api = dart_api
+        self.data_processor = data_processor
+        self.ratio_service = ratio_service or RatioService(db_session)
+        self.company_info_service = company_info_service or CompanyInfoService(db_session, dart_api)
+        self.filing_invalidation = FilingInvalidationService(db_session)
 
     async def get_financial_statements(self, company_info: CompanySchema, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """재무제표 데이터를 조회합니다.
@@ -41,174 +67,372 @@ class FinancialStatementService:
             logger.error(f"재무제표 조회 실패: {str(e)}")
             raise
 
-    async def fetch_and_save_financial_data(self, company_name: str, year: Optional[int] = None) -> Dict[str, Any]:
+    async def fetch_and_save_financial_data(
+        self,
+        company_name: str,
+        year: Optional[int] = None,
+        company_info: Optional[CompanySchema] = None
+    ) -> Dict[str, Any]:
         """회사명으로 재무제표 데이터를 조회하고 저장합니다.
         
         Args:
             company_name: 회사명
             year: 조회할 연도. None이면 직전 연도의 데이터를 조회
+            company_info: 이미 확인한 회사 정보 (기업 고유번호로 요청된 경우 회사명으로 다시 찾지 않음)
         """
         try:
             # 1. 회사 정보 조회
-            company_info = await self.company_info_service.get_company_info(company_name)
+            if company_info is None:
+                report_stage("company_lookup", "회사 정보 조회")
+                company_info = await self.company_info_service.get_company_info(company_name)
             
             # 2. 기존 데이터 확인
-            existing_data = await self._check_existing_data(company_name, year)
+            report_stage("existing_data", "기존 재무제표 확인")
+            existing_data = await self._check_existing_data(company_info.corp_code, year)
             if existing_data:
                 logger.info(f"기존 데이터가 존재합니다: {company_name}, 연도: {year}")
                 return {
                     "status": "success",
                     "message": f"{company_name}의 재무제표 데이터가 이미 존재합니다.",
-                    "data": existing_data
+                    "data": await self._serve_existing_data(company_info, company_name, year, existing_data)
                 }
             
-            # 3. 재무제표 데이터 조회
-            statements = await self.get_financial_statements(company_info, year)
+            # 3. DART 조회와 저장은 회사별로 한 번만 실행 (같은 프로세스의 다른 요청은 결과를 공유)
+            return await ingestion_single_flight.run(
+                (company_info.corp_code, year),
+                lambda: self._ingest_financial_data(company_info, company_name, year)
+            )
             
+        except (DartRateLimitError, DartQuotaExceededError, IngestionLockTimeoutError):
+            # 요청 제한/한도 초과/적재 잠금 대기 초과는 "데이터 없음"이 아니므로 호출자(컨트롤러)가 429/503으로 응답하도록 전달
+            raise
+        except Exception as e:
+            logger.error(f"재무제표 데이터 저장 실패: {str(e)}")
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+
+    async def _serve_existing_data(
+        self,
+        company_info: CompanySchema,
+        company_name: str,
+        year: Optional[int],
+        existing_data: List[Mapping[str, Any]]
+    ) -> List[Mapping[str, Any]]:
+        """저장된 재무제표를 신선도 정책에 따라 반환합니다.
+        
+        soft TTL이 지난 데이터는 바로 반환하면서 백그라운드에서 갱신하고, hard TTL이 지난 데이터만
+        갱신을 기다립니다. DART 갱신이 실패하면 저장된 데이터를 그대로 반환합니다.
+        """
+        if not settings.FIN_FRESHNESS_ENABLED:
+            return existing_data
+        corp_code = company_info.corp_code
+        bsns_year = str(year) if year is not None else max(row["bsns_year"] for row in existing_data)
+        refreshed = await fetch_financials_refreshed_at(self.db_session, corp_code, bsns_year)
+        if refreshed is None:
+            return existing_data
+        if not await self.revalidate(
+            corp_code,
+            company_name,
+            bsns_year,
+            refreshed["refreshed_at"],
+            refreshed["age_seconds"],
+            latest_requested=year is None
+        ):
+            return existing_data
+        invalidate_memo(self.db_session, "financials")
+        return await self._check_existing_data(corp_code, year) or existing_data
+
+    async def revalidate(
+        self,
+        corp_code: str,
+        company_name: str,
+        bsns_year: str,
+        refreshed_at: datetime,
+        age_seconds: float,
+        latest_requested: bool = False
+    ) -> bool:
+        """저장된 연도 데이터에 신선도 정책을 적용하고 필요하면 DART로 갱신합니다.
+        
+        soft TTL이 지났으면 백그라운드 갱신을 예약하고, hard TTL이 지났으면 갱신이 끝날 때까지 기다립니다.
+        
+        Returns:
+            갱신을 기다려 성공했으면 True (호출한 쪽은 저장된 데이터를 다시 읽어야 함)
+        """
+        state, target_year = financials_freshness.assess(
+            bsns_year,
+            refreshed_at,
+            age_seconds,
+            latest_requested=latest_requested,
+            corp_code=corp_code
+        )
+        if state == FRESH:
+            return False
+        
+        if state == SOFT_STALE:
+            self.refresh_in_background(corp_code, target_year)
+            return False
+        
+        logger.info(f"재무제표가 오래되어 갱신 후 반환합니다: {company_name}, 연도: {target_year}")
+        report_stage("refreshing", "오래된 재무제표 갱신")
+        return await financials_freshness.refresh(
+            corp_code,
+            target_year,
+            lambda: self._refresh_in_own_session(corp_code, int(target_year))
+        )
+
+    def refresh_in_background(self, corp_code: str, bsns_year: str) -> None:
+        """요청과 분리된 세션에서 한 회사·연도의 재무제표 갱신을 예약합니다 (같은 회사·연도는 한 번만 실행)."""
+        financials_freshness.refresh_in_background(
+            corp_code,
+            bsns_year,
+            lambda: self._refresh_in_own_session(corp_code, int(bsns_year))
+        )
+
+    async def _refresh_in_own_session(self, corp_code: str, year: int) -> Dict[str, Any]:
+        """요청과 분리된 독립 세션에서 재무제표를 갱신하고 커밋합니다."""
+        async with async_session() as session:
+            service = FinancialStatementService(session, self.dart_api, self.data_processor)
+            result = await service.refresh_financial_data(corp_code, year)
+            if result["status"] == "success":
+                await session.commit()
+        return result
+
+    async def _ingest_financial_data(
+        self,
+        company_info: CompanySchema,
+        company_name: str,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """DART에서 재무제표를 조회하여 저장합니다. 다른 작업자가 같은 회사를 적재 중이면 끝날 때까지 기다립니다.
+        
+        재무제표는 지연 저장을 켜도 잠금을 잡은 이 트랜잭션에서 저장합니다. 잠금은 요청이 커밋될 때 풀리므로,
+        기다리던 작업자는 저장된 행을 확인하고 DART를 다시 호출하지 않습니다.
+        """
+        report_stage("ingest_lock", "적재 잠금 확인")
+        await ingestion_single_flight.lock(self.db_session, company_info.corp_code)
+        # 잠금을 잡기 전에 다른 작업자가 저장을 마쳤으면 DART를 다시 호출하지 않음
+        invalidate_memo(self.db_session, "financials")
+        existing_data = await self._check_existing_data(company_info.corp_code, year)
+        if existing_data:
+            logger.info(f"다른 작업자가 저장한 데이터를 사용합니다: {company_name}, 연도: {year}")
+            return {
+                "status": "success",
+                "message": f"{company_name}의 재무제표 데이터가 이미 존재합니다.",
+                "data": existing_data
+            }
+        
+        # 재무제표 데이터 조회
+        report_stage("dart_fetch", "DART 재무제표 조회")
+        statements = await self.get_financial_statements(company_info, year)
+        
+        if not statements:
+            return {
+                "status": "error",
+                "reason": NO_DATA,
+                "message": "재무제표 데이터를 찾을 수 없습니다."
+            }
+        
+        # 연결/별도 선택 후 중복 제거
+        statements = self.data_processor.select_preferred_fs_div(statements)
+        statements = self.data_processor.deduplicate_statements(statements)
+        
+        # 새로운 데이터 저장
+        statement_data = [self.data_processor.prepare_statement_data(stmt, company_info) for stmt in statements]
+        report_stage("saving", f"재무제표 {len(statements)}건 저장")
+        await self._save_statements(company_info.corp_code, statement_data)
+        
+        bsns_year = statements[0].get("bsns_year") if statements else None
+        if settings.WRITE_BEHIND_ENABLED:
+            # 지연 저장: 재무비율 계산은 응답 이후로 미루고, 재조회 없이 저장한 행을 조회 결과와 같은 형태로 반환
+            if bsns_year:
+                write_behind_queue.submit_ratios(company_info.corp_code, company_info.corp_name, bsns_year)
+            return {
+                "status": "success",
+                "message": f"{company_name}의 재무제표 데이터가 성공적으로 저장되었습니다.",
+                "data": self.data_processor.to_stored_rows(statement_data, year)
+            }
+        
+        # 재무비율 계산 및 저장
+        report_stage("ratios", "재무비율 계산")
+        if bsns_year:
+            await self._calculate_ratios_if_needed(company_info.corp_code, company_info.corp_name, bsns_year)
+        
+        # 저장된 데이터 조회하여 반환
+        report_stage("reading", "저장된 재무제표 조회")
+        saved_data = await self._get_financial_data(company_info.corp_code, year)
+        
+        return {
+            "status": "success",
+            "message": f"{company_name}의 재무제표 데이터가 성공적으로 저장되었습니다.",
+            "data": saved_data
+        }
+
+    async def bulk_ingest_financial_data(self, corp_codes: List[str], year: Optional[int] = None) -> Dict[str, Any]:
+        """여러 회사의 재무제표를 다중회사 API로 일괄 조회하여 저장합니다.
+        
+        Args:
+            corp_codes: 기업 고유번호 목록
+            year: 조회할 연도. None이면 직전 연도의 데이터를 조회
+        """
+        target_year = year if isinstance(year, int) else datetime.now().year - 1
+        try:
+            await corp_code_index.ensure_loaded(self.dart_api.download_corp_code_archive)
+            report_stage("dart_fetch", f"DART 다중회사 재무제표 조회 ({len(corp_codes)}개사)")
+            statements = await self.dart_api.fetch_multi_financial_statements(corp_codes, target_year)
+            
+            grouped = self.data_processor.group_by_corp_code(statements)
+            report_stage("saving", f"재무제표 저장 ({len(grouped)}개사)")
+            saved, skipped, failed = [], [], []
+            for corp_code, company_statements in grouped.items():
+                record = corp_code_index.get_by_corp_code(corp_code)
+                if record is None:
+                    logger.warning(f"기업 고유번호 인덱스에 없는 회사입니다: {corp_code}")
+                    skipped.append(corp_code)
+                    continue
+                
+                now = datetime.now().isoformat()
+                company_info = CompanySchema(
+                    corp_code=record[0],
+                    corp_name=record[1],
+                    stock_code=record[2],
+                    created_at=now,
+                    updated_at=now
+                )
+                company_statements = self.data_processor.select_preferred_fs_div(company_statements)
+                company_statements = self.data_processor.deduplicate_statements(company_statements)
+                statement_data = [
+                    self.data_processor.prepare_statement_data(stmt, company_info) for stmt in company_statements
+                ]
+                # 회사별로 커밋되므로 한 회사의 저장 실패는 기록만 하고 나머지 회사를 계속 저장
+                try:
+                    await self._save_statements(corp_code, statement_data)
+                except Exception as e:
+                    logger.error(f"다중회사 재무제표 저장 실패 - {corp_code}: {str(e)}")
+                    await self.db_session.rollback()
+                    failed.append({"corp_code": corp_code, "error": str(e)})
+                    continue
+                saved.append(corp_code)
+            
+            missing = sorted(set(corp_codes) - set(saved) - set(skipped) - {item["corp_code"] for item in failed})
+            logger.info(
+                f"다중회사 재무제표 저장 완료 - 저장 {len(saved)}개사, 실패 {len(failed)}개사, 데이터 없음 {len(missing)}개사"
+            )
+            return {
+                "status": "success",
+                "message": f"{len(saved)}개사의 {target_year}년도 재무제표 데이터가 저장되었습니다.",
+                "data": {
+                    "bsns_year": str(target_year),
+                    "saved": saved,
+                    "skipped": skipped,
+                    "failed": failed,
+                    "missing": missing
+                }
+            }
+        except (DartRateLimitError, DartQuotaExceededError):
+            raise
+        except Exception as e:
+            logger.error(f"다중회사 재무제표 저장 실패: {str(e)}")
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+
+    async def refresh_financial_data(self, corp_code: str, year: int) -> Dict[str, Any]:
+        """기존 데이터 여부와 관계없이 한 회사·연도의 재무제표를 DART에서 다시 조회하여 저장합니다.
+        
+        새 공시나 정정 공시가 접수된 회사를 갱신할 때 사용합니다.
+        
+        Args:
+            corp_code: 기업 고유번호
+            year: 갱신할 사업연도
+        """
+        try:
+            company_info = await self.company_info_service.get_company_info_by_corp_code(corp_code)
+            statements = await self.get_financial_statements(company_info, year)
             if not statements:
                 return {
                     "status": "error",
+                    "reason": NO_DATA,
                     "message": "재무제표 데이터를 찾을 수 없습니다."
                 }
             
-            # 4. 중복 제거
+            statements = self.data_processor.select_preferred_fs_div(statements)
             statements = self.data_processor.deduplicate_statements(statements)
-            
-            # 5. 새로운 데이터 저장
             statement_data = [self.data_processor.prepare_statement_data(stmt, company_info) for stmt in statements]
-            await save_financial_statements(self.db_session, statement_data)
-            
-            # 6. 재무비율 계산 및 저장
-            bsns_year = statements[0].get("bsns_year") if statements else None
-            if bsns_year:
-                await self._calculate_ratios_if_needed(company_info.corp_code, company_info.corp_name, bsns_year)
-            
-            # 7. 저장된 데이터 조회하여 반환
-            saved_data = await self._get_financial_data(company_name, year)
+            await self._save_statements(corp_code, statement_data)
+            await self._calculate_ratios_if_needed(corp_code, company_info.corp_name, str(year))
             
+            logger.info(f"재무제표 갱신 완료 - 회사: {company_info.corp_name}({corp_code}), 연도: {year}")
             return {
                 "status": "success",
-                "message": f"{company_name}의 재무제표 데이터가 성공적으로 저장되었습니다.",
-                "data": saved_data
+                "message": f"{company_info.corp_name}의 {year}년도 재무제표가 갱신되었습니다."
             }
-            
         except Exception as e:
-            logger.error(f"재무제표 데이터 저장 실패: {str(e)}")
+            logger.error(f"재무제표 갱신 실패 - {corp_code}, {year}: {str(e)}")
             return {
                 "status": "error",
                 "message": str(e)
             }
 
-    async def _check_existing_data(self, company_name: str, year: Optional[int] = None) -> List[Dict[str, Any]]:
-        """기존 데이터를 확인합니다."""
-        try:
-            if year is not None:
-                query = text("""
-                    SELECT f.bsns_year, f.sj_div, s.sj_nm, f.account_nm, 
-                           f.thstrm_amount, f.frmtrm_amount, f.bfefrmtrm_amount
-                    FROM financials f
-                    JOIN companies c ON f.corp_code = c.corp_code
-                    JOIN statement s ON f.sj_div = s.sj_div
-                    WHERE c.corp_name = :company_name
-                    AND f.bsns_year = :year
-                    ORDER BY f.bsns_year DESC, f.sj_div, f.ord
-                """)
-                result = await self.db_session.execute(query, {
-                    "company_name": company_name,
-                    "year": str(year)
-                })
-            else:
-                query = text("""
-                    SELECT f.bsns_year, f.sj_div, s.sj_nm, f.account_nm, 
-                           f.thstrm_amount, f.frmtrm_amount, f.bfefrmtrm_amount
-                    FROM financials f
-                    JOIN companies c ON f.corp_code = c.corp_code
-                    JOIN statement s ON f.sj_div = s.sj_div
-                    WHERE c.corp_name = :company_name
-                    ORDER BY f.bsns_year DESC, f.sj_div, f.ord
-                """)
-                result = await self.db_session.execute(query, {
-                    "company_name": company_name
-                })
-            
-            # 결과를 딕셔너리로 변환
-            data = []
-            for row in result:
-                row_dict = {}
-                for idx, column in enumerate(result.keys()):
-                    row_dict[column] = row[idx]
-                data.append(row_dict)
-            
-            return data
-        except Exception as e:
-            logger.error(f"데이터 확인 중 오류 발생: {str(e)}")
-            return []
+    async def persist_write_behind(self, item: Dict[str, Any]) -> None:
+        """지연 저장 대기열의 작업을 DB에 반영합니다 (write_behind_queue 작업자에서 호출)."""
+        if item["kind"] in (KIND_RATIOS, KIND_STATEMENTS):
+            bsns_year = item.get("bsns_year")
+            if item["kind"] == KIND_STATEMENTS:
+                # 이전 버전이 스필 파일에 남긴 작업은 재무제표부터 저장
+                statement_data = item["statements"]
+                await self._save_statements(item["corp_code"], statement_data)
+                bsns_year = statement_data[0]["bsns_year"] if statement_data else None
+            if bsns_year:
+                await self._calculate_ratios_if_needed(item["corp_code"], item["corp_name"], bsns_year)
+            # 함께 예약된 지표 스냅샷은 재무비율을 저장한 뒤에 저장
+            if item.get("response") is not None:
+                response = FinancialMetricsResponse.model_validate(item["response"])
+                await self.ratio_service.save_metrics_snapshot(item["corp_code"], response)
+        elif item["kind"] == KIND_METRICS_SNAPSHOT:
+            response = FinancialMetricsResponse.model_validate(item["response"])
+            await self.ratio_service.save_metrics_snapshot(item["corp_code"], response)
+        else:
+            logger.warning(f"알 수 없는 지연 저장 작업입니다: {item['kind']}")
 
-    async def _get_financial_data(self, company_name: str, year: Optional[int] = None) -> List[Dict[str, Any]]:
-        """저장된 재무제표 데이터를 조회합니다."""
-        try:
-            if year is not None:
-                query = text("""
-                    SELECT f.bsns_year, f.sj_div, s.sj_nm, f.account_nm, 
-                           f.thstrm_amount, f.frmtrm_amount, f.bfefrmtrm_amount
-                    FROM financials f
-                    JOIN companies c ON f.corp_code = c.corp_code
-                    JOIN statement s ON f.sj_div = s.sj_div
-                    WHERE c.corp_name = :company_name
-                    AND f.bsns_year = :year
-                    ORDER BY f.bsns_year DESC, f.sj_div, f.ord
-                """)
-                result = await self.db_session.execute(query, {
-                    "company_name": company_name,
-                    "year": str(year)
-                })
-            else:
-                # 최근 3개년도 데이터 조회
-                query = text("""
-                    SELECT f.bsns_year, f.sj_div, s.sj_nm, f.account_nm, 
-                           f.thstrm_amount, f.frmtrm_amount, f.bfefrmtrm_amount
-                    FROM financials f
-                    JOIN companies c ON f.corp_code = c.corp_code
-                    JOIN statement s ON f.sj_div = s.sj_div
-                    WHERE c.corp_name = :company_name
-                    AND f.bsns_year IN (
-                        SELECT DISTINCT bsns_year 
-                        FROM financials f2
-                        JOIN companies c2 ON f2.corp_code = c2.corp_code
-                        WHERE c2.corp_name = :company_name
-                        ORDER BY bsns_year DESC
-                        LIMIT 3
-                    )
-                    ORDER BY f.bsns_year DESC, f.sj_div, f.ord
-                """)
-                result = await self.db_session.execute(query, {
-                    "company_name": company_name
-                })
-            
-            # 결과를 딕셔너리로 변환
-            data = []
-            for row in result:
-                row_dict = {}
-                for idx, column in enumerate(result.keys()):
-                    row_dict[column] = row[idx]
-                data.append(row_dict)
-            
-            return data
-        except Exception as e:
-            logger.error(f"데이터 조회 중 오류 발생: {str(e)}")
-            return []
+    async def _save_statements(self, corp_code: str, statement_data: List[Dict[str, Any]]) -> None:
+        """재무제표를 저장하고, 새 공시(접수번호)가 반영되었으면 해당 회사의 지표와 캐시를 무효화합니다."""
+        new_filing_years = await self.filing_invalidation.find_new_filing_years(corp_code, statement_data)
+        await save_financial_statements(self.db_session, statement_data)
+        invalidate_memo(self.db_session, "financials")
+        await self.filing_invalidation.invalidate(corp_code, new_filing_years)
+
+    async def _check_existing_data(self, corp_code: str, year: Optional[int] = None) -> List[Mapping[str, Any]]:
+        """기존 데이터를 확인합니다. 같은 요청(세션) 안에서는 저장 전까지 한 번만 조회합니다."""
+        return await memoized(
+            self.db_session,
+            ("financials", "existing", corp_code, year),
+            lambda: self._query_existing_data(corp_code, year)
+        )
+
+    async def _query_existing_data(self, corp_code: str, year: Optional[int] = None) -> List[Mapping[str, Any]]:
+        # 조회 오류는 "데이터 없음"으로 메모되지 않도록 호출한 쪽으로 전달
+        return await fetch_financials(self.db_session, corp_code, year)
+
+    async def _get_financial_data(self, corp_code: str, year: Optional[int] = None) -> List[Mapping[str, Any]]:
+        """저장된 재무제표 데이터를 조회합니다. 같은 요청(세션) 안에서는 저장 전까지 한 번만 조회합니다."""
+        return await memoized(
+            self.db_session,
+            ("financials", "recent", corp_code, year),
+            lambda: self._query_financial_data(corp_code, year)
+        )
+
+    async def _query_financial_data(self, corp_code: str, year: Optional[int] = None) -> List[Mapping[str, Any]]:
+        # 연도가 없으면 최근 3개년도 데이터 조회
+        return await fetch_financials(self.db_session, corp_code, year, recent_years=3)
 
     async def _calculate_ratios_if_needed(self, corp_code: str, corp_name: str, bsns_year: str) -> None:
         """재무비율 데이터가 없을 경우 계산하고 저장합니다."""
         try:
             # 기존 재무비율 데이터 확인
-            ratio_check_query = text("""
-                SELECT 1 FROM metrics 
-                WHERE corp_code = :corp_code 
-                AND bsns_year = :bsns_year
-                LIMIT 1
-            """)
-            ratio_result = await self.db_session.execute(ratio_check_query, {
+            ratio_result = await self.db_session.execute(queries.EXISTS_METRICS_FOR_YEAR, {
                 "corp_code": corp_code,
                 "bsns_year": bsns_year
             })
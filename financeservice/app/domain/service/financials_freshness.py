@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.dart.rate_limiter import DartPriority, dart_priority
+
+logger = logging.getLogger(__name__)
+
+FRESH = "fresh"
+SOFT_STALE = "soft_stale"
+HARD_STALE = "hard_stale"
+
+# DART에 해당 회사의 재무제표가 없는 경우(요청 실패와 구분)의 조회·갱신 결과 사유
+NO_DATA = "no_data"
+
+RefreshResult = Dict[str, Any]
+
+
+def filing_deadline(bsns_year: str) -> date:
+    """사업보고서 제출기한 (12월 결산 법인 기준, 사업연도 종료 후 90일)"""
+    return date(int(bsns_year) + 1, 3, 31)
+
+
+class FinancialsFreshness:
+    """저장된 재무제표의 신선도 정책과 stale-while-revalidate 갱신을 담당합니다.
+
+    회사·연도별 마지막 갱신 시각(updated_at)과 공시 일정으로 상태를 판단합니다.
+    - fresh: 그대로 반환
+    - soft_stale: 저장된 데이터를 바로 반환하고 백그라운드에서 DART로 갱신
+    - hard_stale: 갱신이 끝날 때까지 기다린 뒤 반환 (DART 실패 시 저장된 데이터 반환)
+
+    사업보고서 제출기한과 정정 기간(filing_grace_days)이 지난 뒤에 갱신된 연도는 확정된 것으로 보고
+    더 긴 TTL을 적용합니다. 같은 회사·연도의 갱신은 한 번만 실행하며, 실패한 갱신은
+    retry_interval 동안 다시 시도하지 않습니다. DART에 데이터가 없던 사업연도(결산월이 12월이 아니거나
+    상장폐지·제출 지연)는 missing_retry_interval 동안 다시 조회하지 않고 저장된 최신 연도를 기준으로 판단합니다.
+    """
+
+    def __init__(
+        self,
+        soft_ttl: int,
+        hard_ttl: int,
+        settled_soft_ttl: int,
+        settled_hard_ttl: int,
+        filing_grace_days: int,
+        retry_interval: int,
+        missing_retry_interval: int
+    ):
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.settled_soft_ttl = settled_soft_ttl
+        self.settled_hard_ttl = settled_hard_ttl
+        self.filing_grace = timedelta(days=filing_grace_days)
+        self.retry_interval = retry_interval
+        self.missing_retry_interval = missing_retry_interval
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._last_attempt: Dict[Tuple[str, str], float] = {}
+        # DART에 데이터가 없다고 확인된 회사·연도와 확인 시각
+        self._missing: Dict[Tuple[str, str], float] = {}
+        self._stats = {
+            FRESH: 0,
+            SOFT_STALE: 0,
+            HARD_STALE: 0,
+            "background_refreshes": 0,
+            "blocking_refreshes": 0,
+            "refresh_failures": 0,
+            "served_stale_on_failure": 0,
+            "throttled": 0,
+            "missing_years": 0,
+            "missing_year_skips": 0
+        }
+
+    # ------------------------------------------------------------------
+    # 정책
+    # ------------------------------------------------------------------
+    def assess(
+        self,
+        bsns_year: str,
+        refreshed_at: datetime,
+        age_seconds: float,
+        latest_requested: bool = False,
+        today: Optional[date] = None,
+        corp_code: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """저장된 연도 데이터의 상태와 갱신할 사업연도를 반환합니다.
+
+        Args:
+            bsns_year: 저장된 사업연도 (최신 연도 요청이면 저장된 가장 최근 연도)
+            refreshed_at: 해당 연도 데이터의 마지막 갱신 시각
+            age_seconds: 마지막 갱신 후 지난 시간(초)
+            latest_requested: 연도를 지정하지 않은(직전 연도) 요청인지 여부
+            corp_code: 기업 고유번호 (DART에 없던 직전 연도를 다시 조회하지 않기 위해 사용)
+        """
+        today = today or date.today()
+        settled_on = filing_deadline(bsns_year) + self.filing_grace
+        if today > settled_on and refreshed_at.date() > settled_on:
+            soft_ttl, hard_ttl = self.settled_soft_ttl, self.settled_hard_ttl
+        else:
+            soft_ttl, hard_ttl = self.soft_ttl, self.hard_ttl
+
+        if age_seconds >= hard_ttl:
+            state = HARD_STALE
+        elif age_seconds >= soft_ttl:
+            state = SOFT_STALE
+        else:
+            state = FRESH
+
+        # 직전 연도 사업보고서 제출기한이 지났는데 저장된 최신 연도가 그보다 이전이면 새 보고서를 가져옴
+        target_year = bsns_year
+        expected_year = str(today.year - 1)
+        if latest_requested and bsns_year < expected_year and today > filing_deadline(expected_year):
+            if corp_code is not None and self._recently_missing((corp_code, expected_year)):
+                self._stats["missing_year_skips"] += 1
+            else:
+                target_year = expected_year
+                if state == FRESH:
+                    state = SOFT_STALE
+
+        self._stats[state] += 1
+        return state, target_year
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def refresh_in_background(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        run: Callable[[], Awaitable[RefreshResult]]
+    ) -> bool:
+        """백그라운드 갱신을 예약합니다. 이미 진행 중이거나 최근에 실패했으면 예약하지 않습니다."""
+        key = (corp_code, bsns_year)
+        if key in self._inflight or not self._attempt_allowed(key):
+            return False
+        self._stats["background_refreshes"] += 1
+        self._start(key, run)
+        return True
+
+    async def refresh(
+        self,
+        corp_code: str,
+        bsns_year: str,
+        run: Callable[[], Awaitable[RefreshResult]]
+    ) -> bool:
+        """갱신이 끝날 때까지 기다립니다. 진행 중인 갱신이 있으면 그 결과를 기다립니다.
+
+        Returns:
+            갱신에 성공했으면 True. 실패했거나 최근 실패로 시도하지 않았으면 False
+        """
+        key = (corp_code, bsns_year)
+        task = self._inflight.get(key)
+        if task is None:
+            if not self._attempt_allowed(key):
+                self._stats["served_stale_on_failure"] += 1
+                return False
+            self._stats["blocking_refreshes"] += 1
+            task = self._start(key, run)
+        succeeded = await asyncio.shield(task)
+        if not succeeded:
+            self._stats["served_stale_on_failure"] += 1
+        return succeeded
+
+    def _attempt_allowed(self, key: Tuple[str, str]) -> bool:
+        last_attempt = self._last_attempt.get(key)
+        if last_attempt is not None and time.monotonic() - last_attempt < self.retry_interval:
+            self._stats["throttled"] += 1
+            return False
+        if self._recently_missing(key):
+            self._stats["throttled"] += 1
+            return False
+        return True
+
+    def _recently_missing(self, key: Tuple[str, str]) -> bool:
+        found_missing_at = self._missing.get(key)
+        return found_missing_at is not None and time.monotonic() - found_missing_at < self.missing_retry_interval
+
+    def _start(self, key: Tuple[str, str], run: Callable[[], Awaitable[RefreshResult]]) -> asyncio.Task:
+        now = time.monotonic()
+        # 재시도 제한 시간이 지난 기록 정리
+        for expired in [k for k, at in self._last_attempt.items() if now - at >= self.retry_interval]:
+            del self._last_attempt[expired]
+        for expired in [k for k, at in self._missing.items() if now - at >= self.missing_retry_interval]:
+            del self._missing[expired]
+        self._last_attempt[key] = now
+        task = asyncio.create_task(self._run(key, run))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def _run(self, key: Tuple[str, str], run: Callable[[], Awaitable[RefreshResult]]) -> bool:
+        corp_code, bsns_year = key
+        try:
+            with dart_priority(DartPriority.BACKGROUND):
+                result = await run()
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        if result.get("status") != "success":
+            if result.get("reason") == NO_DATA:
+                # 아직 공시되지 않은 연도는 실패로 보지 않고 missing_retry_interval 동안 다시 조회하지 않음
+                self._missing[key] = time.monotonic()
+                self._stats["missing_years"] += 1
+                logger.info(f"DART에 재무제표가 없어 저장된 데이터를 계속 사용합니다 - {corp_code}, {bsns_year}")
+                return False
+            self._stats["refresh_failures"] += 1
+            logger.warning(f"재무제표 갱신 실패, 저장된 데이터를 계속 사용합니다 - {corp_code}, {bsns_year}: {result.get('message')}")
+            return False
+        # 성공한 갱신은 재시도 제한 대상이 아님
+        self._last_attempt.pop(key, None)
+        self._missing.pop(key, None)
+        return True
+
+    async def stop(self) -> None:
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._inflight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "inflight": len(self._inflight), "missing_tracked": len(self._missing)}
+
+
+financials_freshness = FinancialsFreshness(
+    soft_ttl=settings.FIN_FRESH_SOFT_TTL,
+    hard_ttl=settings.FIN_FRESH_HARD_TTL,
+    settled_soft_ttl=settings.FIN_SETTLED_SOFT_TTL,
+    settled_hard_ttl=settings.FIN_SETTLED_HARD_TTL,
+    filing_grace_days=settings.FIN_FILING_GRACE_DAYS,
+    retry_interval=settings.FIN_REFRESH_RETRY_INTERVAL,
+    missing_retry_interval=settings.FIN_MISSING_YEAR_RETRY_INTERVAL
+)
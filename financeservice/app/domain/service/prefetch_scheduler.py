@@ -0,0 +1,167 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.service.fin_service import FinService
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.cache.heavy_hitters import HeavyHitters, company_access_tracker
+from app.foundation.infra.dart.rate_limiter import DartPriority, dart_priority
+from app.foundation.infra.database.database import async_session
+
+logger = logging.getLogger(__name__)
+
+
+def _is_corp_code(key: str) -> bool:
+    return isinstance(key, str) and len(key) == 8 and key.isdigit()
+
+
+class PrefetchScheduler:
+    """접근 빈도 상위 회사의 재무 지표를 캐시 만료 전에 미리 다시 적재하는 백그라운드 작업.
+
+    상위 회사 목록은 주기마다 파일에 저장하며, 재시작 시 이 목록으로 빈도를 복원한 뒤
+    첫 주기에서 바로 캐시를 데워 둡니다.
+    """
+
+    def __init__(
+        self,
+        tracker: HeavyHitters,
+        state_path: str,
+        interval: int,
+        top_k: int,
+        concurrency: int,
+        decay_interval: int
+    ):
+        self.tracker = tracker
+        self.state_path = state_path
+        self.interval = interval
+        self.top_k = top_k
+        self.concurrency = concurrency
+        self.decay_interval = decay_interval
+        # 사용자 요청이 조기 갱신 구간에 들어서기 전에 갱신되도록 여유 시간을 둠
+        self.lead_time = max(
+            2 * interval,
+            settings.FIN_METRICS_CACHE_TTL * settings.CACHE_EARLY_REFRESH_RATIO
+        )
+        self._task: Optional[asyncio.Task] = None
+        self._service_factory: Optional[Callable[[AsyncSession], FinService]] = None
+        self._last_decay = time.monotonic()
+        self._last_run_at: Optional[str] = None
+        self._stats = {
+            "cycles": 0,
+            "prefetched": 0,
+            "skipped_fresh": 0,
+            "failed": 0
+        }
+
+    def load_state(self) -> None:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                items = json.load(f)
+            # 기업 고유번호(8자리 숫자)가 아닌 항목(이전 형식의 회사명)은 버림
+            items = [(corp_code, int(count)) for corp_code, count in items if _is_corp_code(corp_code)]
+            self.tracker.seed(items)
+            logger.info(f"사전 적재 대상 복원: {len(items)}개사")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"사전 적재 상태 파일을 읽을 수 없습니다: {str(e)}")
+
+    def save_state(self) -> None:
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.tracker.top(), f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    async def run_once(self) -> int:
+        """상위 회사 중 캐시가 곧 만료되거나 없는 회사의 재무 지표를 다시 적재합니다."""
+        hot = [corp_code for corp_code, _ in self.tracker.top(self.top_k)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def prefetch(corp_code: str) -> None:
+            async with semaphore:
+                try:
+                    async with async_session() as session:
+                        refreshed = await self._service_factory(session).refresh_financial_metrics(corp_code, self.lead_time)
+                        await session.commit()
+                    self._stats["prefetched" if refreshed else "skipped_fresh"] += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._stats["failed"] += 1
+                    logger.warning(f"사전 적재 실패 - {corp_code}: {str(e)}")
+
+        before = self._stats["prefetched"]
+        await asyncio.gather(*(prefetch(corp_code) for corp_code in hot))
+        self._stats["cycles"] += 1
+        self._last_run_at = datetime.now().isoformat()
+
+        if time.monotonic() - self._last_decay >= self.decay_interval:
+            self.tracker.decay()
+            self._last_decay = time.monotonic()
+        self.save_state()
+
+        prefetched = self._stats["prefetched"] - before
+        logger.info(f"사전 적재 주기 완료 - 대상 {len(hot)}개사, 갱신 {prefetched}개사")
+        return prefetched
+
+    def start(self, service_factory: Callable[[AsyncSession], FinService]) -> None:
+        """저장된 상위 회사 목록을 복원하고 사전 적재 작업을 시작합니다.
+
+        Args:
+            service_factory: DB 세션으로 FinService를 조립하는 함수 (애플리케이션 컨테이너)
+        """
+        if self._task is None or self._task.done():
+            self._service_factory = service_factory
+            self.load_state()
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self.save_state()
+
+    async def _loop(self) -> None:
+        # 사용자 요청보다 낮은 우선순위로 DART를 호출
+        with dart_priority(DartPriority.BACKGROUND):
+            while True:
+                try:
+                    await self.run_once()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"사전 적재 주기 실패: {str(e)}")
+                await asyncio.sleep(self.interval)
+
+    def stats(self) -> Dict[str, Any]:
+        hot = self.tracker.top(10)
+        return {
+            **self._stats,
+            "tracked": len(self.tracker),
+            "hot": [{"corp_code": corp_code, "estimated_requests": count} for corp_code, count in hot],
+            "lead_time": self.lead_time,
+            "last_run_at": self._last_run_at
+        }
+
+
+prefetch_scheduler = PrefetchScheduler(
+    tracker=company_access_tracker,
+    state_path=settings.PREFETCH_STATE_PATH,
+    interval=settings.PREFETCH_INTERVAL,
+    top_k=settings.PREFETCH_TOP_K,
+    concurrency=settings.PREFETCH_CONCURRENCY,
+    decay_interval=settings.PREFETCH_DECAY_INTERVAL
+)
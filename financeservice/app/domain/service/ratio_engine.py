@@ -0,0 +1,202 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+# 재무비율 계산에 사용하는 계정과목 (배열의 계정 축 순서)
+ACCOUNTS = ("자산총계", "부채총계", "유동자산", "유동부채", "자본총계", "매출액", "영업이익", "당기순이익")
+(
+    TOTAL_ASSETS,
+    TOTAL_LIABILITIES,
+    CURRENT_ASSETS,
+    CURRENT_LIABILITIES,
+    TOTAL_EQUITY,
+    REVENUE,
+    OPERATING_PROFIT,
+    NET_INCOME
+) = range(len(ACCOUNTS))
+_ACCOUNT_INDEX = {account_nm: idx for idx, account_nm in enumerate(ACCOUNTS)}
+
+# 한 보고서에 담긴 기간 (당기, 전기, 전전기)
+PERIODS = ("thstrm_amount", "frmtrm_amount", "bfefrmtrm_amount")
+THSTRM, FRMTRM, BFEFRMTRM = range(len(PERIODS))
+
+
+class FinancialCube:
+    """재무제표 행을 (회사 × 연도 × 계정 × 기간) 밀집 배열로 피벗한 구조.
+
+    연도 축은 최신 연도부터 1년 단위로 연속되도록 구성하므로
+    "n년 전" 조회를 인덱스 덧셈으로 처리할 수 있습니다.
+    """
+
+    def __init__(self, corp_codes: List[str], years: List[int], values: np.ndarray, reported: np.ndarray):
+        self.corp_codes = corp_codes
+        self.years = years
+        self.values = values
+        self.reported = reported
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Dict[str, Any]],
+        keep: str = "first",
+        default_corp_code: str = ""
+    ) -> "FinancialCube":
+        """재무제표 행 목록으로 큐브를 생성합니다.
+
+        Args:
+            rows: bsns_year, account_nm, 기간별 금액(및 선택적으로 corp_code)을 가진 행
+            keep: 같은 회사/연도/계정이 여러 번 나올 때 "first"면 첫 행, "last"면 마지막 행을 사용
+            default_corp_code: 행에 corp_code가 없을 때 사용할 회사 코드
+        """
+        rows = list(rows)
+        corp_index: Dict[str, int] = {}
+        year_values = set()
+        for row in rows:
+            corp_index.setdefault(row.get("corp_code", default_corp_code), len(corp_index))
+            year_values.add(int(row["bsns_year"]))
+
+        if not year_values:
+            return cls([], [], np.zeros((0, 0, len(ACCOUNTS), len(PERIODS))), np.zeros((0, 0), dtype=bool))
+
+        latest, oldest = max(year_values), min(year_values)
+        years = list(range(latest, oldest - 1, -1))
+        values = np.zeros((len(corp_index), len(years), len(ACCOUNTS), len(PERIODS)), dtype=np.float64)
+        filled = np.zeros((len(corp_index), len(years), len(ACCOUNTS)), dtype=bool)
+        reported = np.zeros((len(corp_index), len(years)), dtype=bool)
+
+        for row in rows:
+            c = corp_index[row.get("corp_code", default_corp_code)]
+            y = latest - int(row["bsns_year"])
+            reported[c, y] = True
+            a = _ACCOUNT_INDEX.get(row["account_nm"])
+            if a is None or (keep == "first" and filled[c, y, a]):
+                continue
+            filled[c, y, a] = True
+            values[c, y, a] = [float(row[period]) if row.get(period) else 0.0 for period in PERIODS]
+
+        return cls(list(corp_index), years, values, reported)
+
+    def __len__(self) -> int:
+        return len(self.corp_codes)
+
+
+def safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """분모가 0이면 NaN을 반환하는 백분율 나눗셈"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = numerator / denominator * 100
+    return np.where(denominator != 0, ratio, np.nan)
+
+
+def growth_rate(current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """성장률(%)을 계산합니다.
+
+    전기 값이 0이면 NaN, 부호가 바뀐 경우(흑자 전환 +100, 적자 전환 -100)는 고정값을 사용합니다.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = (current - previous) / np.abs(previous) * 100
+    rate = np.where((previous < 0) & (current > 0), 100.0, rate)
+    rate = np.where((previous > 0) & (current < 0), -100.0, rate)
+    return np.where(previous != 0, rate, np.nan)
+
+
+def level_ratios(amounts: np.ndarray) -> Dict[str, np.ndarray]:
+    """계정 축이 마지막인 금액 배열에서 안정성/수익성 비율을 계산합니다."""
+    total_assets = amounts[..., TOTAL_ASSETS]
+    total_liabilities = amounts[..., TOTAL_LIABILITIES]
+    total_equity = amounts[..., TOTAL_EQUITY]
+    revenue = amounts[..., REVENUE]
+    net_income = amounts[..., NET_INCOME]
+    return {
+        # 안정성 비율
+        "debt_ratio": safe_ratio(total_liabilities, total_equity),
+        "current_ratio": safe_ratio(amounts[..., CURRENT_ASSETS], amounts[..., CURRENT_LIABILITIES]),
+        "debt_dependency": safe_ratio(total_liabilities, total_assets),
+        # 수익성 비율
+        "operating_profit_ratio": safe_ratio(amounts[..., OPERATING_PROFIT], revenue),
+        "net_profit_ratio": safe_ratio(net_income, revenue),
+        "roe": safe_ratio(net_income, total_equity),
+        "roa": safe_ratio(net_income, total_assets)
+    }
+
+
+def yearly_ratios(cube: FinancialCube) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+    """보고된 연도마다 당기 금액으로 재무비율을, 당기/전기 금액으로 성장률을 계산합니다.
+
+    Returns:
+        {corp_code: {bsns_year: {지표명: 값}}}
+    """
+    current = cube.values[..., THSTRM]
+    previous = cube.values[..., FRMTRM]
+    ratios = level_ratios(current)
+    ratios["sales_growth"] = growth_rate(current[..., REVENUE], previous[..., REVENUE])
+    ratios["operating_profit_growth"] = growth_rate(current[..., OPERATING_PROFIT], previous[..., OPERATING_PROFIT])
+    ratios["eps_growth"] = growth_rate(current[..., NET_INCOME], previous[..., NET_INCOME])
+
+    result: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+    for c, corp_code in enumerate(cube.corp_codes):
+        result[corp_code] = {
+            str(year): {name: _to_optional(values[c, y]) for name, values in ratios.items()}
+            for y, year in enumerate(cube.years)
+            if cube.reported[c, y]
+        }
+    return result
+
+
+def metric_series(cube: FinancialCube, depth: int = 3) -> Dict[str, Dict[str, List[Any]]]:
+    """회사별 최근 보고서 기준 depth개년 재무지표 시계열을 계산합니다.
+
+    각 연도는 해당 연도 보고서가 있으면 그 당기 금액을, 없으면 최신 보고서의
+    전기/전전기 금액을 사용합니다.
+
+    Returns:
+        {corp_code: {"years": [...], 지표명: [...]}} (데이터가 없는 회사는 제외)
+    """
+    if len(cube) == 0:
+        return {}
+
+    corp_idx = np.arange(len(cube))
+    has_data = cube.reported.any(axis=1)
+    latest_idx = np.argmax(cube.reported, axis=1)  # 연도 축이 최신순이므로 첫 True가 최신 보고서
+    year_count = len(cube.years)
+
+    amounts = np.zeros((len(cube), depth, len(ACCOUNTS)), dtype=np.float64)
+    for k in range(depth):
+        idx = latest_idx + k
+        in_range = idx < year_count
+        idx = np.minimum(idx, year_count - 1)
+        actual = cube.reported[corp_idx, idx] & in_range
+        amounts[:, k] = np.where(
+            actual[:, None],
+            cube.values[corp_idx, idx, :, THSTRM],
+            cube.values[corp_idx, latest_idx, :, k]
+        )
+
+    ratios = level_ratios(amounts)
+    revenue_growth = growth_rate(amounts[:, :-1, REVENUE], amounts[:, 1:, REVENUE])
+    net_income_growth = growth_rate(amounts[:, :-1, NET_INCOME], amounts[:, 1:, NET_INCOME])
+
+    result: Dict[str, Dict[str, List[Any]]] = {}
+    for c, corp_code in enumerate(cube.corp_codes):
+        if not has_data[c]:
+            continue
+        latest_year = cube.years[latest_idx[c]]
+        result[corp_code] = {
+            "years": [str(latest_year - k) for k in range(depth)],
+            "operatingMargin": _to_list(ratios["operating_profit_ratio"][c]),
+            "netMargin": _to_list(ratios["net_profit_ratio"][c]),
+            "roe": _to_list(ratios["roe"][c]),
+            "roa": _to_list(ratios["roa"][c]),
+            "debtRatio": _to_list(ratios["debt_ratio"][c]),
+            "currentRatio": _to_list(ratios["current_ratio"][c]),
+            "revenueGrowth": _to_list(revenue_growth[c]),
+            "netIncomeGrowth": _to_list(net_income_growth[c])
+        }
+    return result
+
+
+def _to_optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+def _to_list(values: np.ndarray) -> List[Optional[float]]:
+    return [_to_optional(value) for value in values]
@@ -0,0 +1,309 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.model.schema.schema import FinancialMetricsResponse
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.database.database import async_session
+
+logger = logging.getLogger(__name__)
+
+# 이전 버전이 스필 파일에 남긴 재무제표 저장 작업 (다시 적재할 때만 사용)
+KIND_STATEMENTS = "statements"
+KIND_RATIOS = "ratios"
+KIND_METRICS_SNAPSHOT = "metrics_snapshot"
+# 지표 스냅샷보다 먼저 저장되어야 하는 원천 작업
+_SOURCE_KINDS = (KIND_STATEMENTS, KIND_RATIOS)
+
+
+class WriteBehindQueue:
+    """콜드 요청에서 재무비율 계산과 지표 스냅샷 저장을 응답 이후로 미루는 제한 크기 대기열.
+
+    재무제표 자체는 적재 잠금을 잡은 요청 트랜잭션에서 저장하므로(잠금이 풀리면 다른 작업자가 저장된 행을 봄)
+    이 대기열에는 그 뒤의 작업만 들어옵니다. 저장 작업은 JSON으로 직렬화 가능한 dict이며, 대기열이 가득 찼거나
+    재시도를 모두 실패했거나 종료 시점에 남아 있는 작업은 스필 파일(JSON Lines)에 기록하고 다음 시작 시 다시 적재합니다.
+
+    지표 스냅샷은 같은 회사의 재무비율 작업이 아직 저장되지 않았으면 그 작업에 붙여 한 작업으로
+    (재무비율 → 스냅샷 순서로) 저장하므로, 작업자가 여럿이어도 스냅샷이 재무비율보다 먼저 반영되지 않습니다.
+    """
+
+    def __init__(self, spill_path: str, max_queued: int, workers: int, max_attempts: int):
+        self.spill_path = spill_path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max_queued)
+        self._pending: Dict[str, int] = {}
+        # 회사별로 아직 시작하지 않은(대기 중이거나 재시도 대기 중인) 원천 작업과 저장 중인 작업
+        self._unstarted: Dict[str, List[Dict[str, Any]]] = {}
+        self._running: Dict[str, List[Dict[str, Any]]] = {}
+        # 저장 중인 원천 작업이 끝난 뒤에 저장할 스냅샷
+        self._deferred_snapshots: Dict[str, Dict[str, Any]] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._retrying: Dict[asyncio.Task, Dict[str, Any]] = {}
+        self._service_factory: Optional[Callable[[AsyncSession], Any]] = None
+        self._stats = {
+            "submitted": 0,
+            "persisted": 0,
+            "snapshots_merged": 0,
+            "retried": 0,
+            "spilled": 0,
+            "replayed": 0
+        }
+
+    # ------------------------------------------------------------------
+    # 작업 등록
+    # ------------------------------------------------------------------
+    def submit_ratios(self, corp_code: str, corp_name: str, bsns_year: str) -> None:
+        """저장된 재무제표로 재무비율 계산을 예약합니다."""
+        self._submit({
+            "kind": KIND_RATIOS,
+            "corp_code": corp_code,
+            "corp_name": corp_name,
+            "bsns_year": bsns_year
+        })
+
+    def submit_metrics_snapshot(self, corp_code: str, response: FinancialMetricsResponse) -> None:
+        """재무 지표 스냅샷 저장을 예약합니다.
+
+        같은 회사의 재무비율 작업이 아직 시작되지 않았으면 그 작업에 붙이고, 저장 중이면 저장이 끝난 뒤에
+        예약합니다. 재무비율 작업이 없을 때만 별도 작업으로 등록합니다.
+        """
+        snapshot = response.model_dump(mode="json")
+        unstarted = self._unstarted.get(corp_code)
+        if unstarted:
+            # 마지막 원천 작업에만 붙여 스냅샷이 모든 원천 작업 뒤에 저장되도록 함
+            for earlier in unstarted[:-1]:
+                earlier.pop("response", None)
+            unstarted[-1]["response"] = snapshot
+            self._stats["snapshots_merged"] += 1
+        elif corp_code in self._running:
+            self._deferred_snapshots[corp_code] = snapshot
+        else:
+            self._submit({
+                "kind": KIND_METRICS_SNAPSHOT,
+                "corp_code": corp_code,
+                "response": snapshot
+            })
+
+    def is_pending(self, corp_code: str) -> bool:
+        """아직 DB에 반영되지 않은 저장 작업이 있는 회사인지 확인합니다."""
+        return self._pending.get(corp_code, 0) > 0
+
+    def _submit(self, item: Dict[str, Any], attempt: int = 0) -> None:
+        item = {**item, "attempt": attempt}
+        if attempt == 0:
+            self._stats["submitted"] += 1
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning(f"지연 저장 대기열이 가득 차 스필 파일에 기록합니다: {item['corp_code']}")
+            self._spill([item])
+            return
+        self._enqueued(item)
+
+    def _enqueued(self, item: Dict[str, Any]) -> None:
+        self._pending[item["corp_code"]] = self._pending.get(item["corp_code"], 0) + 1
+        if item["kind"] in _SOURCE_KINDS:
+            self._unstarted.setdefault(item["corp_code"], []).append(item)
+
+    def _started(self, item: Dict[str, Any]) -> None:
+        if item["kind"] in _SOURCE_KINDS:
+            _remove(self._unstarted, item)
+            self._running.setdefault(item["corp_code"], []).append(item)
+
+    def _finished(self, item: Dict[str, Any], succeeded: bool) -> Optional[Dict[str, Any]]:
+        """저장이 끝난 원천 작업을 정리하고, 저장할 차례가 된 스냅샷을 반환합니다.
+
+        저장 중에 도착한 스냅샷은 같은 회사의 저장 중인 원천 작업이 모두 끝난 뒤에 반환하며,
+        저장에 실패했으면 작업에 붙여 재시도나 스필 파일 기록에 함께 포함합니다.
+        """
+        if item["kind"] not in _SOURCE_KINDS:
+            return None
+        corp_code = item["corp_code"]
+        _remove(self._running, item)
+        if not succeeded:
+            snapshot = self._deferred_snapshots.pop(corp_code, None)
+            if snapshot is not None:
+                item["response"] = snapshot
+            return None
+        if corp_code in self._running:
+            return None
+        return self._deferred_snapshots.pop(corp_code, None)
+
+    def _done(self, corp_code: str) -> None:
+        remaining = self._pending.get(corp_code, 0) - 1
+        if remaining > 0:
+            self._pending[corp_code] = remaining
+        else:
+            self._pending.pop(corp_code, None)
+
+    # ------------------------------------------------------------------
+    # 스필 파일
+    # ------------------------------------------------------------------
+    def _spill(self, items: List[Dict[str, Any]]) -> None:
+        if not items:
+            return
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for item in items:
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._stats["spilled"] += len(items)
+        except Exception as e:
+            logger.error(f"지연 저장 작업을 스필 파일에 기록하지 못했습니다 ({len(items)}건): {str(e)}")
+
+    async def _replay_spill(self) -> None:
+        """이전 실행의 스필 파일 작업을 대기열에 다시 넣습니다.
+
+        대기열에 자리가 날 때까지 기다리며 넣고, 모두 넣은 뒤에 파일을 지웁니다 (중간에 종료되면 다음 시작 시 다시 적재).
+        저장은 upsert이므로 같은 작업이 두 번 반영되어도 결과는 같습니다.
+        """
+        replay_path = f"{self.spill_path}.replay"
+        if not os.path.exists(replay_path):
+            try:
+                os.replace(self.spill_path, replay_path)
+            except FileNotFoundError:
+                return
+        items = []
+        with open(replay_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    items.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning("스필 파일에서 읽을 수 없는 줄을 건너뜁니다")
+
+        replayed = 0
+        try:
+            for item in items:
+                item = {**item, "attempt": 0}
+                await self._queue.put(item)
+                self._enqueued(item)
+                replayed += 1
+        except asyncio.CancelledError:
+            self._spill(items[replayed:])
+            raise
+        finally:
+            os.remove(replay_path)
+            self._stats["replayed"] += replayed
+        logger.info(f"스필 파일에서 지연 저장 작업 {replayed}건을 다시 적재했습니다")
+
+    # ------------------------------------------------------------------
+    # 백그라운드 작업
+    # ------------------------------------------------------------------
+    def start(self, service_factory: Callable[[AsyncSession], Any]) -> None:
+        """스필 파일을 다시 적재하고 저장 작업자를 시작합니다.
+
+        Args:
+            service_factory: DB 세션으로 FinancialStatementService를 조립하는 함수 (애플리케이션 컨테이너).
+                작업은 서비스의 persist_write_behind(item)으로 저장합니다.
+        """
+        if self._tasks:
+            return
+        self._service_factory = service_factory
+        for _ in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker()))
+        self._tasks.append(asyncio.create_task(self._replay_spill()))
+
+    async def stop(self) -> None:
+        """작업자를 멈추고 아직 저장하지 못한 작업을 스필 파일에 기록합니다."""
+        retrying = list(self._retrying)
+        for task in self._tasks + retrying:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *retrying, return_exceptions=True)
+        self._tasks = []
+        remaining = list(self._retrying.values())
+        self._retrying.clear()
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        self._spill(remaining)
+        self._pending.clear()
+        self._unstarted.clear()
+        self._running.clear()
+        self._deferred_snapshots.clear()
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            self._started(item)
+            retrying = False
+            try:
+                await self._persist(item)
+                self._stats["persisted"] += 1
+                # 저장 중에 도착한 스냅샷은 원천 작업이 반영된 뒤에 저장
+                snapshot = self._finished(item, succeeded=True)
+                if snapshot is not None:
+                    self._submit({"kind": KIND_METRICS_SNAPSHOT, "corp_code": item["corp_code"], "response": snapshot})
+            except asyncio.CancelledError:
+                # 처리 중이던 작업은 종료 시 잃지 않도록 스필 파일에 기록
+                self._finished(item, succeeded=False)
+                self._spill([item])
+                raise
+            except Exception as e:
+                self._finished(item, succeeded=False)
+                attempt = item["attempt"] + 1
+                if attempt < self.max_attempts:
+                    logger.warning(f"지연 저장 실패, 재시도 예정 ({attempt}/{self.max_attempts}) - {item['corp_code']}: {str(e)}")
+                    self._stats["retried"] += 1
+                    task = asyncio.create_task(self._retry_later(item, attempt))
+                    self._retrying[task] = item
+                    if item["kind"] in _SOURCE_KINDS:
+                        self._unstarted.setdefault(item["corp_code"], []).append(item)
+                    retrying = True
+                else:
+                    logger.error(f"지연 저장 재시도 한도 초과, 스필 파일에 기록 - {item['corp_code']}: {str(e)}")
+                    self._spill([item])
+            finally:
+                if not retrying:
+                    self._done(item["corp_code"])
+                self._queue.task_done()
+
+    async def _retry_later(self, item: Dict[str, Any], attempt: int) -> None:
+        """지수 백오프 후 다시 대기열에 넣습니다. 대기 중에도 회사는 저장 대기 상태로 유지됩니다."""
+        await asyncio.sleep(min(2 ** attempt, 60))
+        self._retrying.pop(asyncio.current_task(), None)
+        self._done(item["corp_code"])
+        _remove(self._unstarted, item)
+        self._submit(item, attempt=attempt)
+
+    async def _persist(self, item: Dict[str, Any]) -> None:
+        async with async_session() as session:
+            await self._service_factory(session).persist_write_behind(item)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "queue_depth": self._queue.qsize(),
+            "pending_companies": len(self._pending),
+            "unsaved_source_jobs": sum(len(items) for items in self._unstarted.values())
+            + sum(len(items) for items in self._running.values()),
+            "running": bool(self._tasks)
+        }
+
+
+def _remove(items_by_corp: Dict[str, List[Dict[str, Any]]], item: Dict[str, Any]) -> None:
+    """회사별 작업 목록에서 같은 작업(동일 객체)을 뺍니다."""
+    items = items_by_corp.get(item["corp_code"], [])
+    for index, candidate in enumerate(items):
+        if candidate is item:
+            del items[index]
+            break
+    if not items:
+        items_by_corp.pop(item["corp_code"], None)
+
+
+write_behind_queue = WriteBehindQueue(
+    spill_path=settings.WRITE_BEHIND_SPILL_PATH,
+    max_queued=settings.WRITE_BEHIND_MAX_QUEUED,
+    workers=settings.WRITE_BEHIND_WORKERS,
+    max_attempts=settings.WRITE_BEHIND_MAX_ATTEMPTS
+)
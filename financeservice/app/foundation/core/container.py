@@ -0,0 +1,63 @@
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.service.dart_api_service import DartApiService
+from app.domain.service.fin_service import FinService
+from app.domain.service.financial_data_processor import FinancialDataProcessor
+from app.domain.service.financial_statement_service import FinancialStatementService
+from app.foundation.core.config.settings import Settings, settings
+from app.foundation.infra.cache.heavy_hitters import HeavyHitters, company_access_tracker
+from app.foundation.infra.cache.response_cache import ResponseCache, response_cache
+from app.foundation.infra.dart.corp_code_index import CorpCodeIndex, corp_code_index
+from app.foundation.infra.dart.http_client import DartHttpClient, dart_http_client
+from app.foundation.infra.dart.rate_limiter import DartScheduler, dart_scheduler
+from app.foundation.infra.jobs.job_queue import JobQueue, job_queue
+
+logger = logging.getLogger(__name__)
+
+
+class Container:
+    """애플리케이션 범위 의존성 컨테이너.
+
+    시작 시 한 번 구성되어 모든 요청이 공유합니다. 설정, DART API 서비스, HTTP 클라이언트,
+    캐시처럼 상태가 없거나 프로세스 전체에서 공유하는 객체를 보관하며, 요청 범위인 DB 세션에
+    묶인 서비스는 fin_service(session)처럼 공유 의존성을 주입해 가볍게 조립합니다.
+    """
+
+    def __init__(self, config: Settings):
+        self.settings = config
+        self.dart_api = DartApiService(config.DART_API_KEY)
+        self.data_processor = FinancialDataProcessor()
+        self.dart_http_client: DartHttpClient = dart_http_client
+        self.dart_scheduler: DartScheduler = dart_scheduler
+        self.corp_code_index: CorpCodeIndex = corp_code_index
+        self.response_cache: ResponseCache = response_cache
+        self.access_tracker: HeavyHitters = company_access_tracker
+        self.job_queue: JobQueue = job_queue
+
+    def fin_service(self, db_session: AsyncSession) -> FinService:
+        return FinService(db_session, self.dart_api, self.data_processor)
+
+    def financial_statement_service(self, db_session: AsyncSession) -> FinancialStatementService:
+        return FinancialStatementService(db_session, self.dart_api, self.data_processor)
+
+
+_container: Optional[Container] = None
+
+
+def init_container() -> Container:
+    """애플리케이션 시작 시 컨테이너를 구성합니다."""
+    global _container
+    if _container is None:
+        _container = Container(settings)
+        logger.info("애플리케이션 컨테이너가 구성되었습니다.")
+    return _container
+
+
+def get_container() -> Container:
+    """구성된 컨테이너를 반환합니다 (FastAPI 의존성으로 사용)."""
+    if _container is None:
+        raise RuntimeError("애플리케이션 컨테이너가 아직 구성되지 않았습니다.")
+    return _container
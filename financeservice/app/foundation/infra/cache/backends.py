@@ -0,0 +1,77 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+
+class CacheBackend(ABC):
+    """L2 캐시 백엔드 인터페이스"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, keys: List[str]) -> None:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisBackend(CacheBackend):
+    """Redis(또는 Redis 호환 서버) L2 캐시 백엔드"""
+
+    def __init__(self, url: str):
+        self._client = aioredis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self._client.set(key, value, ex=ttl)
+
+    async def delete(self, keys: List[str]) -> None:
+        if keys:
+            await self._client.delete(*keys)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class InMemoryBackend(CacheBackend):
+    """Redis 없이 L2 동작을 확인하기 위한 인메모리 백엔드"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[str, float]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= time.time():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._data[key] = (value, time.time() + ttl)
+
+    async def delete(self, keys: List[str]) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+
+def create_backend(url: str) -> Optional[CacheBackend]:
+    """설정된 URL에 맞는 L2 백엔드를 생성합니다. URL이 비어 있으면 L2를 사용하지 않습니다."""
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        return InMemoryBackend()
+    return RedisBackend(url)
@@ -0,0 +1,102 @@
+import hashlib
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.foundation.core.config.settings import settings
+
+
+class CountMinSketch:
+    """고정 메모리로 키별 빈도의 상한 추정치를 제공하는 count-min sketch"""
+
+    def __init__(self, width: int, depth: int):
+        self.width = width
+        self.depth = depth
+        self._rows: List[List[int]] = [[0] * width for _ in range(depth)]
+
+    def _indexes(self, key: str) -> List[int]:
+        # 128비트 해시 하나에서 두 해시를 얻어 depth개의 위치를 만듦 (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """빈도를 더하고 갱신된 추정치를 반환합니다."""
+        estimate = None
+        for row, idx in zip(self._rows, self._indexes(key)):
+            row[idx] += count
+            estimate = row[idx] if estimate is None else min(estimate, row[idx])
+        return estimate or 0
+
+    def estimate(self, key: str) -> int:
+        return min(row[idx] for row, idx in zip(self._rows, self._indexes(key)))
+
+    def decay(self) -> None:
+        """모든 카운터를 절반으로 줄여 오래된 빈도의 영향을 낮춥니다."""
+        for row in self._rows:
+            for idx, value in enumerate(row):
+                if value:
+                    row[idx] = value >> 1
+
+
+class HeavyHitters:
+    """count-min sketch와 최소 힙으로 가장 자주 요청된 상위 K개 키를 추적합니다."""
+
+    def __init__(self, k: int, width: int, depth: int):
+        self.k = k
+        self._sketch = CountMinSketch(width, depth)
+        self._top: Dict[str, int] = {}
+        # (추정 빈도, 키) 최소 힙. 갱신된 항목의 이전 값은 꺼낼 때 버림
+        self._heap: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._top)
+
+    def record(self, key: str, count: int = 1) -> int:
+        """요청 한 건(또는 count건)을 기록하고 추정 빈도를 반환합니다."""
+        estimate = self._sketch.add(key, count)
+        if key not in self._top and len(self._top) >= self.k:
+            min_count, min_key = self._peek_min()
+            if estimate <= min_count:
+                return estimate
+            heapq.heappop(self._heap)
+            del self._top[min_key]
+        self._top[key] = estimate
+        heapq.heappush(self._heap, (estimate, key))
+        if len(self._heap) > 4 * self.k:
+            self._rebuild_heap()
+        return estimate
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """빈도 내림차순의 (키, 추정 빈도) 목록"""
+        items = sorted(self._top.items(), key=lambda item: item[1], reverse=True)
+        return items if n is None else items[:n]
+
+    def seed(self, items: Iterable[Tuple[str, int]]) -> None:
+        """저장해 둔 상위 키 목록으로 빈도를 복원합니다."""
+        for key, count in items:
+            if count > 0:
+                self.record(key, count)
+
+    def decay(self) -> None:
+        self._sketch.decay()
+        self._top = {key: count >> 1 for key, count in self._top.items() if count >> 1}
+        self._rebuild_heap()
+
+    def _peek_min(self) -> Tuple[int, str]:
+        while True:
+            count, key = self._heap[0]
+            if self._top.get(key) == count:
+                return count, key
+            heapq.heappop(self._heap)
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(count, key) for key, count in self._top.items()]
+        heapq.heapify(self._heap)
+
+
+company_access_tracker = HeavyHitters(
+    k=settings.PREFETCH_TRACKED_KEYS,
+    width=settings.PREFETCH_SKETCH_WIDTH,
+    depth=settings.PREFETCH_SKETCH_DEPTH
+)
@@ -0,0 +1,48 @@
+from collections import OrderedDict
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheEntry(Generic[T]):
+    """캐시 값과 만료/조기 갱신 시각(epoch 초)"""
+
+    __slots__ = ("value", "expires_at", "refresh_at")
+
+    def __init__(self, value: T, expires_at: float, refresh_at: float):
+        self.value = value
+        self.expires_at = expires_at
+        self.refresh_at = refresh_at
+
+
+class TTLLRUCache:
+    """최대 항목 수가 제한된 TTL 기반 LRU 캐시 (프로세스 내 L1)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry[Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, now: float) -> Optional[CacheEntry[Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry[Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
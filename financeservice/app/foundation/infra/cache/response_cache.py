@@ -0,0 +1,199 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.cache.backends import CacheBackend, create_backend
+from app.foundation.infra.cache.lru_cache import CacheEntry, TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class _LoadAbandoned(Exception):
+    """적재를 맡은 요청이 취소되어 적재가 중단됨. 기다리던 요청은 직접 다시 적재합니다."""
+
+
+class ResponseCache:
+    """2단계 응답 캐시 (L1: 프로세스 내 LRU, L2: Redis 호환 백엔드).
+
+    - 같은 키에 대한 동시 적재 요청은 하나로 합쳐집니다(request coalescing).
+    - 항목마다 만료 전 임의(jitter) 시점에 조기 갱신 시각을 두어, 그 이후 첫 요청이
+      값을 다시 적재하고 나머지 요청은 기존 값을 그대로 사용합니다(stampede 방지).
+    """
+
+    def __init__(
+        self,
+        l1_max_entries: int,
+        l2: Optional[CacheBackend],
+        key_prefix: str,
+        early_refresh_ratio: float
+    ):
+        self._l1 = TTLLRUCache(l1_max_entries)
+        self._l2 = l2
+        self.key_prefix = key_prefix
+        self.early_refresh_ratio = early_refresh_ratio
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "early_refreshes": 0,
+            "abandoned_loads": 0,
+            "load_errors": 0,
+            "l2_errors": 0
+        }
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[M]],
+        model: Type[M],
+        ttl: int
+    ) -> M:
+        """캐시된 값을 반환하고, 없으면 loader로 적재하여 저장합니다."""
+        now = time.time()
+        entry = self._l1.get(key, now)
+        if entry is not None:
+            self._stats["l1_hits"] += 1
+        else:
+            entry = await self._get_l2(key, model, now)
+            if entry is not None:
+                self._stats["l2_hits"] += 1
+                self._l1.set(key, entry)
+
+        if entry is not None:
+            if now < entry.refresh_at or key in self._inflight:
+                return entry.value
+            # 조기 갱신: 이 요청이 갱신을 맡고, 실패하면 기존 값을 사용
+            self._stats["early_refreshes"] += 1
+            try:
+                return await self._load(key, loader, model, ttl)
+            except Exception as e:
+                logger.warning(f"캐시 조기 갱신 실패, 기존 값을 사용합니다 ({key}): {str(e)}")
+                return entry.value
+
+        self._stats["misses"] += 1
+        return await self._join_or_load(key, loader, model, ttl)
+
+    async def refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[M]],
+        model: Type[M],
+        ttl: int
+    ) -> M:
+        """캐시 상태와 관계없이 값을 다시 적재합니다. 같은 키의 적재가 진행 중이면 그 결과를 공유합니다."""
+        return await self._join_or_load(key, loader, model, ttl)
+
+    async def expires_in(self, key: str, model: Type[M]) -> Optional[float]:
+        """캐시된 값의 남은 유효 시간(초). 캐시에 없으면 None."""
+        now = time.time()
+        entry = self._l1.get(key, now) or await self._get_l2(key, model, now)
+        return None if entry is None else entry.expires_at - now
+
+    async def set(self, key: str, value: M, ttl: int) -> None:
+        """값을 L1과 L2에 저장합니다."""
+        now = time.time()
+        expires_at = now + ttl
+        refresh_at = expires_at - ttl * self.early_refresh_ratio * random.random()
+        self._l1.set(key, CacheEntry(value, expires_at, refresh_at))
+        if self._l2 is not None:
+            payload = json.dumps({"value": value.model_dump_json(), "expires_at": expires_at, "refresh_at": refresh_at})
+            try:
+                await self._l2.set(self.key_prefix + key, payload, ttl)
+            except Exception as e:
+                self._stats["l2_errors"] += 1
+                logger.warning(f"L2 캐시 저장 실패 ({key}): {str(e)}")
+
+    async def invalidate(self, *keys: str) -> None:
+        """키를 L1과 L2에서 삭제합니다."""
+        for key in keys:
+            self._l1.delete(key)
+        if self._l2 is not None and keys:
+            try:
+                await self._l2.delete([self.key_prefix + key for key in keys])
+            except Exception as e:
+                self._stats["l2_errors"] += 1
+                logger.warning(f"L2 캐시 삭제 실패: {str(e)}")
+
+    async def close(self) -> None:
+        if self._l2 is not None:
+            await self._l2.close()
+
+    async def _join_or_load(self, key: str, loader: Callable[[], Awaitable[M]], model: Type[M], ttl: int) -> M:
+        """진행 중인 같은 키의 적재 결과를 기다리고, 없으면 직접 적재합니다.
+
+        loader는 적재를 맡은 요청의 DB 세션에 묶여 있으므로 그 요청이 취소되면 적재도 중단됩니다.
+        이때 기다리던 요청은 취소되지 않고 자신의 loader로 다시 적재합니다.
+        """
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                return await self._load(key, loader, model, ttl)
+            self._stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(inflight)
+            except _LoadAbandoned:
+                self._stats["abandoned_loads"] += 1
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[M]], model: Type[M], ttl: int) -> M:
+        future = asyncio.get_running_loop().create_future()
+        # 대기자가 없어도 예외가 "retrieved"로 처리되도록 함
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            value = await loader()
+            await self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.set_exception(_LoadAbandoned(key))
+            raise
+        except Exception as e:
+            self._stats["load_errors"] += 1
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _get_l2(self, key: str, model: Type[M], now: float) -> Optional[CacheEntry[M]]:
+        if self._l2 is None:
+            return None
+        try:
+            payload = await self._l2.get(self.key_prefix + key)
+        except Exception as e:
+            self._stats["l2_errors"] += 1
+            logger.warning(f"L2 캐시 조회 실패 ({key}): {str(e)}")
+            return None
+        if payload is None:
+            return None
+        data = json.loads(payload)
+        if data["expires_at"] <= now:
+            return None
+        return CacheEntry(model.model_validate_json(data["value"]), data["expires_at"], data["refresh_at"])
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats["l1_hits"] + self._stats["l2_hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_ratio": round((self._stats["l1_hits"] + self._stats["l2_hits"]) / lookups, 4) if lookups else 0.0,
+            "l1_entries": len(self._l1),
+            "l2_enabled": self._l2 is not None,
+            "inflight": len(self._inflight)
+        }
+
+
+response_cache = ResponseCache(
+    l1_max_entries=settings.CACHE_L1_MAX_ENTRIES,
+    l2=create_backend(settings.REDIS_URL),
+    key_prefix=settings.CACHE_KEY_PREFIX,
+    early_refresh_ratio=settings.CACHE_EARLY_REFRESH_RATIO
+)
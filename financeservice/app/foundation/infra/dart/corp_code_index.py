@@ -0,0 +1,236 @@
+import asyncio
+import logging
+import mmap
+import os
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from io import BytesIO
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.dart.rate_limiter import DartPriority, dart_priority
+
+logger = logging.getLogger(__name__)
+
+# (corp_code, corp_name, stock_code)
+CorpRecord = Tuple[str, str, str]
+
+# 로컬 인덱스 파일 포맷: 매직 헤더 + 레코드당 한 줄(필드 구분자 0x1F)
+_MAGIC = b"CORPIDX1\n"
+_FIELD_SEP = "\x1f"
+
+
+class CorpCodeIndex:
+    """DART 기업 고유번호(CORPCODE.xml) 인메모리 인덱스.
+
+    corpCode.xml은 한 번만 내려받아 회사명/고유번호/종목코드별 해시맵으로 보관하고,
+    로컬 파일에 저장해 재시작 시 메모리 매핑으로 즉시 복원합니다.
+    존재하지 않는 회사명은 일정 시간 동안 부정 캐시로 기억합니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        refresh_interval: int,
+        negative_ttl: int,
+        negative_max_entries: int
+    ):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.negative_ttl = negative_ttl
+        self.negative_max_entries = negative_max_entries
+
+        self._by_name: Dict[str, CorpRecord] = {}
+        self._by_corp_code: Dict[str, CorpRecord] = {}
+        self._by_stock_code: Dict[str, CorpRecord] = {}
+        self._negative: "OrderedDict[str, float]" = OrderedDict()
+        self._loaded_at: Optional[float] = None
+        self._load_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def __len__(self) -> int:
+        return len(self._by_corp_code)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_by_name(self, corp_name: str) -> Optional[CorpRecord]:
+        return self._by_name.get(corp_name)
+
+    def get_by_corp_code(self, corp_code: str) -> Optional[CorpRecord]:
+        return self._by_corp_code.get(corp_code)
+
+    def get_by_stock_code(self, stock_code: str) -> Optional[CorpRecord]:
+        return self._by_stock_code.get(stock_code)
+
+    def listed_corp_codes(self) -> List[str]:
+        """종목코드가 있는(상장) 기업의 고유번호 목록을 반환합니다."""
+        return [record[0] for record in self._by_stock_code.values()]
+
+    def is_known_missing(self, corp_name: str) -> bool:
+        """부정 캐시에 남아 있는 회사명인지 확인합니다."""
+        expires_at = self._negative.get(corp_name)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            self._negative.pop(corp_name, None)
+            return False
+        return True
+
+    def remember_missing(self, corp_name: str) -> None:
+        """찾을 수 없는 회사명을 부정 캐시에 기록합니다."""
+        self._negative[corp_name] = time.monotonic() + self.negative_ttl
+        self._negative.move_to_end(corp_name)
+        while len(self._negative) > self.negative_max_entries:
+            self._negative.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+    async def ensure_loaded(self, download: Callable[[], Awaitable[bytes]]) -> None:
+        """인덱스가 비어 있으면 로컬 파일 또는 DART에서 적재합니다."""
+        if self.is_loaded:
+            return
+        async with self._load_lock:
+            if self.is_loaded:
+                return
+            if self.load_from_file():
+                return
+            await self.refresh(download)
+
+    async def refresh(self, download: Callable[[], Awaitable[bytes]]) -> None:
+        """corpCode.xml을 새로 내려받아 인덱스를 교체하고 로컬 파일에 저장합니다."""
+        started = time.perf_counter()
+        content = await download()
+        records = await asyncio.to_thread(self._parse_archive, content)
+        self._replace(records)
+        await asyncio.to_thread(self._write_file, records)
+        logger.info(
+            f"기업 고유번호 인덱스 갱신 완료 - {len(records)}건, "
+            f"{(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+
+    def load_from_file(self) -> bool:
+        """로컬 인덱스 파일을 메모리 매핑하여 인덱스를 복원합니다."""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.readline() != _MAGIC:
+                        logger.warning(f"기업 고유번호 인덱스 파일 형식이 올바르지 않습니다: {self.path}")
+                        return False
+                    records = []
+                    for line in iter(mm.readline, b""):
+                        corp_code, corp_name, stock_code = line.decode("utf-8").rstrip("\n").split(_FIELD_SEP)
+                        records.append((corp_code, corp_name, stock_code))
+        except (OSError, ValueError) as e:
+            logger.warning(f"기업 고유번호 인덱스 파일 로드 실패: {str(e)}")
+            return False
+
+        self._replace(records)
+        # 파일 수정 시각을 기준으로 다음 갱신 시점을 계산
+        age = max(0.0, time.time() - os.path.getmtime(self.path))
+        self._loaded_at = time.monotonic() - age
+        logger.info(f"기업 고유번호 인덱스 파일 로드 완료 - {len(records)}건")
+        return True
+
+    def _replace(self, records: List[CorpRecord]) -> None:
+        by_name: Dict[str, CorpRecord] = {}
+        by_corp_code: Dict[str, CorpRecord] = {}
+        by_stock_code: Dict[str, CorpRecord] = {}
+        for record in records:
+            corp_code, corp_name, stock_code = record
+            # 동명 기업은 CORPCODE.xml에서 먼저 나온 항목을 사용 (기존 선형 탐색과 동일)
+            by_name.setdefault(corp_name, record)
+            by_corp_code[corp_code] = record
+            if stock_code:
+                by_stock_code[stock_code] = record
+
+        self._by_name = by_name
+        self._by_corp_code = by_corp_code
+        self._by_stock_code = by_stock_code
+        self._negative.clear()
+        self._loaded_at = time.monotonic()
+
+    @staticmethod
+    def _parse_archive(content: bytes) -> List[CorpRecord]:
+        records = []
+        with zipfile.ZipFile(BytesIO(content)) as zip_file:
+            with zip_file.open('CORPCODE.xml') as xml_file:
+                for _, element in ET.iterparse(xml_file):
+                    if element.tag != "list":
+                        continue
+                    records.append((
+                        (element.findtext('corp_code') or "").strip(),
+                        (element.findtext('corp_name') or "").strip(),
+                        (element.findtext('stock_code') or "").strip()
+                    ))
+                    element.clear()
+        return records
+
+    def _write_file(self, records: List[CorpRecord]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC)
+            for record in records:
+                f.write((_FIELD_SEP.join(record) + "\n").encode("utf-8"))
+        os.replace(tmp_path, self.path)
+
+    # ------------------------------------------------------------------
+    # 백그라운드 갱신
+    # ------------------------------------------------------------------
+    def start_refresh(self, download: Callable[[], Awaitable[bytes]]) -> None:
+        """주기적으로 인덱스를 갱신하는 백그라운드 작업을 시작합니다."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop(download))
+
+    async def stop_refresh(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_loop(self, download: Callable[[], Awaitable[bytes]]) -> None:
+        # 주기 갱신은 사용자 요청보다 낮은 우선순위로 DART를 호출
+        with dart_priority(DartPriority.BACKGROUND):
+            while True:
+                try:
+                    await self.ensure_loaded(download)
+                    elapsed = time.monotonic() - (self._loaded_at or 0.0)
+                    delay = self.refresh_interval - elapsed
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    await self.refresh(download)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"기업 고유번호 인덱스 갱신 실패: {str(e)}")
+                    await asyncio.sleep(min(self.refresh_interval, 300))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "companies": len(self._by_corp_code),
+            "listed": len(self._by_stock_code),
+            "negative_entries": len(self._negative)
+        }
+
+
+corp_code_index = CorpCodeIndex(
+    path=settings.CORP_CODE_INDEX_PATH,
+    refresh_interval=settings.CORP_CODE_REFRESH_INTERVAL,
+    negative_ttl=settings.CORP_CODE_NEGATIVE_TTL,
+    negative_max_entries=settings.CORP_CODE_NEGATIVE_MAX_ENTRIES
+)
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.dart.rate_limiter import DartRateLimitError, dart_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+class DartHttpClient:
+    """DART OpenAPI 호출에 공유되는 앱 단위 aiohttp 클라이언트.
+
+    keep-alive 커넥션 풀과 DNS 캐시를 재사용하여 요청마다 TCP/TLS 핸드셰이크와
+    DNS 조회가 반복되지 않도록 합니다. 앱 startup/shutdown 훅에서 열고 닫습니다.
+    모든 호출은 DartScheduler의 슬롯을 거쳐 속도 제한과 일일 예산을 적용받습니다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int,
+        keepalive_timeout: float,
+        dns_ttl: int,
+        connect_timeout: float,
+        request_timeout: float
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self.connect_timeout = connect_timeout
+        self.request_timeout = request_timeout
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._start_lock = asyncio.Lock()
+
+        self._requests = 0
+        self._errors = 0
+        self._in_flight = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    async def start(self) -> None:
+        """커넥션 풀과 세션을 생성합니다."""
+        async with self._start_lock:
+            if self._session is not None and not self._session.closed:
+                return
+            self._connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size,
+                ttl_dns_cache=self.dns_ttl,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=self._connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.request_timeout,
+                    connect=self.connect_timeout
+                )
+            )
+            logger.info(f"DART HTTP 클라이언트 시작 - pool_size: {self.pool_size}")
+
+    async def close(self) -> None:
+        """세션과 커넥션 풀을 닫습니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("DART HTTP 클라이언트 종료")
+        self._session = None
+        self._connector = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            await self.start()
+        return self._session
+
+    async def get_json(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """DART API를 호출하고 JSON 응답을 반환합니다."""
+        return await self._request(path, params, timeout, as_json=True)
+
+    async def get_bytes(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> bytes:
+        """DART API를 호출하고 응답 본문을 바이트로 반환합니다."""
+        return await self._request(path, params, timeout, as_json=False)
+
+    async def _request(self, path: str, params: Dict[str, Any], timeout: Optional[float], as_json: bool) -> Any:
+        session = await self._get_session()
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        # timeout=None은 aiohttp에서 "제한 없음"이므로 지정하지 않으면 세션 기본값(total/connect)을 사용
+        if timeout:
+            request_timeout = aiohttp.ClientTimeout(total=timeout, connect=self.connect_timeout)
+        else:
+            request_timeout = session.timeout
+
+        async with dart_scheduler.slot() as slot:
+            self._requests += 1
+            self._in_flight += 1
+            started = time.perf_counter()
+            try:
+                async with session.get(url, params=params, timeout=request_timeout) as response:
+                    if response.status == 429:
+                        slot.mark_throttled()
+                        retry_after = response.headers.get("Retry-After", "")
+                        raise DartRateLimitError(
+                            "DART 요청 제한을 초과하였습니다. (HTTP 429)",
+                            retry_after=int(retry_after) if retry_after.isdigit() else None
+                        )
+                    if response.status != 200:
+                        logger.error(f"API 요청 실패: {response.status} - {path}")
+                        raise Exception(f"API 요청 실패: {response.status}")
+                    if not as_json:
+                        return await response.read()
+                    # DART는 JSON을 text/html 등으로 내려주는 경우가 있어 content_type 검사를 생략
+                    data = await response.json(content_type=None)
+                    if isinstance(data, dict) and data.get("status") == "020":
+                        slot.mark_throttled()
+                        raise DartRateLimitError(f"DART 요청 제한을 초과하였습니다. ({data.get('message', '')})")
+                    return data
+            except Exception:
+                self._errors += 1
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                self._in_flight -= 1
+                self._total_latency += elapsed
+                self._max_latency = max(self._max_latency, elapsed)
+
+    def stats(self) -> Dict[str, Any]:
+        """커넥션 풀 사용 현황을 반환합니다."""
+        connector = self._connector
+        acquired = len(getattr(connector, "_acquired", ())) if connector else 0
+        idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values()) if connector else 0
+        return {
+            "pool_size": self.pool_size,
+            "connections_in_use": acquired,
+            "connections_idle": idle,
+            "requests_in_flight": self._in_flight,
+            "requests_total": self._requests,
+            "errors_total": self._errors,
+            "avg_latency_ms": round(self._total_latency / self._requests * 1000, 2) if self._requests else 0.0,
+            "max_latency_ms": round(self._max_latency * 1000, 2)
+        }
+
+
+dart_http_client = DartHttpClient(
+    base_url=settings.DART_API_URL,
+    pool_size=settings.DART_HTTP_POOL_SIZE,
+    keepalive_timeout=settings.DART_HTTP_KEEPALIVE,
+    dns_ttl=settings.DART_HTTP_DNS_TTL,
+    connect_timeout=settings.DART_HTTP_CONNECT_TIMEOUT,
+    request_timeout=settings.DART_HTTP_TIMEOUT
+)
@@ -0,0 +1,266 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from app.foundation.core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# DART 일일 한도는 한국 시간 자정에 초기화됨
+KST = timezone(timedelta(hours=9))
+
+
+class DartPriority(IntEnum):
+    """DART 호출 우선순위 (값이 작을수록 먼저 처리)"""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+    BATCH = 2
+
+
+_current_priority: ContextVar[DartPriority] = ContextVar("dart_priority", default=DartPriority.INTERACTIVE)
+
+
+@contextmanager
+def dart_priority(priority: DartPriority) -> Iterator[None]:
+    """블록 안에서 발생하는 DART 호출의 우선순위를 지정합니다."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> DartPriority:
+    return _current_priority.get()
+
+
+class DartQuotaExceededError(Exception):
+    """DART 일일 호출 한도를 모두 사용한 경우. retry_after는 한도가 초기화될 때까지 남은 시간(초)"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DartRateLimitError(Exception):
+    """DART가 요청 제한 초과(HTTP 429, status 020)를 응답한 경우. retry_after는 재시도까지 기다릴 시간(초)"""
+
+    def __init__(self, message: str, retry_after: Optional[int] = None):
+        super().__init__(message)
+        self.retry_after = retry_after if retry_after is not None else settings.DART_THROTTLE_RETRY_AFTER
+
+
+def seconds_until_budget_reset(now: Optional[datetime] = None) -> int:
+    """DART 일일 한도가 초기화되는 다음 한국 시간 자정까지 남은 시간(초)"""
+    now = now or datetime.now(KST)
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=KST)
+    return max(1, int((midnight - now).total_seconds()))
+
+
+class _Slot:
+    def __init__(self):
+        self.throttled = False
+
+    def mark_throttled(self) -> None:
+        self.throttled = True
+
+
+class DartScheduler:
+    """DART 외부 호출 중앙 스케줄러.
+
+    - 토큰 버킷으로 초당 호출 수를 제한합니다.
+    - 동시 실행 한도를 AIMD(성공 시 가산 증가, 제한 응답 시 절반 감소)로 조정합니다.
+    - 일일 호출 예산을 추적하며, 잔여 예산이 예약분 이하이면 사용자 요청만 허용합니다.
+      예산은 대기열에 넣을 때와 슬롯을 배정할 때 모두 확인합니다.
+    - 대기열은 우선순위 순(사용자 요청 > 백그라운드 > 배치)으로 처리합니다.
+
+    일일 예산은 이 프로세스의 메모리에서만 세므로 프로세스(작업자/복제본)별로 따로 적용되고 재시작하면
+    0부터 다시 셉니다. DART의 실제 한도를 지키는 보장이 아니라 최선 노력의 보호 장치이므로,
+    여러 프로세스로 실행할 때는 DART_DAILY_LIMIT을 프로세스 수로 나눈 값으로 설정합니다.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        daily_limit: int,
+        interactive_reserve: int
+    ):
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.daily_limit = daily_limit
+        self.interactive_reserve = interactive_reserve
+
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._limit = float(max(min_concurrency, max_concurrency // 2))
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        self._budget_day = datetime.now(KST).date()
+        self._used_today = 0
+
+        self._queued = {priority: 0 for priority in DartPriority}
+        self._admitted = {priority: 0 for priority in DartPriority}
+        self._total_wait = {priority: 0.0 for priority in DartPriority}
+        self._max_wait = {priority: 0.0 for priority in DartPriority}
+        self._throttled = 0
+        self._rejected = 0
+
+    # ------------------------------------------------------------------
+    # 예산
+    # ------------------------------------------------------------------
+    @property
+    def remaining_today(self) -> int:
+        today = datetime.now(KST).date()
+        if today != self._budget_day:
+            self._budget_day = today
+            self._used_today = 0
+        return max(0, self.daily_limit - self._used_today)
+
+    def _check_budget(self, priority: DartPriority) -> None:
+        error = self._budget_error(priority)
+        if error is not None:
+            raise error
+
+    def _budget_error(self, priority: DartPriority) -> Optional[DartQuotaExceededError]:
+        """우선순위에 허용된 예산이 남아 있지 않으면 거절 사유를 반환합니다."""
+        remaining = self.remaining_today
+        if remaining > 0 and (priority == DartPriority.INTERACTIVE or remaining > self.interactive_reserve):
+            return None
+        self._rejected += 1
+        return DartQuotaExceededError(
+            f"DART 일일 호출 한도에 도달했습니다. (잔여: {remaining})",
+            retry_after=seconds_until_budget_reset()
+        )
+
+    # ------------------------------------------------------------------
+    # 슬롯 획득/반납
+    # ------------------------------------------------------------------
+    @asynccontextmanager
+    async def slot(self, priority: Optional[DartPriority] = None) -> AsyncIterator[_Slot]:
+        """호출 한 건을 위한 실행 슬롯을 획득합니다."""
+        priority = current_priority() if priority is None else priority
+        await self.acquire(priority)
+        slot = _Slot()
+        succeeded = False
+        try:
+            yield slot
+            succeeded = True
+        finally:
+            self.release(success=succeeded and not slot.throttled, throttled=slot.throttled)
+
+    async def acquire(self, priority: DartPriority) -> None:
+        self._check_budget(priority)
+        future = asyncio.get_running_loop().create_future()
+        enqueued_at = time.monotonic()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), future))
+        self._queued[priority] += 1
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # 슬롯을 배정받은 직후 취소된 경우 즉시 반납
+                self.release(success=False, throttled=False)
+            raise
+
+        waited = time.monotonic() - enqueued_at
+        self._admitted[priority] += 1
+        self._total_wait[priority] += waited
+        self._max_wait[priority] = max(self._max_wait[priority], waited)
+
+    def release(self, success: bool, throttled: bool) -> None:
+        self._in_flight -= 1
+        if throttled:
+            self._throttled += 1
+            self._limit = max(float(self.min_concurrency), self._limit / 2)
+            self._tokens = 0.0
+            logger.warning(f"DART 요청 제한 응답 - 동시 실행 한도를 {int(self._limit)}로 낮춥니다.")
+        elif success:
+            self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+        self._dispatch()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate_per_sec)
+        self._last_refill = now
+
+    def _dispatch(self) -> None:
+        self._refill()
+        while self._waiters and self._in_flight < int(self._limit):
+            priority, _, future = self._waiters[0]
+            if future.done():
+                # 대기 중 취소된 요청
+                heapq.heappop(self._waiters)
+                self._queued[DartPriority(priority)] -= 1
+                continue
+            # 대기하는 동안 앞선 호출이 예산을 소진했을 수 있으므로 배정 직전에 다시 확인
+            error = self._budget_error(DartPriority(priority))
+            if error is not None:
+                heapq.heappop(self._waiters)
+                self._queued[DartPriority(priority)] -= 1
+                future.set_exception(error)
+                continue
+            if self._tokens < 1:
+                self._schedule_wakeup((1 - self._tokens) / self.rate_per_sec)
+                break
+            heapq.heappop(self._waiters)
+            self._queued[DartPriority(priority)] -= 1
+            self._tokens -= 1
+            self._in_flight += 1
+            self._used_today += 1
+            future.set_result(None)
+
+    def _schedule_wakeup(self, delay: float) -> None:
+        if self._wakeup is not None:
+            return
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._on_wakeup)
+
+    def _on_wakeup(self) -> None:
+        self._wakeup = None
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 깊이, 대기 시간, 동시 실행 한도, 잔여 예산을 반환합니다."""
+        return {
+            "in_flight": self._in_flight,
+            "concurrency_limit": int(self._limit),
+            "tokens": round(self._tokens, 2),
+            "remaining_today": self.remaining_today,
+            "throttled_total": self._throttled,
+            "rejected_total": self._rejected,
+            "queues": {
+                priority.name.lower(): {
+                    "depth": self._queued[priority],
+                    "admitted_total": self._admitted[priority],
+                    "avg_wait_ms": round(self._total_wait[priority] / self._admitted[priority] * 1000, 2)
+                    if self._admitted[priority] else 0.0,
+                    "max_wait_ms": round(self._max_wait[priority] * 1000, 2)
+                }
+                for priority in DartPriority
+            }
+        }
+
+
+dart_scheduler = DartScheduler(
+    rate_per_sec=settings.DART_RATE_PER_SEC,
+    burst=settings.DART_RATE_BURST,
+    min_concurrency=settings.DART_MIN_CONCURRENCY,
+    max_concurrency=settings.DART_MAX_CONCURRENCY,
+    daily_limit=settings.DART_DAILY_LIMIT,
+    interactive_reserve=settings.DART_INTERACTIVE_RESERVE
+)
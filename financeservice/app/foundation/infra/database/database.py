@@ -1,9 +1,15 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 import os
 from dotenv import load_dotenv
 import logging
+from typing import Any, Dict
+
+from app.foundation.infra.database.unit_of_work import statement_count
 
 logger = logging.getLogger(__name__)
 
@@ -26,22 +32,94 @@ if "db:5432" in DATABASE_URL:
 
 logger.info(f"Connecting to database with URL: {DATABASE_URL}")
 
-# 비동기 엔진 생성
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True,  # 연결 상태 확인
-    pool_size=5,  # 연결 풀 크기
-    max_overflow=10  # 최대 추가 연결 수
-)
+# 읽기 전용 세션을 보낼 복제본 URL (없으면 읽기 전용 세션도 주 DB를 사용)
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL", "")
+
+# 엔진별 연결 풀 크기
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_REPLICA_POOL_SIZE = int(os.getenv("DB_REPLICA_POOL_SIZE", str(DB_POOL_SIZE)))
+DB_REPLICA_MAX_OVERFLOW = int(os.getenv("DB_REPLICA_MAX_OVERFLOW", str(DB_MAX_OVERFLOW)))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+_READ_ONLY_KEY = "read_only"
+
+# 엔진별 풀 설정과 최대 동시 사용 연결 수 (pool_stats에서 사용)
+_pool_limits: Dict[str, Dict[str, int]] = {}
+
+
+def _create_engine(name: str, url: str, pool_size: int, max_overflow: int) -> AsyncEngine:
+    """연결 풀 크기를 지정한 비동기 엔진을 만들고 풀 사용량을 기록합니다."""
+    created = create_async_engine(
+        url,
+        echo=True,
+        pool_pre_ping=True,  # 연결 상태 확인
+        pool_size=pool_size,  # 연결 풀 크기
+        max_overflow=max_overflow,  # 최대 추가 연결 수
+        pool_timeout=DB_POOL_TIMEOUT  # 연결을 기다리는 최대 시간(초)
+    )
+    limits = _pool_limits[name] = {"pool_size": pool_size, "max_overflow": max_overflow, "peak_checked_out": 0}
+
+    @event.listens_for(created.sync_engine.pool, "checkout")
+    def _track_peak(dbapi_connection, connection_record, connection_proxy) -> None:
+        limits["peak_checked_out"] = max(limits["peak_checked_out"], created.sync_engine.pool.checkedout())
+
+    return created
+
+
+# 비동기 엔진 생성 (주 DB: 읽기/쓰기)
+engine = _create_engine("primary", DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW)
+
+# 읽기 전용 엔진 (복제본이 설정되지 않으면 주 DB 엔진을 공유)
+if DATABASE_REPLICA_URL:
+    logger.info(f"Routing read-only sessions to replica: {DATABASE_REPLICA_URL}")
+    read_engine = _create_engine("replica", DATABASE_REPLICA_URL, DB_REPLICA_POOL_SIZE, DB_REPLICA_MAX_OVERFLOW)
+else:
+    read_engine = engine
 
 # 비동기 세션 팩토리 생성
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
-# Base 클래스 생성
-Base = declarative_base()
+# 읽기 전용 세션 팩토리: 트랜잭션마다 READ ONLY로 시작하며 커밋하지 않음
+read_only_session = sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False, info={_READ_ONLY_KEY: True}
+)
+
+
+@event.listens_for(Session, "after_begin")
+def _set_transaction_read_only(session: Session, transaction, connection) -> None:
+    # 읽기 전용 세션의 트랜잭션은 시작할 때마다 READ ONLY로 지정 (롤백 후 새 트랜잭션 포함)
+    if session.info.get(_READ_ONLY_KEY):
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+def pool_stats() -> Dict[str, Any]:
+    """엔진별 연결 풀 사용 현황을 반환합니다."""
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["replica"] = read_engine
+    stats = {}
+    for name, target in engines.items():
+        pool = target.sync_engine.pool
+        limits = _pool_limits[name]
+        capacity = limits["pool_size"] + limits["max_overflow"]
+        checked_out = pool.checkedout()
+        stats[name] = {
+            **limits,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "utilization": round(checked_out / capacity, 3) if capacity else None
+        }
+    return stats
+
+# 스키마 마이그레이션 설정 (서비스 루트의 alembic.ini)
+ALEMBIC_CONFIG_PATH = os.getenv(
+    "ALEMBIC_CONFIG",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "alembic.ini")
+)
 
 async def get_db_session() -> AsyncSession:
     """데이터베이스 세션을 반환합니다."""
@@ -49,27 +127,47 @@ async def get_db_session() -> AsyncSession:
     try:
         yield session
         await session.commit()
+        logger.debug(f"요청 처리 중 실행된 SQL 문 수: {statement_count(session)}")
     except Exception:
         await session.rollback()
         raise
     finally:
         await session.close()
 
-async def init_db():
-    """데이터베이스 초기화 함수"""
+async def get_read_session() -> AsyncSession:
+    """읽기 전용 데이터베이스 세션을 반환합니다.
+
+    복제본이 설정되어 있으면 복제본으로 연결하며, 트랜잭션은 READ ONLY로 시작하고
+    요청이 끝나면 커밋 없이 롤백합니다.
+    """
+    session = read_only_session()
     try:
-        async with engine.begin() as conn:
-            if env == "development":
-                # 개발 환경에서만 테이블 재생성
-                logger.info("Dropping existing tables...")
-                await conn.run_sync(Base.metadata.drop_all)
-                logger.info("Creating new tables...")
-                await conn.run_sync(Base.metadata.create_all)
-            else:
-                # 프로덕션 환경에서는 테이블 생성만
-                logger.info("Creating tables if they don't exist...")
-                await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database initialization completed successfully")
-    except Exception as e:
-        logger.error(f"Database initialization failed: {str(e)}")
-        raise 
\ No newline at end of file
+        yield session
+        logger.debug(f"요청 처리 중 실행된 SQL 문 수 (읽기 전용): {statement_count(session)}")
+    finally:
+        # 연결을 풀에 반환하면서 트랜잭션은 롤백됨
+        await session.close()
+
+async def init_db():
+    """데이터베이스 스키마 리비전을 확인합니다.
+
+    테이블 생성/변경은 `alembic upgrade head`로 배포 시에만 수행하며,
+    애플리케이션은 DB가 최신 리비전인지 확인만 합니다.
+    """
+    config = Config(ALEMBIC_CONFIG_PATH)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_CONFIG_PATH), "alembic"))
+    head_revision = ScriptDirectory.from_config(config).get_current_head()
+
+    async with engine.connect() as conn:
+        current_revision = await conn.run_sync(
+            lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision()
+        )
+
+    if current_revision != head_revision:
+        message = (
+            f"DB 스키마 리비전이 최신이 아닙니다 (현재: {current_revision}, 필요: {head_revision}). "
+            f"`alembic upgrade head`를 실행하세요."
+        )
+        logger.error(message)
+        raise RuntimeError(message)
+    logger.info(f"Database schema is at revision {current_revision}")
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import math
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.foundation.core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 두 개의 int4 키를 쓰는 advisory lock 공간은 bigint 키(파티션 생성 잠금)와 겹치지 않음
+_LOCK_NAMESPACE = 0x46494E  # "FIN"
+# lock_not_available: lock_timeout 안에 잠금을 얻지 못함
+_LOCK_NOT_AVAILABLE = "55P03"
+
+
+class _LoadAbandoned(Exception):
+    """적재를 맡은 요청이 취소되어 적재가 중단됨. 기다리던 요청은 직접 다시 적재합니다."""
+
+
+class IngestionLockTimeoutError(Exception):
+    """다른 작업자의 적재가 lock_wait 안에 끝나지 않아 잠금을 얻지 못한 경우. retry_after는 재시도까지 기다릴 시간(초)
+
+    잠금 없이 DART를 다시 조회하지 않도록 요청을 실패시키며, 트랜잭션이 중단되었으므로 세션은 롤백해야 합니다.
+    """
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class IngestionSingleFlight:
+    """회사(corp_code)별 재무제표 적재를 한 번만 실행하도록 조율합니다.
+
+    - 프로세스 안: 같은 키의 적재가 진행 중이면 새로 실행하지 않고 진행 중인 적재의 결과를 기다립니다.
+    - 작업자(프로세스/복제본) 사이: 적재하는 쪽이 트랜잭션 범위 advisory lock을 잡고, 다른 작업자는
+      잠금이 풀릴 때(먼저 적재한 쪽의 커밋)까지 기다린 뒤 저장된 데이터를 다시 확인합니다.
+    """
+
+    def __init__(self, lock_wait: float):
+        self.lock_wait = lock_wait
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._stats = {
+            "leaders": 0,
+            "coalesced": 0,
+            "abandoned": 0,
+            "lock_waits": 0,
+            "lock_timeouts": 0
+        }
+
+    async def run(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """같은 키의 적재가 진행 중이면 그 결과를 기다리고, 없으면 loader를 실행합니다.
+
+        loader는 적재를 맡은 요청의 DB 세션을 사용하므로 그 요청이 취소되면 적재도 중단됩니다.
+        이때 기다리던 요청은 취소되지 않고 자신의 loader로 다시 적재합니다.
+        """
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            self._stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(inflight)
+            except _LoadAbandoned:
+                self._stats["abandoned"] += 1
+
+        future = asyncio.get_running_loop().create_future()
+        # 대기자가 없어도 예외가 "retrieved"로 처리되도록 함
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        self._stats["leaders"] += 1
+        try:
+            value = await loader()
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.set_exception(_LoadAbandoned(key))
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def lock(self, db_session: AsyncSession, corp_code: str) -> None:
+        """세션 트랜잭션에서 회사별 적재 잠금(pg_advisory_xact_lock)을 잡습니다.
+
+        잠금은 트랜잭션이 커밋/롤백될 때 풀리므로, 잠금을 잡은 뒤에는 저장된 데이터를 다시 확인해야 합니다.
+        다른 작업자가 잠금을 잡고 있으면 트랜잭션 범위 lock_timeout(lock_wait 초)까지 서버에서 기다리며,
+        그 안에 얻지 못하면 잠금 없이 진행하지 않고 IngestionLockTimeoutError를 발생시킵니다.
+        """
+        params = {"namespace": _LOCK_NAMESPACE, "corp_code": corp_code}
+        acquired = await db_session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:namespace, hashtext(:corp_code))"),
+            params
+        )
+        if acquired.scalar():
+            return
+
+        self._stats["lock_waits"] += 1
+        logger.info(f"다른 작업자가 적재 중입니다. 완료를 기다립니다: {corp_code}")
+        previous = await db_session.execute(
+            text("SELECT current_setting('lock_timeout'), set_config('lock_timeout', :timeout, true)"),
+            {"timeout": f"{max(1, int(self.lock_wait * 1000))}ms"}
+        )
+        previous_timeout = previous.scalar()
+        try:
+            await db_session.execute(text("SELECT pg_advisory_xact_lock(:namespace, hashtext(:corp_code))"), params)
+        except DBAPIError as e:
+            if getattr(e.orig, "sqlstate", None) != _LOCK_NOT_AVAILABLE:
+                raise
+            self._stats["lock_timeouts"] += 1
+            logger.warning(f"적재 잠금 대기 시간 초과: {corp_code}")
+            raise IngestionLockTimeoutError(
+                f"다른 작업자가 같은 회사({corp_code})를 적재 중입니다. 잠시 후 다시 시도해 주세요.",
+                retry_after=max(1, math.ceil(self.lock_wait))
+            ) from e
+        # 같은 트랜잭션의 저장 문장에는 원래 lock_timeout을 적용
+        await db_session.execute(text("SELECT set_config('lock_timeout', :timeout, true)"), {"timeout": previous_timeout})
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "inflight": len(self._inflight)}
+
+
+ingestion_single_flight = IngestionSingleFlight(lock_wait=settings.INGEST_LOCK_WAIT)
@@ -0,0 +1,80 @@
+import logging
+import re
+from datetime import date
+from typing import Iterable, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import text
+
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.database.database import engine
+
+logger = logging.getLogger(__name__)
+
+# 사업연도(bsns_year)별 LIST 파티션 테이블 (alembic 0002)
+PARTITIONED_TABLES: Tuple[str, ...] = ("financials", "metrics")
+
+# DART 재무정보(fnlttSinglAcntAll) 제공 시작 사업연도
+FIRST_PARTITION_YEAR = 2015
+
+_YEAR = re.compile(r"\d{4}")
+
+
+def partition_name(table: str, bsns_year: str) -> str:
+    return f"{table}_{bsns_year}"
+
+
+def recent_years_floor(today: Optional[date] = None) -> str:
+    """"최근 N개 사업연도" 조회가 읽을 가장 이른 사업연도.
+
+    최근 연도를 고르는 서브쿼리에도 상수 연도 하한을 두어, 하한 이전 파티션은 계획/실행 시점에 제외되도록 합니다.
+    """
+    today = today or date.today()
+    return str(today.year - settings.FIN_RECENT_YEARS_WINDOW)
+
+
+async def precreate_year_partitions(today: Optional[date] = None) -> None:
+    """DART 재무정보 제공 시작 연도부터 다음 해까지의 파티션을 미리 만듭니다 (애플리케이션 시작 시).
+
+    파티션 생성은 부모 테이블을 잠그므로 저장 요청의 트랜잭션에서는 만들지 않습니다.
+    저장되는 사업보고서의 사업연도는 올해 - 1 이하이므로 다음 해까지 만들어 두면 재시작 없이 해가 바뀌어도 충분합니다.
+    """
+    today = today or date.today()
+    years = [str(year) for year in range(FIRST_PARTITION_YEAR, today.year + 2)]
+    await create_year_partitions(years)
+
+
+async def create_year_partitions(bsns_years: Iterable[str], tables: Sequence[str] = PARTITIONED_TABLES) -> None:
+    """없는 사업연도 파티션을 별도 트랜잭션에서 만들고 바로 커밋합니다."""
+    wanted = _partition_keys(bsns_years, tables)
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            text("SELECT relname FROM pg_class WHERE relname = ANY(:names) AND relispartition"),
+            {"names": [partition_name(table, year) for table, year in wanted]}
+        )
+        existing = {row.relname for row in result}
+
+        created = []
+        for table, year in sorted(wanted):
+            name = partition_name(table, year)
+            if name in existing:
+                continue
+            # 동시에 같은 파티션을 만드는 트랜잭션끼리 직렬화 (먼저 만든 쪽이 커밋한 뒤 IF NOT EXISTS로 통과)
+            await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:name))"), {"name": name})
+            await conn.execute(
+                text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} FOR VALUES IN ('{year}')")
+            )
+            created.append(name)
+    for name in created:
+        logger.info(f"사업연도 파티션 생성: {name}")
+
+
+def _partition_keys(bsns_years: Iterable[str], tables: Sequence[str]) -> Set[Tuple[str, str]]:
+    wanted = set()
+    for year in {str(year) for year in bsns_years}:
+        if not _YEAR.fullmatch(year):
+            raise ValueError(f"올바르지 않은 사업연도입니다: {year}")
+        for table in tables:
+            if table not in PARTITIONED_TABLES:
+                raise ValueError(f"사업연도 파티션 테이블이 아닙니다: {table}")
+            wanted.add((table, year))
+    return wanted
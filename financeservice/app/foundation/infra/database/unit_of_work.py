@@ -0,0 +1,60 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+T = TypeVar("T")
+
+_MEMO_KEY = "uow_memo"
+_STATEMENT_COUNT_KEY = "uow_statement_count"
+
+
+def _memo(db_session: AsyncSession) -> Dict[Tuple[Hashable, ...], Any]:
+    return db_session.info.setdefault(_MEMO_KEY, {})
+
+
+async def memoized(db_session: AsyncSession, key: Tuple[Hashable, ...], loader: Callable[[], Awaitable[T]]) -> T:
+    """세션(요청) 범위에서 같은 조회를 한 번만 실행하고 결과를 재사용합니다.
+
+    key의 첫 요소는 무효화 단위(예: "company", "financials")로 사용합니다.
+    """
+    memo = _memo(db_session)
+    if key in memo:
+        return memo[key]
+    value = await loader()
+    memo[key] = value
+    return value
+
+
+def invalidate_memo(db_session: AsyncSession, namespace: Optional[str] = None) -> None:
+    """저장으로 바뀐 조회 결과를 메모에서 제거합니다. namespace가 없으면 전부 제거합니다."""
+    memo = _memo(db_session)
+    if namespace is None:
+        memo.clear()
+        return
+    for key in [key for key in memo if key[0] == namespace]:
+        del memo[key]
+
+
+def statement_count(db_session: AsyncSession) -> int:
+    """세션에서 실행된 SQL 문 수 (드라이버로 직접 실행한 조회 포함)"""
+    return db_session.info.get(_STATEMENT_COUNT_KEY, 0)
+
+
+def count_statement(db_session: AsyncSession) -> None:
+    """do_orm_execute를 거치지 않고 드라이버(asyncpg)로 직접 실행한 SQL 문을 세션의 문 수에 더합니다."""
+    info = db_session.info
+    info[_STATEMENT_COUNT_KEY] = info.get(_STATEMENT_COUNT_KEY, 0) + 1
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _count_statement(orm_execute_state: ORMExecuteState) -> None:
+    info = orm_execute_state.session.info
+    info[_STATEMENT_COUNT_KEY] = info.get(_STATEMENT_COUNT_KEY, 0) + 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_memo_on_rollback(session: Session) -> None:
+    # 롤백된 트랜잭션에서 읽은 값은 재사용하지 않음
+    session.info.pop(_MEMO_KEY, None)
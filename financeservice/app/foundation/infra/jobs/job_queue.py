@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from app.foundation.core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+_current_job: ContextVar[Optional["Job"]] = ContextVar("current_job", default=None)
+
+
+class JobQueueFullError(Exception):
+    """작업 대기열이 가득 차 새 작업을 받을 수 없음"""
+
+
+class Job:
+    """비동기 적재 작업 한 건의 상태와 진행 단계 기록"""
+
+    def __init__(self, key: str, description: str):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.description = description
+        self.status = JOB_QUEUED
+        self.stage: Optional[str] = None
+        self.events: List[Dict[str, Any]] = []
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now().isoformat()
+        self.updated_at = self.created_at
+        self.finished_at: Optional[float] = None
+        self._subscribers: List["asyncio.Queue[Dict[str, Any]]"] = []
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED)
+
+    def _emit(self, event_type: str, **data: Any) -> None:
+        self.updated_at = datetime.now().isoformat()
+        event = {"seq": len(self.events), "type": event_type, "at": self.updated_at, **data}
+        self.events.append(event)
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    def report_stage(self, stage: str, message: str = "") -> None:
+        self.stage = stage
+        self._emit("stage", stage=stage, message=message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "key": self.key,
+            "description": self.description,
+            "status": self.status,
+            "stage": self.stage,
+            "stages": [event for event in self.events if event["type"] == "stage"],
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
+
+
+def report_stage(stage: str, message: str = "") -> None:
+    """현재 작업의 진행 단계를 기록합니다. 작업 밖(동기 요청)에서는 아무 동작도 하지 않습니다."""
+    job = _current_job.get()
+    if job is not None:
+        job.report_stage(stage, message)
+
+
+class JobQueue:
+    """프로세스 내 작업 대기열과 제한된 수의 작업자.
+
+    같은 키(예: 기업 고유번호)로 진행 중인 작업이 있으면 새 작업을 만들지 않고 기존 작업을 반환하며,
+    완료된 작업은 결과 보존 시간이 지나면 정리됩니다.
+    """
+
+    def __init__(self, workers: int, max_queued: int, result_ttl: int):
+        self.workers = workers
+        self.result_ttl = result_ttl
+        self._queue: "asyncio.Queue[Job]" = asyncio.Queue(maxsize=max_queued)
+        self._jobs: Dict[str, Job] = {}
+        self._active_by_key: Dict[str, Job] = {}
+        self._runners: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._stats = {
+            "submitted": 0,
+            "deduplicated": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "rejected": 0
+        }
+
+    def submit(self, key: str, run: Callable[[], Awaitable[Any]], description: str = "") -> Job:
+        """작업을 대기열에 넣습니다. 같은 키의 작업이 진행 중이면 그 작업을 반환합니다."""
+        self._prune()
+        active = self._active_by_key.get(key)
+        if active is not None:
+            self._stats["deduplicated"] += 1
+            return active
+
+        job = Job(key, description)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            raise JobQueueFullError("작업 대기열이 가득 찼습니다. 잠시 후 다시 시도해 주세요.")
+        self._jobs[job.id] = job
+        self._active_by_key[key] = job
+        self._runners[job.id] = run
+        self._stats["submitted"] += 1
+        job._emit("queued", position=self._queue.qsize())
+        logger.info(f"작업 등록 - {job.id} ({description or key})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def events(self, job_id: str, keepalive: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """작업의 지난 이벤트를 먼저 돌려주고, 완료될 때까지 새 이벤트를 이어서 돌려줍니다.
+
+        keepalive 초 동안 새 이벤트가 없으면 연결 유지를 위해 None을 돌려줍니다.
+        """
+        job = self._jobs[job_id]
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        job._subscribers.append(queue)
+        try:
+            replayed = len(job.events)
+            for event in job.events[:replayed]:
+                yield event
+            if job.finished:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event["seq"] < replayed:
+                    continue
+                yield event
+                if event["type"] == "done":
+                    return
+        finally:
+            job._subscribers.remove(queue)
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            run = self._runners.pop(job.id)
+            token = _current_job.set(job)
+            job.status = JOB_RUNNING
+            job._emit("running")
+            try:
+                job.result = await run()
+                job.status = JOB_SUCCEEDED
+                self._stats["succeeded"] += 1
+            except asyncio.CancelledError:
+                job.status = JOB_FAILED
+                job.error = "작업이 취소되었습니다."
+                raise
+            except Exception as e:
+                job.status = JOB_FAILED
+                job.error = str(e)
+                self._stats["failed"] += 1
+                logger.error(f"작업 실패 - {job.id} ({job.description or job.key}): {str(e)}")
+            finally:
+                _current_job.reset(token)
+                job.finished_at = time.monotonic()
+                self._active_by_key.pop(job.key, None)
+                job._emit("done", status=job.status, error=job.error)
+                self._queue.task_done()
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.result_ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "queued": self._queue.qsize(),
+            "running": sum(1 for job in self._active_by_key.values() if job.status == JOB_RUNNING),
+            "retained": len(self._jobs),
+            "workers": len(self._tasks)
+        }
+
+
+job_queue = JobQueue(
+    workers=settings.JOB_WORKERS,
+    max_queued=settings.JOB_MAX_QUEUED,
+    result_ttl=settings.JOB_RESULT_TTL
+)
@@ -9,6 +9,17 @@ from dotenv import load_dotenv
 
 from app.api.fin_router import router as fin_router
 from app.foundation.infra.database.database import init_db
+from app.foundation.infra.database.partitions import precreate_year_partitions
+from app.foundation.infra.cache.response_cache import response_cache
+from app.foundation.infra.dart.corp_code_index import corp_code_index
+from app.foundation.infra.dart.http_client import dart_http_client
+from app.foundation.infra.jobs.job_queue import job_queue
+from app.domain.service.disclosure_poller import disclosure_poller
+from app.domain.service.financials_freshness import financials_freshness
+from app.domain.service.prefetch_scheduler import prefetch_scheduler
+from app.domain.service.write_behind_queue import write_behind_queue
+from app.foundation.core.config.settings import settings
+from app.foundation.core.container import init_container
 
 # 환경 변수 로드
 env = os.getenv("APP_ENV", "development")
@@ -45,7 +56,39 @@ current_time: Callable[[], str] = lambda: datetime.now(timezone.utc).strftime("%
 async def startup_event():
     logger.info(f"Starting application in {env} environment")
     await init_db()
-    logger.info("Database initialized")
+    logger.info("Database schema verified")
+    # 사업연도 파티션은 저장 요청 중에 만들지 않도록 시작 시 미리 생성
+    await precreate_year_partitions()
+    # 애플리케이션 범위 의존성은 한 번만 구성하여 모든 요청이 공유
+    container = init_container()
+    await dart_http_client.start()
+    job_queue.start()
+    # 지연 저장 작업자는 설정과 관계없이 시작하여 이전 실행의 스필 파일을 반영
+    write_behind_queue.start(container.financial_statement_service)
+    # 기업 고유번호 인덱스: 로컬 파일이 있으면 즉시 복원하고, 갱신은 백그라운드에서 수행
+    corp_code_index.load_from_file()
+    corp_code_index.start_refresh(container.dart_api.download_corp_code_archive)
+    logger.info("Corp code index refresh scheduled")
+    # 신규/정정 공시 증분 반영
+    if settings.DISCLOSURE_POLL_ENABLED:
+        disclosure_poller.start(container.dart_api.fetch_disclosure_list, container.financial_statement_service)
+        logger.info("Disclosure poller started")
+    # 자주 조회되는 회사의 재무 지표 사전 적재 (저장된 상위 목록으로 시작 시 워밍)
+    if settings.PREFETCH_ENABLED:
+        prefetch_scheduler.start(container.fin_service)
+        logger.info("Prefetch scheduler started")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await job_queue.stop()
+    await write_behind_queue.stop()
+    await financials_freshness.stop()
+    await prefetch_scheduler.stop()
+    await disclosure_poller.stop()
+    await corp_code_index.stop_refresh()
+    await dart_http_client.close()
+    await response_cache.close()
+    logger.info("Application shutdown completed")
 
 @app.get("/")
 async def home():
@@ -0,0 +1,129 @@
+"""요청마다 실행되는 조회: hot_read_repository(asyncpg 직접 실행)와 SQLAlchemy text() 경로 비교.
+
+같은 SQL을 두 경로로 실행합니다.
+- sqlalchemy: session.execute(text(...)) 후 이전 구현처럼 행마다 result.keys()로 dict를 만듦
+- asyncpg: hot_read_repository 함수 (세션 연결의 asyncpg statement cache, asyncpg.Record 반환)
+
+실행 (financeservice 디렉터리, 벤치마크 전용 DB):
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_hot_read --seed
+
+결과 (PostgreSQL 16.2, 로컬 유닉스 소켓, 200개사 × 2015~2024년 × 150계정 = 30만 행, 1000회 반복):
+
+    query                       rows  sqlalchemy median/p95 ms  asyncpg median/p95 ms  speedup
+    company by name                1      0.18 / 0.26            0.08 / 0.15      2.3x
+    financials 1 year            150      1.27 / 1.83            0.91 / 1.29      1.4x
+    financials recent 3 years    450      3.50 / 4.73            2.36 / 2.88      1.5x
+    financials all years        1500     12.67 / 14.04           6.40 / 7.69      2.0x
+"""
+import argparse
+import asyncio
+import re
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repository import hot_read_repository as hot_read
+from app.foundation.infra.database.database import async_session, engine
+from app.foundation.infra.database.partitions import recent_years_floor
+from benchmarks.seed import bench_corp_code, seed
+
+
+def as_text(sql: str, names: Tuple[str, ...]):
+    """asyncpg 위치 파라미터($1, $2...)를 SQLAlchemy 이름 파라미터로 바꾼 같은 문장"""
+    return text(re.sub(r"\$(\d)", lambda match: f":{names[int(match.group(1)) - 1]}", sql))
+
+
+async def sqlalchemy_rows(db_session: AsyncSession, statement, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # 이전 구현의 결과 변환 (행마다 컬럼 이름으로 dict 생성)
+    result = await db_session.execute(statement, params)
+    data = []
+    for row in result:
+        row_dict = {}
+        for idx, column in enumerate(result.keys()):
+            row_dict[column] = row[idx]
+        data.append(row_dict)
+    return data
+
+
+async def measure(run: Callable[[], Awaitable[Any]], repeat: int) -> Tuple[float, float, int]:
+    rows = len(await run())
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1], rows
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", action="store_true", help="벤치마크 데이터를 다시 적재")
+    parser.add_argument("--companies", type=int, default=200)
+    parser.add_argument("--first-year", type=int, default=2015)
+    parser.add_argument("--last-year", type=int, default=2024)
+    parser.add_argument("--rows-per-year", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    # 문장마다 SQL을 출력하면 측정값에 로그 비용이 섞이므로 끔
+    engine.echo = False
+
+    if args.seed:
+        elapsed = await seed(args.companies, args.first_year, args.last_year, args.rows_per_year)
+        print(f"seeded {args.companies} companies x {args.last_year - args.first_year + 1} years in {elapsed:.1f}s")
+
+    corp_code = bench_corp_code(7)
+    company_name = "bench_company_7"
+    year = str(args.last_year)
+    min_year = recent_years_floor()
+
+    by_name = as_text(hot_read._COMPANY_BY_NAME, ("company_name",))
+    by_year = as_text(hot_read._FINANCIALS_BY_YEAR, ("corp_code", "year"))
+    recent = as_text(hot_read._FINANCIALS_RECENT_YEARS, ("corp_code", "year_count", "min_year"))
+    all_years = as_text(hot_read._FINANCIALS_ALL_YEARS, ("corp_code",))
+
+    async with async_session() as session:
+        cases = [
+            (
+                "company by name",
+                lambda: sqlalchemy_rows(session, by_name, {"company_name": company_name}),
+                lambda: _as_list(hot_read.fetch_company_by_name(session, company_name))
+            ),
+            (
+                "financials 1 year",
+                lambda: sqlalchemy_rows(session, by_year, {"corp_code": corp_code, "year": year}),
+                lambda: hot_read.fetch_financials(session, corp_code, int(year))
+            ),
+            (
+                "financials recent 3 years",
+                lambda: sqlalchemy_rows(session, recent, {"corp_code": corp_code, "year_count": 3, "min_year": min_year}),
+                lambda: hot_read.fetch_financials(session, corp_code, recent_years=3)
+            ),
+            (
+                "financials all years",
+                lambda: sqlalchemy_rows(session, all_years, {"corp_code": corp_code}),
+                lambda: hot_read.fetch_financials(session, corp_code)
+            ),
+        ]
+        print(f"{'query':26} {'rows':>5}  sqlalchemy median/p95 ms  asyncpg median/p95 ms  speedup")
+        for name, baseline, hot in cases:
+            base_median, base_p95, rows = await measure(baseline, args.repeat)
+            hot_median, hot_p95, hot_rows = await measure(hot, args.repeat)
+            assert rows == hot_rows, (name, rows, hot_rows)
+            print(
+                f"{name:26} {rows:>5}  {base_median:>8.2f} / {base_p95:<8.2f}      "
+                f"{hot_median:>6.2f} / {hot_p95:<8.2f}  {base_median / hot_median:.1f}x"
+            )
+    await engine.dispose()
+
+
+async def _as_list(row: Awaitable[Any]) -> List[Any]:
+    value = await row
+    return [] if value is None else [value]
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,139 @@
+""""최근 N개 사업연도" 조회의 연도 하한(:min_year) 유무 비교.
+
+최근 연도를 고르는 서브쿼리에 상수 연도 하한이 없으면 모든 사업연도 파티션이 계획에 들어가고,
+하한이 있으면 하한 이전 파티션이 계획(또는 실행 시작) 단계에서 제외됩니다.
+같은 SQL에서 하한 조건만 뺀 문장을 기준(before)으로 실행 계획의 파티션 수와 지연 시간을 비교합니다.
+
+실행 (financeservice 디렉터리, 벤치마크 전용 DB):
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_partition_pruning --seed
+
+결과 (PostgreSQL 16.2, 로컬 유닉스 소켓, 200개사 × 2015~2024년 × 150계정 = 30만 행,
+FIN_RECENT_YEARS_WINDOW=5이므로 하한은 2021, 500회 반복 중앙값):
+
+    query                               plan partitions   scanned  median ms (before -> after)
+    hot_read recent years (asyncpg)         20 -> 14       6 -> 6    1.46 -> 1.41
+    SELECT_STORED_METRICS                   30 -> 24       7 -> 7    0.75 -> 0.63
+    SELECT_RATIO_INPUT_RECENT_YEARS         20 -> 14       6 -> 6    0.45 -> 0.43
+    SELECT_RECENT_FINANCIALS (50개사)       20 -> 14      13 -> 7    149.94 -> 139.63
+
+단일 회사 조회의 최근 연도 서브쿼리는 이미 역순 Append로 필요한 파티션까지만 읽으므로(scanned 동일)
+이득은 계획에 들어가는 파티션 수 감소(계획/잠금 비용)에 그칩니다. 여러 회사 조회는 서브쿼리가 모든 파티션을
+읽으므로 읽는 파티션 자체가 줄어듭니다. 저장된 사업연도가 늘어날수록 차이는 커집니다.
+"""
+import argparse
+import asyncio
+import json
+import re
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import text
+
+from app.domain.repository import hot_read_repository, queries
+from app.domain.service.ratio_service import RATIO_ACCOUNT_NAMES
+from app.foundation.infra.database.database import engine
+from app.foundation.infra.database.partitions import recent_years_floor
+from benchmarks.seed import bench_corp_code, bench_corp_codes, seed
+
+_MIN_YEAR_PREDICATE = re.compile(r"^\s*AND \w*\.?bsns_year >= (:min_year|\$3)\s*$\n", re.MULTILINE)
+
+
+def without_floor(sql: str) -> str:
+    """연도 하한 조건만 뺀 기준 문장"""
+    stripped = _MIN_YEAR_PREDICATE.sub("", sql)
+    if stripped == sql:
+        raise ValueError("연도 하한 조건을 찾을 수 없습니다")
+    return stripped
+
+
+def plan_partitions(plan: Dict[str, Any]) -> Tuple[int, int]:
+    """실행 계획에서 (계획에 남은 파티션 스캔 수, 실제 실행된 파티션 스캔 수)"""
+    planned = executed = 0
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if node.get("Relation Name", "").startswith(("financials_", "metrics_")):
+            planned += 1
+            if node.get("Actual Loops", 0) > 0:
+                executed += 1
+        stack.extend(node.get("Plans", []))
+    return planned, executed
+
+
+async def measure(run: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", action="store_true", help="벤치마크 데이터를 다시 적재")
+    parser.add_argument("--companies", type=int, default=200)
+    parser.add_argument("--first-year", type=int, default=2015)
+    parser.add_argument("--last-year", type=int, default=2024)
+    parser.add_argument("--rows-per-year", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+    # 문장마다 SQL을 출력하면 측정값에 로그 비용이 섞이므로 끔
+    engine.echo = False
+
+    if args.seed:
+        elapsed = await seed(args.companies, args.first_year, args.last_year, args.rows_per_year)
+        print(f"seeded {args.companies} companies x {args.last_year - args.first_year + 1} years in {elapsed:.1f}s")
+
+    corp_code = bench_corp_code(7)
+    min_year = recent_years_floor()
+    batch = bench_corp_codes(min(50, args.companies))
+    sqlalchemy_cases = [
+        ("SELECT_STORED_METRICS", queries.SELECT_STORED_METRICS.text, {"corp_code": corp_code, "min_year": min_year}),
+        ("SELECT_RATIO_INPUT_RECENT_YEARS", queries.SELECT_RATIO_INPUT_RECENT_YEARS.text,
+         {"corp_code": corp_code, "account_nms": RATIO_ACCOUNT_NAMES, "min_year": min_year}),
+        ("SELECT_RECENT_FINANCIALS (50개사)", queries.SELECT_RECENT_FINANCIALS_BY_CORP_CODES.text,
+         {"corp_codes": batch, "year_count": 3, "min_year": min_year}),
+    ]
+
+    print(f"{'query':34} {'plan partitions':>16} {'scanned':>9}  median ms (before -> after)")
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+
+        sql = hot_read_repository._FINANCIALS_RECENT_YEARS
+        variants = [(without_floor(sql), (corp_code, 3)), (sql, (corp_code, 3, min_year))]
+        results = []
+        for statement, params in variants:
+            explain = await raw.fetchval("EXPLAIN (ANALYZE, FORMAT JSON) " + statement, *params)
+            prepared = await raw.prepare(statement)
+            median = await measure(lambda: prepared.fetch(*params), args.repeat)
+            results.append((plan_partitions(_json(explain)[0]["Plan"]), median))
+        _report("hot_read recent years (asyncpg)", results)
+
+        for name, sql, params in sqlalchemy_cases:
+            results = []
+            before_params = {key: value for key, value in params.items() if key != "min_year"}
+            for statement, bind in ((text(without_floor(sql)), before_params), (text(sql), params)):
+                explain = (await conn.execute(text("EXPLAIN (ANALYZE, FORMAT JSON) " + statement.text), bind)).scalar()
+                median = await measure(lambda: conn.execute(statement, bind), args.repeat)
+                results.append((plan_partitions(_json(explain)[0]["Plan"]), median))
+            _report(name, results)
+    await engine.dispose()
+
+
+def _json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _report(name: str, results: List[Tuple[Tuple[int, int], float]]) -> None:
+    (before_plan, before_scan), before_ms = results[0]
+    (after_plan, after_scan), after_ms = results[1]
+    print(
+        f"{name:34} {before_plan:>7} -> {after_plan:<6} {before_scan:>3} -> {after_scan:<3}"
+        f"  {before_ms:.2f} -> {after_ms:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
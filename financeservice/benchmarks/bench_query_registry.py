@@ -0,0 +1,67 @@
+"""queries.py의 미리 만든 text() 문장과 호출마다 text()를 만드는 경우 비교.
+
+SQLAlchemy 컴파일 캐시의 키는 SQL 문자열로 정해지므로, 호출마다 같은 문자열로 text()를 새로 만들어도
+컴파일은 캐시에서 재사용됩니다 (두 경로 모두 cache_hit). 미리 만들어 두어 줄어드는 것은 TextClause 생성
+(바인드 파라미터 정규식 분석)과 캐시 키 계산뿐이며, 이는 DB 왕복에 비해 작습니다.
+
+실행 (financeservice 디렉터리, 벤치마크 전용 DB):
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_query_registry
+
+결과 (PostgreSQL 16.2, 로컬 유닉스 소켓, 중앙값):
+
+    statement              text() 생성 us   execute 미리 만든 문장 / 호출마다 생성 ms   cache hit
+    EXISTS_FINANCIALS           6.3           0.143 / 0.170                            yes / yes
+    UPSERT_FINANCIALS          97.2           (생성 비용만 측정)
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import timeit
+
+from sqlalchemy import text
+from sqlalchemy.engine.default import CACHE_HIT
+
+from app.domain.repository import queries
+from app.foundation.infra.database.database import engine
+from benchmarks.seed import bench_corp_code
+
+
+def construct_us(sql: str, number: int) -> float:
+    return timeit.timeit(lambda: text(sql), number=number) / number * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    # 문장마다 SQL을 출력하면 측정값에 로그 비용이 섞이므로 끔
+    engine.echo = False
+
+    for name in ("EXISTS_FINANCIALS", "UPSERT_FINANCIALS"):
+        print(f"{name}: text() 생성 {construct_us(getattr(queries, name).text, args.repeat * 10):.1f} us")
+
+    params = {"corp_code": bench_corp_code(7)}
+    sql = queries.EXISTS_FINANCIALS.text
+    async with engine.connect() as conn:
+        async def prebuilt():
+            return await conn.execute(queries.EXISTS_FINANCIALS, params)
+
+        async def per_call():
+            return await conn.execute(text(sql), params)
+
+        for label, run in (("미리 만든 문장", prebuilt), ("호출마다 생성", per_call)):
+            await run()
+            result = await run()
+            cache_hit = result.context.cache_hit == CACHE_HIT
+            samples = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                await run()
+                samples.append((time.perf_counter() - started) * 1000)
+            print(f"EXISTS_FINANCIALS execute ({label}): {statistics.median(samples):.3f} ms, cache hit: {cache_hit}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
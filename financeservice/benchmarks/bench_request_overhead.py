@@ -0,0 +1,188 @@
+"""요청마다 서비스 그래프를 새로 만들던 방식(before)과 애플리케이션 범위 컨테이너(after)의 요청당 오버헤드 비교.
+
+before는 컨테이너 도입 전 FinController(db)가 만들던 그래프를 현재 클래스로 재현합니다.
+DartApiService 3개(각각 load_dotenv()로 .env를 읽음), CompanyInfoService 2개, RatioService 2개,
+FinancialDataProcessor, FilingInvalidationService와 FinService의 load_dotenv() 1회입니다.
+after는 Depends(get_container)로 받은 컨테이너에서 container.fin_service(db)로 조립합니다.
+
+DB 연결 없이 오버헤드만 보도록 DB 세션 의존성은 빈 객체를 돌려주며, 두 경우 모두
+1) 그래프 생성만 (함수 호출)
+2) FastAPI 라우팅·의존성 주입·JSON 응답을 포함한 요청 한 건 (ASGI 앱을 직접 호출)
+을 측정합니다. 이전 구현이 요청마다 남기던 초기화 로그는 출력 비용이 환경마다 달라 제외했습니다.
+
+실행 (financeservice 디렉터리, DB에는 연결하지 않음):
+    DATABASE_URL=postgresql+asyncpg://... DART_API_KEY=... python -m benchmarks.bench_request_overhead
+
+결과 (Python 3.11, FastAPI 0.110, python-dotenv 1.0.1, .env 20줄, 2000회 반복 중앙값):
+
+    case                         before us   after us   saved us
+    service graph only             11669.4        2.9    11666.5
+    POST (routing + DI + JSON)     11924.7      263.0    11661.7
+
+before의 대부분은 요청마다 네 번 .env를 읽고 파싱하는 load_dotenv()입니다 (한 번에 약 2.5ms).
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+from dotenv import load_dotenv
+from fastapi import Depends, FastAPI
+
+from app.domain.controller.fin_controller import FinController
+from app.domain.service.company_info_service import CompanyInfoService
+from app.domain.service.dart_api_service import DartApiService
+from app.domain.service.fin_service import FinService
+from app.domain.service.financial_data_processor import FinancialDataProcessor
+from app.domain.service.financial_statement_service import FinancialStatementService
+from app.domain.service.ratio_service import RatioService
+from app.foundation.core.container import Container, get_container, init_container
+
+
+def write_env_file(lines: int) -> str:
+    """배포 환경과 비슷한 크기의 .env 파일 (요청마다 다시 읽히던 파일)"""
+    handle, path = tempfile.mkstemp(suffix=".env")
+    with os.fdopen(handle, "w", encoding="utf-8") as f:
+        f.write(f"DART_API_KEY={os.getenv('DART_API_KEY', 'bench')}\n")
+        for index in range(lines - 1):
+            f.write(f"BENCH_SETTING_{index}=value_{index}\n")
+    return path
+
+
+def legacy_controller(db_session: Any, env_path: str) -> FinController:
+    """컨테이너 도입 전 FinController(db)가 요청마다 만들던 서비스 그래프"""
+
+    def dart_api() -> DartApiService:
+        # 이전 DartApiService.__init__: load_dotenv() 후 환경 변수에서 키를 읽음
+        load_dotenv(env_path)
+        return DartApiService(os.getenv("DART_API_KEY"))
+
+    company_info_service = CompanyInfoService(db_session, dart_api())
+    # 이전 FinancialStatementService는 DartApiService, 데이터 처리기, RatioService, CompanyInfoService를 따로 만듦
+    financial_statement_service = FinancialStatementService(
+        db_session,
+        dart_api(),
+        FinancialDataProcessor(),
+        company_info_service=CompanyInfoService(db_session, dart_api()),
+        ratio_service=RatioService(db_session)
+    )
+    service = FinService.__new__(FinService)
+    service.db_session = db_session
+    service.company_info_service = company_info_service
+    service.financial_statement_service = financial_statement_service
+    service.ratio_service = RatioService(db_session)
+    # 이전 FinService.__init__도 load_dotenv() 후 키를 확인함
+    load_dotenv(env_path)
+    service.api_key = os.getenv("DART_API_KEY")
+    controller = FinController.__new__(FinController)
+    controller.db_session = db_session
+    controller.service = service
+    return controller
+
+
+async def stub_session():
+    yield SimpleNamespace(info={})
+
+
+def build_app(env_path: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/before")
+    async def before(db: Any = Depends(stub_session)) -> Dict[str, bool]:
+        legacy_controller(db, env_path)
+        return {"ok": True}
+
+    @app.post("/after")
+    async def after(db: Any = Depends(stub_session), container: Container = Depends(get_container)) -> Dict[str, bool]:
+        FinController(db, container)
+        return {"ok": True}
+
+    return app
+
+
+async def request(app: FastAPI, path: str) -> None:
+    """HTTP 서버 없이 ASGI 앱을 직접 호출합니다."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"content-length", b"0")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80)
+    }
+    sent: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    if sent[0]["status"] != 200:
+        raise RuntimeError(f"{path}: {sent[0]['status']}")
+
+
+def measure_sync(run: Callable[[], Any], repeat: int) -> float:
+    run()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+async def measure_async(run: Callable[[], Any], repeat: int) -> float:
+    await run()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--env-lines", type=int, default=20, help=".env 파일 줄 수")
+    args = parser.parse_args()
+
+    env_path = write_env_file(args.env_lines)
+    try:
+        container = init_container()
+        db_session = SimpleNamespace(info={})
+        app = build_app(env_path)
+
+        rows = [
+            (
+                "service graph only",
+                measure_sync(lambda: legacy_controller(db_session, env_path), args.repeat),
+                measure_sync(lambda: FinController(db_session, container), args.repeat)
+            ),
+            (
+                "POST (routing + DI + JSON)",
+                await measure_async(lambda: request(app, "/before"), args.repeat),
+                await measure_async(lambda: request(app, "/after"), args.repeat)
+            ),
+        ]
+        print(f"{'case':28} {'before us':>10} {'after us':>10} {'saved us':>10}")
+        for name, before_us, after_us in rows:
+            print(f"{name:28} {before_us:>10.1f} {after_us:>10.1f} {before_us - after_us:>10.1f}")
+    finally:
+        os.remove(env_path)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,172 @@
+"""save_financial_statements(테이블별 unnest 다중 행 upsert)와 행마다 upsert하는 이전 방식의 초당 저장 행 수 비교.
+
+이전 방식(per-row)은 행마다 text()를 만들어 재무제표 유형과 재무제표 행을 한 문장씩 upsert하던 구현을
+현재 스키마(accounts 사전, account_key)에 맞춘 것입니다. 한 회사·한 사업연도의 재무제표를 저장하며,
+새로 저장하는 경우(insert: 실행 전에 행 삭제)와 이미 있는 행을 덮어쓰는 경우(update)를 각각 측정합니다.
+
+실행 (financeservice 디렉터리, 벤치마크 전용 DB):
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.bench_save_statements
+
+결과 (PostgreSQL 16.2, 로컬 유닉스 소켓, 30회 반복 중앙값):
+
+    rows  case     per-row ms  rows/s     bulk ms  rows/s     speedup
+      50  insert        24.7     2023        3.6    13699     6.8x
+      50  update        21.3     2342        2.1    24051    10.3x
+     180  insert        82.3     2186        7.9    22744    10.4x
+     180  update        83.2     2162        4.6    39201    18.1x
+    1000  insert       485.2     2061       39.1    25568    12.4x
+    1000  update       470.0     2128       23.4    42765    20.1x
+
+이전 방식은 행 수와 관계없이 초당 약 2천 행(행마다 DB 왕복 1회)에 머물고, 다중 행 upsert는 문장 수가
+테이블당 1개로 고정되므로 행이 많을수록 초당 저장 행 수가 늘어납니다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repository.fin_repository import save_financial_statements
+from app.foundation.infra.database.database import async_session, engine
+from app.foundation.infra.database.partitions import create_year_partitions
+from benchmarks.seed import bench_corp_code
+
+BSNS_YEAR = "2024"
+SJ_DIVS = (("BS", "재무상태표"), ("IS", "손익계산서"), ("CF", "현금흐름표"))
+
+
+def statements(corp_code: str, rows: int) -> List[Dict[str, Any]]:
+    """fnlttSinglAcntAll 응답을 prepare_statement_data로 변환한 것과 같은 형태의 재무제표"""
+    data = []
+    for ord in range(rows):
+        sj_div, sj_nm = SJ_DIVS[ord % len(SJ_DIVS)]
+        data.append({
+            "corp_code": corp_code,
+            "corp_name": "bench_save_company",
+            "stock_code": None,
+            "bsns_year": BSNS_YEAR,
+            "sj_div": sj_div,
+            "sj_nm": sj_nm,
+            "account_nm": f"bench_save_account_{ord}",
+            "account_id": None,
+            "thstrm_nm": f"제 {BSNS_YEAR} 기",
+            "thstrm_amount": 1000000000 + ord,
+            "frmtrm_nm": f"제 {int(BSNS_YEAR) - 1} 기",
+            "frmtrm_amount": 900000000 + ord,
+            "bfefrmtrm_nm": None,
+            "bfefrmtrm_amount": None,
+            "ord": ord,
+            "currency": "KRW",
+            "rcept_no": f"BENCH{corp_code}{BSNS_YEAR}",
+            "reprt_code": "11011"
+        })
+    return data
+
+
+async def save_per_row(db_session: AsyncSession, data: List[Dict[str, Any]]) -> None:
+    """이전 구현: 행마다 text()를 만들고 한 문장씩 실행"""
+    for stmt in data:
+        await db_session.execute(text("""
+            INSERT INTO statement (sj_div, sj_nm, updated_at)
+            VALUES (:sj_div, :sj_nm, CURRENT_TIMESTAMP)
+            ON CONFLICT (sj_div) DO NOTHING
+        """), {"sj_div": stmt["sj_div"], "sj_nm": stmt["sj_nm"]})
+    await db_session.execute(text("""
+        INSERT INTO companies (corp_code, corp_name, stock_code, updated_at)
+        VALUES (:corp_code, :corp_name, :stock_code, CURRENT_TIMESTAMP)
+        ON CONFLICT (corp_code) DO UPDATE SET
+            corp_name = EXCLUDED.corp_name,
+            stock_code = EXCLUDED.stock_code
+    """), {"corp_code": data[0]["corp_code"], "corp_name": data[0]["corp_name"], "stock_code": ""})
+    await db_session.execute(text("""
+        INSERT INTO reports (rcept_no, reprt_code, updated_at)
+        VALUES (:rcept_no, :reprt_code, CURRENT_TIMESTAMP)
+        ON CONFLICT (rcept_no) DO NOTHING
+    """), {"rcept_no": data[0]["rcept_no"], "reprt_code": "11011"})
+    for stmt in data:
+        await db_session.execute(text("""
+            INSERT INTO financials (
+                corp_code, bsns_year, sj_div, account_key,
+                thstrm_nm, thstrm_amount, frmtrm_nm, frmtrm_amount, bfefrmtrm_nm, bfefrmtrm_amount,
+                ord, currency, rcept_no, updated_at
+            )
+            SELECT :corp_code, :bsns_year, :sj_div, a.account_key,
+                   :thstrm_nm, :thstrm_amount, :frmtrm_nm, :frmtrm_amount, :bfefrmtrm_nm, :bfefrmtrm_amount,
+                   :ord, :currency, :rcept_no, CURRENT_TIMESTAMP
+            FROM accounts a
+            WHERE a.account_nm = :account_nm
+            ON CONFLICT (corp_code, bsns_year, sj_div, account_key) DO UPDATE SET
+                thstrm_nm = EXCLUDED.thstrm_nm,
+                thstrm_amount = EXCLUDED.thstrm_amount,
+                frmtrm_nm = EXCLUDED.frmtrm_nm,
+                frmtrm_amount = EXCLUDED.frmtrm_amount,
+                bfefrmtrm_nm = EXCLUDED.bfefrmtrm_nm,
+                bfefrmtrm_amount = EXCLUDED.bfefrmtrm_amount,
+                ord = EXCLUDED.ord,
+                currency = EXCLUDED.currency,
+                rcept_no = EXCLUDED.rcept_no,
+                updated_at = CURRENT_TIMESTAMP
+        """), {key: value for key, value in stmt.items() if key not in ("corp_name", "stock_code", "sj_nm", "account_id", "reprt_code")})
+    await db_session.commit()
+
+
+async def delete_rows(db_session: AsyncSession, corp_code: str) -> None:
+    await db_session.execute(text("DELETE FROM financials WHERE corp_code = :corp_code"), {"corp_code": corp_code})
+    await db_session.commit()
+
+
+async def measure(
+    db_session: AsyncSession,
+    save: Callable[[AsyncSession, List[Dict[str, Any]]], Awaitable[None]],
+    data: List[Dict[str, Any]],
+    fresh: bool,
+    repeat: int
+) -> float:
+    samples = []
+    for _ in range(repeat):
+        if fresh:
+            await delete_rows(db_session, data[0]["corp_code"])
+        started = time.perf_counter()
+        await save(db_session, data)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[50, 180, 1000], help="회사·연도당 재무제표 행 수")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    # 문장마다 SQL을 출력하면 측정값에 로그 비용이 섞이므로 끔
+    engine.echo = False
+
+    corp_code = bench_corp_code(999999)
+    await create_year_partitions([BSNS_YEAR])
+    print(f"{'rows':>4}  {'case':7} {'per-row ms':>10}  {'rows/s':>6}  {'bulk ms':>9}  {'rows/s':>6}     speedup")
+    async with async_session() as session:
+        try:
+            for rows in args.rows:
+                data = statements(corp_code, rows)
+                # 계정 사전과 회사·보고서 행을 먼저 만들어 두 방식이 같은 상태에서 시작하도록 함
+                await save_financial_statements(session, data)
+                for case, fresh in (("insert", True), ("update", False)):
+                    per_row_ms = await measure(session, save_per_row, data, fresh, args.repeat)
+                    bulk_ms = await measure(session, save_financial_statements, data, fresh, args.repeat)
+                    print(
+                        f"{rows:>4}  {case:7} {per_row_ms:>10.1f}  {rows / per_row_ms * 1000:>6.0f}  "
+                        f"{bulk_ms:>9.1f}  {rows / bulk_ms * 1000:>6.0f}  {per_row_ms / bulk_ms:>9.1f}x"
+                    )
+        finally:
+            await delete_rows(session, corp_code)
+            await session.execute(text("DELETE FROM companies WHERE corp_code = :corp_code"), {"corp_code": corp_code})
+            await session.execute(text("DELETE FROM reports WHERE rcept_no = :rcept_no"), {"rcept_no": f"BENCH{corp_code}{BSNS_YEAR}"})
+            await session.execute(text("DELETE FROM accounts WHERE account_nm LIKE 'bench_save_account_%'"))
+            await session.commit()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
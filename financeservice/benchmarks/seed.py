@@ -0,0 +1,110 @@
+"""벤치마크용 재무제표 데이터 적재.
+
+벤치마크 전용 기업 고유번호(99로 시작하는 8자리)만 지우고 다시 만들므로 다른 데이터는 건드리지 않지만,
+운영 DB가 아닌 벤치마크 전용 DB에서 실행하세요. 스키마는 `alembic upgrade head`로 준비합니다.
+"""
+import time
+from typing import List
+
+from sqlalchemy import text
+
+from app.foundation.infra.database.database import engine
+from app.foundation.infra.database.partitions import create_year_partitions
+from app.domain.service.ratio_service import SNAPSHOT_GROWTH_METRICS, SNAPSHOT_LEVEL_METRICS
+
+BENCH_CORP_PREFIX = "99"
+
+# 재무비율 계산에 쓰는 계정 (alembic 0003에서 먼저 등록됨)
+RATIO_ACCOUNTS = ("자산총계", "부채총계", "유동자산", "유동부채", "자본총계", "매출액", "영업이익", "당기순이익")
+
+
+def bench_corp_code(index: int) -> str:
+    return f"{BENCH_CORP_PREFIX}{index:06d}"
+
+
+def bench_corp_codes(companies: int) -> List[str]:
+    return [bench_corp_code(i) for i in range(companies)]
+
+
+async def seed(companies: int, first_year: int, last_year: int, rows_per_year: int) -> float:
+    """회사 × 사업연도 × 계정 행과 재무 지표 스냅샷을 적재하고 걸린 시간(초)을 반환합니다."""
+    years = [str(year) for year in range(first_year, last_year + 1)]
+    await create_year_partitions(years)
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        await conn.execute(text("DELETE FROM metrics WHERE corp_code LIKE :prefix"), {"prefix": BENCH_CORP_PREFIX + "%"})
+        await conn.execute(text("DELETE FROM financials WHERE corp_code LIKE :prefix"), {"prefix": BENCH_CORP_PREFIX + "%"})
+        await conn.execute(text("DELETE FROM companies WHERE corp_code LIKE :prefix"), {"prefix": BENCH_CORP_PREFIX + "%"})
+        await conn.execute(text("DELETE FROM reports WHERE rcept_no LIKE 'BENCH%'"))
+        await conn.execute(text("""
+            INSERT INTO statement (sj_div, sj_nm, updated_at)
+            VALUES ('BS', '재무상태표', now()), ('IS', '손익계산서', now()), ('CF', '현금흐름표', now())
+            ON CONFLICT (sj_div) DO NOTHING
+        """))
+        await conn.execute(text("""
+            INSERT INTO accounts (account_nm, account_id)
+            SELECT 'bench_account_' || i, NULL FROM generate_series(1, :rows) AS i
+            ON CONFLICT (account_nm) DO NOTHING
+        """), {"rows": rows_per_year})
+        await conn.execute(text("""
+            INSERT INTO companies (corp_code, corp_name, stock_code, updated_at)
+            SELECT :prefix || lpad(i::text, 6, '0'), 'bench_company_' || i, NULL, now()
+            FROM generate_series(0, :companies - 1) AS i
+        """), {"prefix": BENCH_CORP_PREFIX, "companies": companies})
+        await conn.execute(text("""
+            INSERT INTO reports (rcept_no, reprt_code, updated_at)
+            SELECT 'BENCH' || c.corp_code || y.bsns_year, '11011', now()
+            FROM companies c, unnest(CAST(:years AS varchar[])) AS y(bsns_year)
+            WHERE c.corp_code LIKE :pattern
+        """), {"years": years, "pattern": BENCH_CORP_PREFIX + "%"})
+        # 계정 목록: 재무비율 계정 + 벤치마크 계정 (회사·연도마다 rows_per_year행)
+        await conn.execute(text("""
+            WITH account_list AS (
+                SELECT account_key, row_number() OVER (ORDER BY ratio DESC, account_key) AS ord
+                FROM (
+                    SELECT account_key, account_nm = ANY(:ratio_accounts) AS ratio
+                    FROM accounts
+                    WHERE account_nm = ANY(:ratio_accounts) OR account_nm LIKE 'bench_account_%'
+                ) a
+            )
+            INSERT INTO financials (
+                corp_code, bsns_year, sj_div, account_key,
+                thstrm_nm, thstrm_amount, frmtrm_nm, frmtrm_amount, bfefrmtrm_nm, bfefrmtrm_amount,
+                ord, currency, rcept_no, updated_at
+            )
+            SELECT c.corp_code, y.bsns_year,
+                   CASE WHEN a.ord <= 5 THEN 'BS' WHEN a.ord <= 8 THEN 'IS'
+                        ELSE (ARRAY['BS', 'IS', 'CF'])[1 + a.ord % 3] END,
+                   a.account_key,
+                   '제 ' || y.bsns_year || ' 기', (1000000000 + hashtext(c.corp_code || y.bsns_year || a.ord) % 100000000)::bigint,
+                   '제 ' || y.bsns_year || ' 기', (900000000 + hashtext(y.bsns_year || c.corp_code || a.ord) % 100000000)::bigint,
+                   NULL, NULL,
+                   a.ord, 'KRW', 'BENCH' || c.corp_code || y.bsns_year, now()
+            FROM companies c
+            CROSS JOIN unnest(CAST(:years AS varchar[])) AS y(bsns_year)
+            CROSS JOIN account_list a
+            WHERE c.corp_code LIKE :pattern
+            AND a.ord <= :rows
+        """), {
+            "ratio_accounts": list(RATIO_ACCOUNTS),
+            "years": years,
+            "pattern": BENCH_CORP_PREFIX + "%",
+            "rows": rows_per_year
+        })
+        await conn.execute(text("""
+            INSERT INTO metrics (corp_code, bsns_year, metric_name, metric_value, metric_unit, updated_at)
+            SELECT c.corp_code, y.bsns_year, m.metric_name, (hashtext(c.corp_code || y.bsns_year || m.metric_name) % 10000) / 100.0, '%', now()
+            FROM companies c
+            CROSS JOIN unnest(CAST(:years AS varchar[])) AS y(bsns_year)
+            CROSS JOIN unnest(CAST(:metric_names AS varchar[])) AS m(metric_name)
+            WHERE c.corp_code LIKE :pattern
+        """), {
+            "years": years,
+            "metric_names": list(SNAPSHOT_LEVEL_METRICS) + list(SNAPSHOT_GROWTH_METRICS),
+            "pattern": BENCH_CORP_PREFIX + "%"
+        })
+    elapsed = time.perf_counter() - started
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE companies, accounts, reports, financials, metrics"))
+    return elapsed
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List
+
+from app.domain.service import dart_api_service as dart_module
+from app.domain.service.dart_api_service import DartApiService
+from app.domain.service.financial_data_processor import FinancialDataProcessor
+
+CORP_CODE = "00126380"
+# 직전 연도 사업보고서는 아직 없고 그 이전 연도에 데이터가 있는 경우
+LATEST_YEAR = str(datetime.now().year - 1)
+DATA_YEAR = str(datetime.now().year - 2)
+
+
+def _row(fs_div: str, account_nm: str, amount: str, ord: int) -> Dict[str, Any]:
+    return {
+        "corp_code": CORP_CODE,
+        "bsns_year": DATA_YEAR,
+        "fs_div": fs_div,
+        "sj_div": "BS",
+        "sj_nm": "재무상태표",
+        "account_nm": account_nm,
+        "thstrm_amount": amount,
+        "ord": str(ord)
+    }
+
+
+class StubHttpClient:
+    """단일회사 API 응답 대역. DATA_YEAR만 연결/별도 행을 함께 돌려줌"""
+
+    def __init__(self):
+        self.calls: List[tuple] = []
+
+    async def get_json(self, path: str, params: Dict[str, Any], timeout=None) -> Dict[str, Any]:
+        self.calls.append((path, params["bsns_year"], params.get("fs_div")))
+        if params["bsns_year"] != DATA_YEAR:
+            return {"status": "013", "message": "조회된 데이타가 없습니다."}
+        if path == "fnlttCashFlow.json":
+            return {"status": "013", "message": "조회된 데이타가 없습니다."}
+        # 별도 행의 ord가 더 작아도 연결 행이 채택되어야 함
+        return {"status": "000", "message": "정상", "list": [
+            _row("OFS", "자산총계", "100", 1),
+            _row("CFS", "자산총계", "300", 5),
+            _row("OFS", "부채총계", "40", 2),
+            _row("CFS", "부채총계", "120", 6)
+        ]}
+
+
+def test_one_request_per_endpoint_and_year(monkeypatch):
+    http_client = StubHttpClient()
+    monkeypatch.setattr(dart_module, "dart_http_client", http_client)
+
+    statements = asyncio.run(DartApiService(api_key="test").fetch_financial_statements(CORP_CODE))
+
+    # 직전 연도(데이터 없음) → 그 이전 연도 순서로 연도마다 재무제표·현금흐름표 한 번씩, fs_div 없이 요청
+    assert sorted(http_client.calls) == sorted([
+        ("fnlttSinglAcnt.json", LATEST_YEAR, None),
+        ("fnlttCashFlow.json", LATEST_YEAR, None),
+        ("fnlttSinglAcnt.json", DATA_YEAR, None),
+        ("fnlttCashFlow.json", DATA_YEAR, None)
+    ])
+
+    processor = FinancialDataProcessor()
+    selected = processor.deduplicate_statements(processor.select_preferred_fs_div(statements))
+    assert {(row["account_nm"], row["fs_div"], row["thstrm_amount"]) for row in selected} == {
+        ("자산총계", "CFS", "300"),
+        ("부채총계", "CFS", "120")
+    }
+
+
+def test_unlabelled_rows_are_kept_with_either_fs_div():
+    processor = FinancialDataProcessor()
+    cash_flow = {"sj_div": "CF", "account_nm": "영업활동현금흐름"}
+
+    assert processor.select_preferred_fs_div([_row("OFS", "자산총계", "1", 1), cash_flow]) == [
+        _row("OFS", "자산총계", "1", 1),
+        cash_flow
+    ]
+    assert processor.select_preferred_fs_div([_row("OFS", "자산총계", "1", 1), _row("CFS", "자산총계", "3", 2), cash_flow]) == [
+        _row("CFS", "자산총계", "3", 2),
+        cash_flow
+    ]
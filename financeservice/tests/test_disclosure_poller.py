@@ -0,0 +1,131 @@
+import asyncio
+import json
+import os
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from app.domain.service.disclosure_poller import DisclosurePoller, parse_periodic_report
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "dart")
+
+TRACKED = {"00126380", "00164779", "00401731"}
+
+
+def _load(name: str) -> Dict[str, Any]:
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class StubListApi:
+    """list.json 응답을 파일에서 읽어 페이지별로 돌려주는 대역"""
+
+    def __init__(self, *pages: str):
+        self.pages = [_load(name) for name in pages]
+        self.calls: List[Tuple[str, str, int]] = []
+
+    async def __call__(self, bgn_de: str, end_de: str, page_no: int) -> Dict[str, Any]:
+        self.calls.append((bgn_de, end_de, page_no))
+        return self.pages[page_no - 1]
+
+
+@pytest.fixture
+def poller(tmp_path, monkeypatch) -> DisclosurePoller:
+    poller = DisclosurePoller(
+        cursor_path=str(tmp_path / "cursor.json"),
+        interval=600,
+        workers=1,
+        lookback_days=1
+    )
+
+    async def tracked_corp_codes(corp_codes):
+        return corp_codes & TRACKED
+
+    monkeypatch.setattr(poller, "_tracked_corp_codes", tracked_corp_codes)
+    return poller
+
+
+def _queued(poller: DisclosurePoller) -> List[Tuple[str, str, int]]:
+    items = []
+    while not poller._queue.empty():
+        items.append(poller._queue.get_nowait())
+    return items
+
+
+@pytest.mark.parametrize("report_nm, expected", [
+    ("사업보고서 (2023.12)", ("11011", "2023", False)),
+    ("[기재정정]사업보고서 (2023.12)", ("11011", "2023", True)),
+    ("반기보고서 (2024.06)", ("11012", "2024", False)),
+    ("분기보고서 (2024.03)", ("11013", "2024", False)),
+    ("[첨부정정]분기보고서 (2024.09)", ("11014", "2024", True)),
+    ("주요사항보고서(자기주식취득결정)", None),
+    ("", None),
+])
+def test_parse_periodic_report(report_nm, expected):
+    assert parse_periodic_report(report_nm) == expected
+
+
+def test_poll_enqueues_tracked_annual_reports_once(poller):
+    api = StubListApi("list_page1.json", "list_page2.json")
+
+    enqueued = asyncio.run(poller.poll_once(api))
+
+    # 원본과 정정 사업보고서는 같은 회사·연도이므로 한 번만, 미적재 회사와 분기/반기 보고서는 제외
+    assert enqueued == 2
+    assert sorted(_queued(poller)) == [("00126380", "2023", 0), ("00401731", "2023", 0)]
+    assert [page_no for _, _, page_no in api.calls] == [1, 2]
+    stats = poller.stats()
+    assert stats["filings_seen"] == 7
+    assert stats["annual_reports"] == 4
+    assert stats["interim_reports"] == 2
+    assert stats["corrections"] == 1
+
+
+def test_cursor_advances_to_latest_receipt_date(poller):
+    asyncio.run(poller.poll_once(StubListApi("list_page1.json", "list_page2.json")))
+
+    with open(poller.cursor_path, "r", encoding="utf-8") as f:
+        cursor = json.load(f)
+    assert cursor == {
+        "date": "20240314",
+        "seen": ["20240314001120", "20240314001301", "20240314001402"]
+    }
+
+
+def test_poll_resumes_from_cursor_and_skips_seen_filings(poller):
+    asyncio.run(poller.poll_once(StubListApi("list_page1.json", "list_page2.json")))
+    _queued(poller)
+    poller._pending.clear()
+
+    # 커서 날짜부터 다시 조회하며, 이미 처리한 접수번호는 건너뜀
+    api = StubListApi("list_page2.json")
+    api.pages[0]["total_page"] = 1
+    enqueued = asyncio.run(poller.poll_once(api))
+
+    assert api.calls[0][0] == "20240314"
+    assert enqueued == 0
+    assert _queued(poller) == []
+    assert poller.stats()["cursor_date"] == "20240314"
+
+
+def test_cursor_is_restored_after_restart(poller, tmp_path):
+    asyncio.run(poller.poll_once(StubListApi("list_page1.json", "list_page2.json")))
+
+    restarted = DisclosurePoller(
+        cursor_path=str(tmp_path / "cursor.json"),
+        interval=600,
+        workers=1,
+        lookback_days=1
+    )
+    restarted.load_cursor()
+    assert restarted.stats()["cursor_date"] == "20240314"
+
+
+def test_no_data_leaves_cursor_unchanged(poller):
+    api = StubListApi("list_empty.json")
+
+    enqueued = asyncio.run(poller.poll_once(api))
+
+    assert enqueued == 0
+    assert poller.stats()["cursor_date"] is None
+    assert not os.path.exists(poller.cursor_path)
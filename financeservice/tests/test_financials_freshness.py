@@ -0,0 +1,227 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.domain.model.schema.schema import (
+    DebtLiquidityData,
+    FinancialMetrics,
+    FinancialMetricsResponse,
+    GrowthData
+)
+from app.domain.service import fin_service as fin_service_module
+from app.domain.service import financials_freshness as freshness_module
+from app.domain.service.fin_service import FinService
+from app.domain.service.financials_freshness import (
+    FRESH,
+    NO_DATA,
+    SOFT_STALE,
+    FinancialsFreshness
+)
+
+CORP_CODE = "00126380"
+# 2023 사업연도 제출기한(2024-03-31) 이후
+TODAY = date(2024, 5, 1)
+HOUR = 3600
+
+
+@pytest.fixture
+def freshness() -> FinancialsFreshness:
+    return FinancialsFreshness(
+        soft_ttl=86400,
+        hard_ttl=30 * 86400,
+        settled_soft_ttl=30 * 86400,
+        settled_hard_ttl=365 * 86400,
+        filing_grace_days=60,
+        retry_interval=HOUR,
+        missing_retry_interval=7 * 86400
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(freshness_module.time, "monotonic", lambda: now.value)
+    return now
+
+
+def _assess_latest(freshness: FinancialsFreshness, stored_year: str = "2022"):
+    refreshed_at = datetime(2024, 4, 30)
+    return freshness.assess(stored_year, refreshed_at, 600, latest_requested=True, today=TODAY, corp_code=CORP_CODE)
+
+
+def _run_refresh(freshness: FinancialsFreshness, result):
+    calls = []
+
+    async def run():
+        calls.append(1)
+        return result
+
+    succeeded = asyncio.run(freshness.refresh(CORP_CODE, "2023", run))
+    return succeeded, calls
+
+
+def test_expected_year_promotes_fresh_data(freshness, clock):
+    assert _assess_latest(freshness) == (SOFT_STALE, "2023")
+
+
+def test_missing_expected_year_backs_off(freshness, clock):
+    succeeded, calls = _run_refresh(freshness, {"status": "error", "reason": NO_DATA, "message": "없음"})
+    assert not succeeded and calls == [1]
+
+    # 재시도 간격(1시간)이 지나도 DART에 없던 연도는 다시 조회하지 않고 저장된 연도를 기준으로 판단
+    clock.value += 2 * HOUR
+    assert _assess_latest(freshness) == (FRESH, "2022")
+    assert _run_refresh(freshness, {"status": "success"})[1] == []
+    stats = freshness.stats()
+    assert stats["missing_years"] == 1
+    assert stats["refresh_failures"] == 0
+
+    # missing_retry_interval이 지나면 다시 조회
+    clock.value += 7 * 86400
+    assert _assess_latest(freshness) == (SOFT_STALE, "2023")
+    assert _run_refresh(freshness, {"status": "success"}) == (True, [1])
+    assert freshness.stats()["missing_tracked"] == 0
+
+
+def test_request_failure_retries_after_retry_interval(freshness, clock):
+    assert _run_refresh(freshness, {"status": "error", "message": "timeout"}) == (False, [1])
+
+    clock.value += 2 * HOUR
+    assert _assess_latest(freshness) == (SOFT_STALE, "2023")
+    assert _run_refresh(freshness, {"status": "success"}) == (True, [1])
+
+
+class StubStatementService:
+    def __init__(self, refreshed: bool):
+        self.refreshed = refreshed
+        self.calls = []
+
+    async def revalidate(self, corp_code, company_name, bsns_year, refreshed_at, age_seconds, latest_requested=False):
+        self.calls.append((corp_code, bsns_year, latest_requested))
+        return self.refreshed
+
+
+def _service(monkeypatch, stored, refreshed: bool):
+    service = FinService.__new__(FinService)
+    service.db_session = SimpleNamespace()
+    service.financial_statement_service = StubStatementService(refreshed)
+    service.ratio_service = SimpleNamespace()
+
+    async def get_stored_metrics(corp_code, company_name):
+        return stored
+
+    async def recomputed(corp_code, company_name, data):
+        return "recomputed"
+
+    async def fetch_and_save(company_name, year, company_info):
+        return {"status": "success", "data": [{"bsns_year": "2023"}]}
+
+    service.ratio_service.get_stored_metrics = get_stored_metrics
+    service.ratio_service.get_financial_metrics = recomputed
+    service.ratio_service.save_metrics_snapshot = lambda *args: asyncio.sleep(0)
+    service.fetch_and_save_financial_data = fetch_and_save
+    monkeypatch.setattr(fin_service_module.settings, "FIN_FRESHNESS_ENABLED", True)
+    monkeypatch.setattr(fin_service_module.settings, "WRITE_BEHIND_ENABLED", False)
+    return service
+
+
+def _stored_snapshot():
+    metrics = SimpleNamespace(financialMetrics=SimpleNamespace(years=["2023", "2022", "2021"]))
+    return metrics, datetime.now() - timedelta(days=40)
+
+
+@pytest.mark.parametrize("refreshed, expected", [(False, "snapshot"), (True, "recomputed")])
+def test_stored_metrics_snapshot_is_revalidated(monkeypatch, refreshed, expected):
+    metrics, source_updated_at = _stored_snapshot()
+    service = _service(monkeypatch, (metrics, source_updated_at), refreshed)
+    company_info = SimpleNamespace(corp_code=CORP_CODE, corp_name="삼성전자")
+
+    result = asyncio.run(service._load_financial_metrics(company_info, "삼성전자"))
+
+    # 스냅샷의 최신 연도로 신선도를 판단하고, 갱신을 기다려 성공했으면 다시 계산
+    assert service.financial_statement_service.calls == [(CORP_CODE, "2023", True)]
+    assert result == (metrics if expected == "snapshot" else "recomputed")
+
+
+def _metrics(company_name: str) -> FinancialMetricsResponse:
+    return FinancialMetricsResponse(
+        companyName=company_name,
+        financialMetrics=FinancialMetrics(operatingMargin=[], netMargin=[], roe=[], roa=[], years=[]),
+        growthData=GrowthData(revenueGrowth=[], netIncomeGrowth=[], years=[]),
+        debtLiquidityData=DebtLiquidityData(debtRatio=[], currentRatio=[], years=[])
+    )
+
+
+class _NullSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        pass
+
+
+def test_batch_applies_freshness_to_stored_companies(monkeypatch):
+    # 최신 연도 데이터의 갱신 시각: 신선(1시간), soft TTL 경과(2일), hard TTL 경과(60일)
+    ages = {"00000001": timedelta(hours=1), "00000002": timedelta(days=2), "00000003": timedelta(days=60)}
+    latest_year = str(date.today().year - 1)
+    rows_by_corp_code = {
+        corp_code: [{"corp_code": corp_code, "bsns_year": latest_year, "updated_at": datetime.now() - age}]
+        for corp_code, age in ages.items()
+    }
+    freshness = FinancialsFreshness(
+        soft_ttl=86400,
+        hard_ttl=30 * 86400,
+        settled_soft_ttl=86400,
+        settled_hard_ttl=30 * 86400,
+        filing_grace_days=0,
+        retry_interval=HOUR,
+        missing_retry_interval=7 * 86400
+    )
+    monkeypatch.setattr(fin_service_module, "financials_freshness", freshness)
+    monkeypatch.setattr(fin_service_module.settings, "FIN_FRESHNESS_ENABLED", True)
+    monkeypatch.setattr(fin_service_module.corp_code_index, "get_by_corp_code", lambda corp_code: None)
+    monkeypatch.setattr(fin_service_module.corp_code_index, "get_by_name", lambda name: None)
+    monkeypatch.setattr(fin_service_module, "async_session", _NullSession)
+
+    async def companies_by_corp_codes(db_session, corp_codes):
+        return [{"corp_code": corp_code, "corp_name": f"회사{corp_code[-1]}"} for corp_code in corp_codes]
+
+    async def recent_financials(db_session, corp_codes):
+        return rows_by_corp_code
+
+    async def no_companies(db_session, names):
+        return []
+
+    monkeypatch.setattr(fin_service_module, "get_companies_by_corp_codes", companies_by_corp_codes)
+    monkeypatch.setattr(fin_service_module, "get_companies_by_names", no_companies)
+    monkeypatch.setattr(fin_service_module, "get_recent_financials_by_corp_codes", recent_financials)
+
+    background = []
+    reloaded = []
+    service = FinService.__new__(FinService)
+    service.db_session = SimpleNamespace()
+    service.financial_statement_service = SimpleNamespace(
+        refresh_in_background=lambda corp_code, bsns_year: background.append((corp_code, bsns_year))
+    )
+    service.ratio_service = SimpleNamespace(
+        build_metrics_responses=lambda names, rows: {corp_code: _metrics(f"stored:{corp_code}") for corp_code in names}
+    )
+
+    async def by_corp_code(corp_code):
+        reloaded.append(corp_code)
+        return _metrics(f"reloaded:{corp_code}")
+
+    service.with_session = lambda session: SimpleNamespace(get_financial_metrics_by_corp_code=by_corp_code)
+
+    results = asyncio.run(service.get_financial_metrics_batch([], list(ages)))
+
+    # 신선한 회사와 soft TTL이 지난 회사는 저장된 데이터로 응답하고(후자는 백그라운드 갱신 예약),
+    # hard TTL이 지난 회사만 단건 조회 경로로 처리
+    assert [item.data.companyName for item in results] == ["stored:00000001", "stored:00000002", "reloaded:00000003"]
+    assert background == [("00000002", latest_year)]
+    assert reloaded == ["00000003"]
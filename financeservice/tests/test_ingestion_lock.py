@@ -0,0 +1,146 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from app.foundation.infra.database.ingestion_lock import IngestionLockTimeoutError, IngestionSingleFlight
+
+CORP_CODE = "00126380"
+KEY = (CORP_CODE, None)
+
+
+@pytest.fixture
+def single_flight() -> IngestionSingleFlight:
+    return IngestionSingleFlight(lock_wait=30)
+
+
+def test_concurrent_runs_share_one_load(single_flight):
+    calls: List[int] = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"status": "success"}
+
+    async def scenario():
+        return await asyncio.gather(*(single_flight.run(KEY, loader) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+
+    assert calls == [1]
+    assert results == [{"status": "success"}] * 5
+    stats = single_flight.stats()
+    assert (stats["leaders"], stats["coalesced"], stats["inflight"]) == (1, 4, 0)
+
+
+def test_leader_error_is_shared_with_waiters(single_flight):
+    async def failing_loader():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("DART 오류")
+
+    async def scenario():
+        return await asyncio.gather(
+            single_flight.run(KEY, failing_loader),
+            single_flight.run(KEY, failing_loader),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+
+    assert [str(result) for result in results] == ["DART 오류", "DART 오류"]
+    assert single_flight.stats()["leaders"] == 1
+
+
+def test_waiter_reloads_when_leader_is_cancelled(single_flight):
+    calls: List[str] = []
+
+    async def scenario():
+        leader_started = asyncio.Event()
+
+        async def leader_loader():
+            calls.append("leader")
+            leader_started.set()
+            await asyncio.sleep(10)
+
+        async def waiter_loader():
+            calls.append("waiter")
+            return "reloaded"
+
+        leader = asyncio.create_task(single_flight.run(KEY, leader_loader))
+        await leader_started.wait()
+        waiter = asyncio.create_task(single_flight.run(KEY, waiter_loader))
+        await asyncio.sleep(0)
+        # 적재를 맡은 요청이 취소되어도 기다리던 요청은 취소되지 않고 직접 다시 적재
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    assert asyncio.run(scenario()) == "reloaded"
+    assert calls == ["leader", "waiter"]
+    stats = single_flight.stats()
+    assert (stats["leaders"], stats["abandoned"], stats["inflight"]) == (2, 1, 0)
+
+
+class _LockNotAvailable(Exception):
+    sqlstate = "55P03"
+
+
+class StubSession:
+    """advisory lock 문장을 기록하는 세션 대역. 잠금을 기다리는 문장은 lock_not_available로 실패시킬 수 있음"""
+
+    def __init__(self, free: bool, times_out: bool = False):
+        self.free = free
+        self.times_out = times_out
+        self.statements: List[str] = []
+
+    async def execute(self, statement: Any, params: Any = None) -> Any:
+        sql = str(statement)
+        self.statements.append(sql)
+        if "pg_try_advisory_xact_lock" in sql:
+            return _Scalar(self.free)
+        if "current_setting" in sql:
+            return _Scalar("0")
+        if "pg_advisory_xact_lock" in sql and self.times_out:
+            raise DBAPIError(sql, params, _LockNotAvailable("canceling statement due to lock timeout"))
+        return _Scalar(None)
+
+
+class _Scalar:
+    def __init__(self, value: Any):
+        self.value = value
+
+    def scalar(self) -> Any:
+        return self.value
+
+
+def test_free_lock_takes_one_statement(single_flight):
+    session = StubSession(free=True)
+
+    asyncio.run(single_flight.lock(session, CORP_CODE))
+
+    assert len(session.statements) == 1
+    assert single_flight.stats()["lock_waits"] == 0
+
+
+def test_busy_lock_blocks_under_lock_timeout(single_flight):
+    session = StubSession(free=False)
+
+    asyncio.run(single_flight.lock(session, CORP_CODE))
+
+    # 폴링 없이 lock_timeout을 걸고 서버에서 기다린 뒤 원래 lock_timeout으로 되돌림
+    assert len(session.statements) == 4
+    assert "pg_advisory_xact_lock" in session.statements[2]
+    assert "set_config" in session.statements[3]
+    assert single_flight.stats()["lock_waits"] == 1
+
+
+def test_lock_timeout_raises_instead_of_loading_unlocked(single_flight):
+    session = StubSession(free=False, times_out=True)
+
+    with pytest.raises(IngestionLockTimeoutError) as raised:
+        asyncio.run(single_flight.lock(session, CORP_CODE))
+
+    assert raised.value.retry_after == 30
+    assert single_flight.stats()["lock_timeouts"] == 1
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from app.foundation.infra.dart.rate_limiter import DartPriority, DartQuotaExceededError, DartScheduler
+
+
+@pytest.fixture
+def scheduler() -> DartScheduler:
+    # 동시 실행 1건, 토큰은 충분히, 일일 예산 3건 중 1건은 사용자 요청 예약분
+    return DartScheduler(
+        rate_per_sec=1000,
+        burst=100,
+        min_concurrency=1,
+        max_concurrency=1,
+        daily_limit=3,
+        interactive_reserve=1
+    )
+
+
+def test_budget_is_rechecked_when_queued_call_is_dispatched(scheduler):
+    async def scenario():
+        await scheduler.acquire(DartPriority.INTERACTIVE)
+        # 대기열에 넣을 때는 잔여 예산(2)이 예약분보다 많아 둘 다 통과
+        first = asyncio.create_task(scheduler.acquire(DartPriority.BATCH))
+        second = asyncio.create_task(scheduler.acquire(DartPriority.BATCH))
+        await asyncio.sleep(0)
+        assert scheduler.stats()["queues"]["batch"]["depth"] == 2
+
+        scheduler.release(success=True, throttled=False)
+        await first
+        # 앞선 배치 호출이 예산을 써서 잔여 예산이 예약분만 남았으므로 배정하지 않고 거절
+        scheduler.release(success=True, throttled=False)
+        with pytest.raises(DartQuotaExceededError):
+            await second
+
+        # 예약분은 사용자 요청에 배정
+        await scheduler.acquire(DartPriority.INTERACTIVE)
+        scheduler.release(success=True, throttled=False)
+
+    asyncio.run(scenario())
+
+    stats = scheduler.stats()
+    assert stats["remaining_today"] == 0
+    assert stats["rejected_total"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["queues"]["batch"]["depth"] == 0
+
+
+def test_exhausted_budget_rejects_queued_interactive_call(scheduler):
+    async def scenario():
+        await scheduler.acquire(DartPriority.INTERACTIVE)
+        waiters = [asyncio.create_task(scheduler.acquire(DartPriority.INTERACTIVE)) for _ in range(3)]
+        await asyncio.sleep(0)
+        results = []
+        for waiter in waiters:
+            scheduler.release(success=True, throttled=False)
+            results.append((await asyncio.gather(waiter, return_exceptions=True))[0])
+        return results
+
+    results = asyncio.run(scenario())
+
+    # 일일 예산 3건을 넘는 네 번째 호출은 대기열에 들어갈 때 예산이 남아 있었어도 거절
+    assert results[:2] == [None, None]
+    assert isinstance(results[2], DartQuotaExceededError)
+    assert scheduler.stats()["remaining_today"] == 0
@@ -0,0 +1,195 @@
+import asyncio
+import random
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from app.domain.service.ratio_engine import ACCOUNTS, FinancialCube, yearly_ratios
+from app.domain.service.ratio_service import RatioService
+
+# 엔진 도입 전 RatioService의 행 단위 계산을 기준 구현으로 그대로 옮김 (차등 비교용)
+
+
+def _baseline_growth(current: float, previous: float) -> Optional[float]:
+    if previous == 0:
+        return None
+    if previous < 0 and current > 0:
+        return 100.0
+    if previous > 0 and current < 0:
+        return -100.0
+    return ((current - previous) / abs(previous)) * 100
+
+
+def _baseline_ratio(numerator: float, denominator: float) -> Optional[float]:
+    return numerator / denominator * 100 if denominator != 0 else None
+
+
+def baseline_yearly_ratios(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Optional[float]]]:
+    """이전 calculate_and_save_ratios: 같은 연도/계정은 마지막 행이 남음"""
+    financial_data: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for row in rows:
+        financial_data.setdefault(row["bsns_year"], {})[row["account_nm"]] = {
+            "thstrm": float(row["thstrm_amount"]) if row["thstrm_amount"] is not None else 0,
+            "frmtrm": float(row["frmtrm_amount"]) if row["frmtrm_amount"] is not None else 0
+        }
+
+    ratios = {}
+    for year, year_data in financial_data.items():
+        def amount(account_nm: str, period: str = "thstrm") -> float:
+            return year_data.get(account_nm, {}).get(period, 0)
+
+        ratios[year] = {
+            "debt_ratio": _baseline_ratio(amount("부채총계"), amount("자본총계")),
+            "current_ratio": _baseline_ratio(amount("유동자산"), amount("유동부채")),
+            "debt_dependency": _baseline_ratio(amount("부채총계"), amount("자산총계")),
+            "operating_profit_ratio": _baseline_ratio(amount("영업이익"), amount("매출액")),
+            "net_profit_ratio": _baseline_ratio(amount("당기순이익"), amount("매출액")),
+            "roe": _baseline_ratio(amount("당기순이익"), amount("자본총계")),
+            "roa": _baseline_ratio(amount("당기순이익"), amount("자산총계")),
+            "sales_growth": _baseline_growth(amount("매출액"), amount("매출액", "frmtrm")),
+            "operating_profit_growth": _baseline_growth(amount("영업이익"), amount("영업이익", "frmtrm")),
+            "eps_growth": _baseline_growth(amount("당기순이익"), amount("당기순이익", "frmtrm"))
+        }
+    return ratios
+
+
+def baseline_metrics(rows: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """이전 get_financial_metrics: 같은 연도/계정은 첫 행이 남고, 보고서가 없는 연도는 최신 보고서의 전기/전전기 금액 사용"""
+    years_data: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for row in rows:
+        accounts = years_data.setdefault(row["bsns_year"], {})
+        if row["account_nm"] not in accounts:
+            accounts[row["account_nm"]] = {
+                "thstrm": float(row["thstrm_amount"]) if row["thstrm_amount"] else 0,
+                "frmtrm": float(row["frmtrm_amount"]) if row["frmtrm_amount"] else 0,
+                "bfefrmtrm": float(row["bfefrmtrm_amount"]) if row["bfefrmtrm_amount"] else 0
+            }
+    if not years_data:
+        return None
+
+    all_year_data: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for year in sorted(years_data, reverse=True)[:3]:
+        all_year_data[year] = years_data[year]
+        for offset, period in ((1, "frmtrm"), (2, "bfefrmtrm")):
+            earlier = str(int(year) - offset)
+            if earlier not in all_year_data:
+                all_year_data[earlier] = {
+                    account_nm: {"thstrm": values.get(period, 0)} for account_nm, values in years_data[year].items()
+                }
+    target_years = sorted(all_year_data, reverse=True)[:3]
+
+    def amount(year: str, account_nm: str) -> float:
+        return all_year_data[year].get(account_nm, {}).get("thstrm", 0)
+
+    def level(numerator: str, denominator: str) -> List[Optional[float]]:
+        return [_baseline_ratio(amount(year, numerator), amount(year, denominator)) for year in target_years]
+
+    def growth(account_nm: str) -> List[Optional[float]]:
+        return [
+            _baseline_growth(amount(current, account_nm), amount(previous, account_nm))
+            for current, previous in zip(target_years, target_years[1:])
+        ]
+
+    return {
+        "financialMetrics": {
+            "operatingMargin": level("영업이익", "매출액"),
+            "netMargin": level("당기순이익", "매출액"),
+            "roe": level("당기순이익", "자본총계"),
+            "roa": level("당기순이익", "자산총계"),
+            "years": target_years
+        },
+        "growthData": {
+            "revenueGrowth": growth("매출액"),
+            "netIncomeGrowth": growth("당기순이익"),
+            "years": target_years[:-1]
+        },
+        "debtLiquidityData": {
+            "debtRatio": level("부채총계", "자본총계"),
+            "currentRatio": level("유동자산", "유동부채"),
+            "years": target_years
+        }
+    }
+
+
+def _amount(rng: random.Random) -> Optional[float]:
+    # 0(분모 0), 음수(부호 전환 성장률), 빈 값을 자주 섞음
+    return rng.choice([None, 0, 0, rng.randint(-500, -1), rng.randint(1, 500), rng.randint(1, 10 ** 12)])
+
+
+def random_rows(rng: random.Random, corp_code: str) -> List[Dict[str, Any]]:
+    """연도 누락, 계정 누락, 비율과 무관한 계정, 같은 연도/계정의 중복 행을 포함한 임의 재무제표"""
+    years = rng.sample(range(2016, 2025), rng.randint(1, 5))
+    rows = []
+    for year in sorted(years, reverse=True):
+        accounts = rng.sample(ACCOUNTS + ("기타포괄손익",), rng.randint(1, len(ACCOUNTS) + 1))
+        for account_nm in accounts:
+            for _ in range(rng.choice([1, 1, 1, 2, 3])):
+                rows.append({
+                    "corp_code": corp_code,
+                    "bsns_year": str(year),
+                    "account_nm": account_nm,
+                    "thstrm_amount": _amount(rng),
+                    "frmtrm_amount": _amount(rng),
+                    "bfefrmtrm_amount": _amount(rng)
+                })
+    rng.shuffle(rows)
+    return rows
+
+
+SEEDS = range(300)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_yearly_ratios_match_baseline(seed):
+    rows = random_rows(random.Random(seed), "00000001")
+
+    cube = FinancialCube.from_rows(rows, keep="last", default_corp_code="00000001")
+
+    assert yearly_ratios(cube)["00000001"] == baseline_yearly_ratios(rows)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_metrics_response_matches_baseline(seed):
+    rows = random_rows(random.Random(seed), "00000001")
+
+    response = asyncio.run(RatioService(db_session=None).get_financial_metrics("00000001", "회사", rows))
+
+    assert response.model_dump(exclude={"companyName"}) == baseline_metrics(rows)
+
+
+def test_batch_metrics_match_per_company_baseline():
+    rng = random.Random(2024)
+    rows_by_corp = {f"{index:08d}": random_rows(rng, f"{index:08d}") for index in range(50)}
+
+    responses = RatioService(db_session=None).build_metrics_responses(
+        {corp_code: "회사" for corp_code in rows_by_corp},
+        [row for rows in rows_by_corp.values() for row in rows]
+    )
+
+    # 회사마다 연도 범위가 달라도 한 번의 배열 연산 결과가 회사별 기준 구현과 같음
+    for corp_code, rows in rows_by_corp.items():
+        assert responses[corp_code].model_dump(exclude={"companyName"}) == baseline_metrics(rows)
+
+
+@pytest.mark.parametrize("keep, expected", [("first", 10.0), ("last", 30.0)])
+def test_duplicate_rows_follow_keep(keep, expected):
+    rows = [
+        {"bsns_year": "2023", "account_nm": name, "thstrm_amount": amount, "frmtrm_amount": None, "bfefrmtrm_amount": None}
+        for name, amount in (("매출액", 100), ("영업이익", 10), ("영업이익", 30))
+    ]
+
+    cube = FinancialCube.from_rows(rows, keep=keep, default_corp_code="00000001")
+
+    assert yearly_ratios(cube)["00000001"]["2023"]["operating_profit_ratio"] == expected
+
+
+def test_missing_accounts_and_zero_denominators_are_none():
+    rows = [
+        {"bsns_year": "2023", "account_nm": "당기순이익", "thstrm_amount": 50, "frmtrm_amount": 0, "bfefrmtrm_amount": None},
+        {"bsns_year": "2023", "account_nm": "자본총계", "thstrm_amount": 0, "frmtrm_amount": 10, "bfefrmtrm_amount": None}
+    ]
+
+    ratios = yearly_ratios(FinancialCube.from_rows(rows, default_corp_code="00000001"))["00000001"]["2023"]
+
+    assert ratios == baseline_yearly_ratios(rows)["2023"]
+    assert ratios["roe"] is None and ratios["operating_profit_ratio"] is None and ratios["eps_growth"] is None
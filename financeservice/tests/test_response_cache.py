@@ -0,0 +1,199 @@
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from app.foundation.infra.cache import response_cache as response_cache_module
+from app.foundation.infra.cache.backends import InMemoryBackend
+from app.foundation.infra.cache.response_cache import ResponseCache
+
+TTL = 100
+
+
+class Payload(BaseModel):
+    value: int
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1_000_000.0)
+    # L1 항목과 인메모리 L2 백엔드가 같은 시계를 보도록 time.time을 바꿈
+    monkeypatch.setattr(response_cache_module.time, "time", lambda: now.value)
+    # 조기 갱신 시각을 만료 전 ttl * early_refresh_ratio 지점으로 고정
+    monkeypatch.setattr(response_cache_module.random, "random", lambda: 1.0)
+    return now
+
+
+@pytest.fixture
+def l2() -> InMemoryBackend:
+    return InMemoryBackend()
+
+
+def _cache(l2: InMemoryBackend, l1_max_entries: int = 10) -> ResponseCache:
+    return ResponseCache(l1_max_entries=l1_max_entries, l2=l2, key_prefix="test:", early_refresh_ratio=0.5)
+
+
+class CountingLoader:
+    """호출 횟수를 세는 loader. release를 설정하면 해당 이벤트까지 적재를 멈춤"""
+
+    def __init__(self, value: int = 1):
+        self.value = value
+        self.calls = 0
+        self.release = None
+        self.started = asyncio.Event()
+
+    async def __call__(self) -> Payload:
+        self.calls += 1
+        self.started.set()
+        if self.release is not None:
+            await self.release.wait()
+        return Payload(value=self.value)
+
+
+def test_l1_entry_expires_after_ttl(clock, l2):
+    cache = _cache(l2)
+    loader = CountingLoader()
+
+    async def scenario():
+        await cache.get_or_load("a", loader, Payload, TTL)
+        clock.value += TTL - 1
+        # 조기 갱신 시각(만료 50초 전)을 넘겼으므로 한 번 다시 적재
+        await cache.get_or_load("a", loader, Payload, TTL)
+        assert loader.calls == 2
+        clock.value += TTL + 1
+        await cache.get_or_load("a", loader, Payload, TTL)
+
+    asyncio.run(scenario())
+
+    assert loader.calls == 3
+    stats = cache.stats()
+    assert (stats["l1_hits"], stats["misses"], stats["early_refreshes"]) == (1, 2, 1)
+
+
+def test_l1_evicts_least_recently_used_and_reads_through_l2(clock, l2):
+    cache = _cache(l2, l1_max_entries=2)
+    loaders = {key: CountingLoader(index) for index, key in enumerate("abc")}
+
+    async def scenario():
+        for key in "ab":
+            await cache.get_or_load(key, loaders[key], Payload, TTL)
+        # a를 최근에 사용한 것으로 만든 뒤 c를 넣으면 b가 L1에서 밀려남
+        await cache.get_or_load("a", loaders["a"], Payload, TTL)
+        await cache.get_or_load("c", loaders["c"], Payload, TTL)
+        assert cache.stats()["l1_entries"] == 2
+        return await cache.get_or_load("b", loaders["b"], Payload, TTL)
+
+    value = asyncio.run(scenario())
+
+    # 밀려난 b는 loader를 다시 호출하지 않고 L2에서 읽음
+    assert value == Payload(value=1)
+    assert [loader.calls for loader in loaders.values()] == [1, 1, 1]
+    stats = cache.stats()
+    assert (stats["l1_hits"], stats["l2_hits"], stats["misses"]) == (1, 1, 3)
+
+
+def test_l2_is_shared_between_processes(clock, l2):
+    first, second = _cache(l2), _cache(l2)
+    loader = CountingLoader(7)
+
+    async def scenario():
+        await first.get_or_load("a", loader, Payload, TTL)
+        from_l2 = await second.get_or_load("a", loader, Payload, TTL)
+        from_l1 = await second.get_or_load("a", loader, Payload, TTL)
+        return from_l2, from_l1
+
+    assert asyncio.run(scenario()) == (Payload(value=7), Payload(value=7))
+    assert loader.calls == 1
+    stats = second.stats()
+    assert (stats["l2_hits"], stats["l1_hits"], stats["misses"]) == (1, 1, 0)
+
+
+def test_concurrent_misses_share_one_load(clock, l2):
+    cache = _cache(l2)
+    loader = CountingLoader(3)
+
+    async def scenario():
+        loader.release = asyncio.Event()
+        requests = [asyncio.create_task(cache.get_or_load("a", loader, Payload, TTL)) for _ in range(5)]
+        await loader.started.wait()
+        loader.release.set()
+        return await asyncio.gather(*requests)
+
+    assert asyncio.run(scenario()) == [Payload(value=3)] * 5
+    assert loader.calls == 1
+    stats = cache.stats()
+    assert (stats["coalesced"], stats["inflight"]) == (4, 0)
+
+
+def test_early_refresh_serves_stale_value_while_one_reload_runs(clock, l2):
+    cache = _cache(l2)
+
+    async def scenario():
+        await cache.get_or_load("a", CountingLoader(1), Payload, TTL)
+        clock.value += TTL * 0.6
+        reload = CountingLoader(2)
+        reload.release = asyncio.Event()
+        refreshing = asyncio.create_task(cache.get_or_load("a", reload, Payload, TTL))
+        await reload.started.wait()
+        # 갱신이 진행 중인 동안 다른 요청은 기다리지 않고 기존 값을 받음
+        stale = await asyncio.gather(*(cache.get_or_load("a", reload, Payload, TTL) for _ in range(3)))
+        reload.release.set()
+        refreshed = await refreshing
+        latest = await cache.get_or_load("a", reload, Payload, TTL)
+        return stale, refreshed, latest, reload.calls
+
+    stale, refreshed, latest, reload_calls = asyncio.run(scenario())
+
+    assert stale == [Payload(value=1)] * 3
+    assert (refreshed, latest) == (Payload(value=2), Payload(value=2))
+    assert reload_calls == 1
+    assert cache.stats()["early_refreshes"] == 1
+
+
+def test_failed_early_refresh_keeps_stale_value(clock, l2):
+    cache = _cache(l2)
+
+    async def failing_loader():
+        raise RuntimeError("DB 오류")
+
+    async def scenario():
+        await cache.get_or_load("a", CountingLoader(1), Payload, TTL)
+        clock.value += TTL * 0.6
+        return await cache.get_or_load("a", failing_loader, Payload, TTL)
+
+    assert asyncio.run(scenario()) == Payload(value=1)
+    assert cache.stats()["load_errors"] == 1
+
+
+def test_waiter_reloads_when_leader_is_cancelled(clock, l2):
+    cache = _cache(l2)
+    calls: List[str] = []
+
+    async def scenario():
+        leader_started = asyncio.Event()
+
+        async def leader_loader():
+            calls.append("leader")
+            leader_started.set()
+            await asyncio.sleep(10)
+
+        async def waiter_loader():
+            calls.append("waiter")
+            return Payload(value=5)
+
+        leader = asyncio.create_task(cache.get_or_load("a", leader_loader, Payload, TTL))
+        await leader_started.wait()
+        waiter = asyncio.create_task(cache.get_or_load("a", waiter_loader, Payload, TTL))
+        await asyncio.sleep(0)
+        # 적재를 맡은 요청이 취소되어도 기다리던 요청은 자신의 loader로 다시 적재
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    assert asyncio.run(scenario()) == Payload(value=5)
+    assert calls == ["leader", "waiter"]
+    stats = cache.stats()
+    assert (stats["abandoned_loads"], stats["inflight"]) == (1, 0)
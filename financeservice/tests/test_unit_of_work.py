@@ -0,0 +1,102 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.domain.repository import hot_read_repository
+from app.domain.service import financial_statement_service as fss_module
+from app.domain.service.financial_statement_service import FinancialStatementService
+from app.foundation.infra.database.unit_of_work import (
+    count_statement,
+    invalidate_memo,
+    memoized,
+    statement_count
+)
+
+
+class StubSession:
+    """info만 가진 세션 대역 (메모와 문 수는 세션 info에 저장됨)"""
+
+    def __init__(self):
+        self.info = {}
+
+
+def _service(session) -> FinancialStatementService:
+    return FinancialStatementService(
+        session,
+        dart_api=SimpleNamespace(),
+        data_processor=SimpleNamespace(),
+        company_info_service=SimpleNamespace(),
+        ratio_service=SimpleNamespace()
+    )
+
+
+def test_session_execute_is_counted():
+    engine = create_engine("sqlite://")
+    with Session(engine) as session:
+        session.execute(text("SELECT 1"))
+        session.execute(text("SELECT 2"))
+        assert statement_count(session) == 2
+
+
+def test_driver_reads_are_counted(monkeypatch):
+    session = StubSession()
+    conn = SimpleNamespace(fetch=AsyncMock(return_value=[]), fetchrow=AsyncMock(return_value=None))
+    monkeypatch.setattr(hot_read_repository, "driver_connection", AsyncMock(return_value=conn))
+
+    async def run():
+        await hot_read_repository.fetch_company_by_name(session, "삼성전자")
+        await hot_read_repository.fetch_financials(session, "00126380", recent_years=3)
+        await hot_read_repository.fetch_financials_refreshed_at(session, "00126380", "2023")
+
+    asyncio.run(run())
+    assert statement_count(session) == 3
+
+
+def test_memoized_read_runs_once_per_session():
+    session = StubSession()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        count_statement(session)
+        return [{"bsns_year": "2023"}]
+
+    async def run():
+        for _ in range(3):
+            await memoized(session, ("financials", "existing", "00126380", None), loader)
+        invalidate_memo(session, "financials")
+        await memoized(session, ("financials", "existing", "00126380", None), loader)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+    assert statement_count(session) == 2
+
+
+def test_existing_data_check_issues_one_statement(monkeypatch):
+    session = StubSession()
+    conn = SimpleNamespace(fetch=AsyncMock(return_value=[{"bsns_year": "2023"}]))
+    monkeypatch.setattr(hot_read_repository, "driver_connection", AsyncMock(return_value=conn))
+    service = _service(session)
+
+    async def run():
+        await service._check_existing_data("00126380")
+        await service._check_existing_data("00126380")
+
+    asyncio.run(run())
+    assert statement_count(session) == 1
+
+
+def test_existing_data_error_is_not_memoized(monkeypatch):
+    session = StubSession()
+    fetch = AsyncMock(side_effect=[RuntimeError("connection lost"), [{"bsns_year": "2023"}]])
+    monkeypatch.setattr(fss_module, "fetch_financials", fetch)
+    service = _service(session)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service._check_existing_data("00126380"))
+    assert asyncio.run(service._check_existing_data("00126380")) == [{"bsns_year": "2023"}]
+    assert fetch.await_count == 2
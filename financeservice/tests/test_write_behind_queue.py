@@ -0,0 +1,201 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from app.domain.model.schema.schema import (
+    DebtLiquidityData,
+    FinancialMetrics,
+    FinancialMetricsResponse,
+    GrowthData
+)
+from app.domain.service import financial_statement_service as fss_module
+from app.domain.service.financial_data_processor import FinancialDataProcessor
+from app.domain.service.financial_statement_service import FinancialStatementService
+from app.domain.service.write_behind_queue import KIND_METRICS_SNAPSHOT, KIND_RATIOS, WriteBehindQueue
+
+CORP_CODE = "00126380"
+
+
+def _statement(bsns_year: str, account_nm: str, ord: int) -> Dict[str, Any]:
+    return {
+        "corp_code": CORP_CODE,
+        "bsns_year": bsns_year,
+        "sj_div": "BS",
+        "sj_nm": "재무상태표",
+        "account_nm": account_nm,
+        "thstrm_amount": 100,
+        "frmtrm_amount": 90,
+        "bfefrmtrm_amount": 80,
+        "ord": ord
+    }
+
+
+def _metrics() -> FinancialMetricsResponse:
+    return FinancialMetricsResponse(
+        companyName="삼성전자",
+        financialMetrics=FinancialMetrics(operatingMargin=[], netMargin=[], roe=[], roa=[], years=[]),
+        growthData=GrowthData(revenueGrowth=[], netIncomeGrowth=[], years=[]),
+        debtLiquidityData=DebtLiquidityData(debtRatio=[], currentRatio=[], years=[])
+    )
+
+
+class RecordingPersist:
+    """저장 작업을 기록하는 대역. release를 설정하면 해당 이벤트까지 재무비율 작업을 멈춤"""
+
+    def __init__(self, fail_times: int = 0):
+        self.persisted: List[Dict[str, Any]] = []
+        self.release = None
+        self.started = asyncio.Event()
+        self.fail_times = fail_times
+
+    async def __call__(self, item: Dict[str, Any]) -> None:
+        if item["kind"] == KIND_RATIOS:
+            self.started.set()
+            if self.release is not None:
+                await self.release.wait()
+            if self.fail_times:
+                self.fail_times -= 1
+                raise RuntimeError("저장 실패")
+        self.persisted.append(item)
+
+
+@pytest.fixture
+def queue(tmp_path) -> WriteBehindQueue:
+    return WriteBehindQueue(spill_path=str(tmp_path / "spill.jsonl"), max_queued=10, workers=2, max_attempts=3)
+
+
+async def _drain(queue: WriteBehindQueue) -> None:
+    await queue._queue.join()
+
+
+def test_pending_until_persisted(queue):
+    persist = RecordingPersist()
+
+    async def scenario():
+        queue.submit_ratios(CORP_CODE, "삼성전자", "2023")
+        assert queue.is_pending(CORP_CODE)
+        queue._persist = persist
+        queue.start(lambda session: None)
+        await _drain(queue)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert not queue.is_pending(CORP_CODE)
+    assert queue.stats()["unsaved_source_jobs"] == 0
+
+
+def test_snapshot_is_merged_into_queued_ratios_job(queue):
+    persist = RecordingPersist()
+
+    async def scenario():
+        queue.submit_ratios(CORP_CODE, "삼성전자", "2023")
+        queue.submit_metrics_snapshot(CORP_CODE, _metrics())
+        queue._persist = persist
+        queue.start(lambda session: None)
+        await _drain(queue)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    # 작업자가 둘이어도 재무비율과 스냅샷은 한 작업으로 저장됨
+    assert len(persist.persisted) == 1
+    assert persist.persisted[0]["kind"] == KIND_RATIOS
+    assert persist.persisted[0]["response"]["companyName"] == "삼성전자"
+    assert queue.stats()["snapshots_merged"] == 1
+
+
+def test_snapshot_waits_for_running_ratios_job(queue):
+    persist = RecordingPersist()
+
+    async def scenario():
+        persist.release = asyncio.Event()
+        queue._persist = persist
+        queue.start(lambda session: None)
+        queue.submit_ratios(CORP_CODE, "삼성전자", "2023")
+        await persist.started.wait()
+        # 재무비율 저장 중에 도착한 스냅샷은 다른 작업자가 먼저 저장하지 않음
+        queue.submit_metrics_snapshot(CORP_CODE, _metrics())
+        await asyncio.sleep(0)
+        assert persist.persisted == []
+        persist.release.set()
+        await _drain(queue)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert [item["kind"] for item in persist.persisted] == [KIND_RATIOS, KIND_METRICS_SNAPSHOT]
+
+
+def test_failed_ratios_job_keeps_deferred_snapshot(queue, monkeypatch):
+    persist = RecordingPersist(fail_times=1)
+    real_sleep = asyncio.sleep
+
+    async def no_backoff(delay):
+        await real_sleep(0)
+
+    async def scenario():
+        persist.release = asyncio.Event()
+        queue._persist = persist
+        queue.start(lambda session: None)
+        queue.submit_ratios(CORP_CODE, "삼성전자", "2023")
+        await persist.started.wait()
+        queue.submit_metrics_snapshot(CORP_CODE, _metrics())
+        monkeypatch.setattr(asyncio, "sleep", no_backoff)
+        persist.release.set()
+        for _ in range(100):
+            if persist.persisted:
+                break
+            await real_sleep(0.01)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    # 재시도된 재무비율 작업이 스냅샷을 함께 저장
+    assert len(persist.persisted) == 1
+    assert persist.persisted[0]["attempt"] == 1
+    assert persist.persisted[0]["response"]["companyName"] == "삼성전자"
+
+
+def test_statements_are_saved_under_ingest_lock(monkeypatch, tmp_path):
+    pending = WriteBehindQueue(spill_path=str(tmp_path / "spill.jsonl"), max_queued=10, workers=1, max_attempts=3)
+    monkeypatch.setattr(fss_module, "write_behind_queue", pending)
+    monkeypatch.setattr(fss_module.settings, "WRITE_BEHIND_ENABLED", True)
+    events = []
+
+    async def lock(db_session, corp_code):
+        events.append("lock")
+
+    async def no_rows(db_session, corp_code, year=None, recent_years=None):
+        return []
+
+    monkeypatch.setattr(fss_module.ingestion_single_flight, "lock", lock)
+    monkeypatch.setattr(fss_module, "fetch_financials", no_rows)
+
+    async def fetch_financial_statements(corp_code, year):
+        return [{**_statement("2023", "자산총계", 1), "rcept_no": "20240301000001", "reprt_code": "11011"}]
+
+    service = FinancialStatementService(
+        SimpleNamespace(info={}),
+        dart_api=SimpleNamespace(fetch_financial_statements=fetch_financial_statements),
+        data_processor=FinancialDataProcessor(),
+        company_info_service=SimpleNamespace(),
+        ratio_service=SimpleNamespace()
+    )
+
+    async def save_statements(corp_code, statement_data):
+        events.append("save")
+
+    monkeypatch.setattr(service, "_save_statements", save_statements)
+    company_info = SimpleNamespace(corp_code=CORP_CODE, corp_name="삼성전자", stock_code="005930")
+
+    result = asyncio.run(service.fetch_and_save_financial_data("삼성전자", 2023, company_info))
+
+    # 지연 저장을 켜도 재무제표는 잠금을 잡은 요청 트랜잭션에서 저장하고, 재무비율 계산만 미룸
+    assert result["status"] == "success"
+    assert events == ["lock", "save"]
+    assert [(row["bsns_year"], row["account_nm"]) for row in result["data"]] == [("2023", "자산총계")]
+    queued = pending._queue.get_nowait()
+    assert (queued["kind"], queued["bsns_year"]) == (KIND_RATIOS, "2023")